@@ -93,6 +93,43 @@ class AssetManagementPreferences(AddonPreferences):
         default=""
     )
     
+    # Publishing
+    publish_copy_workers: IntProperty(
+        name="Copy Threads",
+        description="Number of files copied in parallel during publish (higher helps on network shares)",
+        default=4,
+        min=1,
+        max=32
+    )
+    
+    publish_library_workers: IntProperty(
+        name="Library Threads",
+        description="Number of linked libraries published in parallel",
+        default=4,
+        min=1,
+        max=16
+    )
+    
+    publish_fsync_policy: EnumProperty(
+        name="Safe Publish Sync",
+        description="How hard Safe Publish (staging) pushes files to disk before promoting them",
+        items=[
+            ('NONE', "None", "Rely on the OS to flush files (fastest)"),
+            ('FILES', "Files", "fsync every staged file before promote"),
+            ('FULL', "Files + Folders", "fsync files and the folders they are renamed into (safest)"),
+        ],
+        default='FILES'
+    )
+    
+    # Texture Processing
+    texture_workers: IntProperty(
+        name="Texture Processes",
+        description="Number of worker processes used to resample textures (Downgrade Resolution)",
+        default=4,
+        min=1,
+        max=32
+    )
+    
     # Validation Thresholds
     check_texture_resolution: BoolProperty(
         name="Check Texture Resolution",
@@ -112,6 +149,30 @@ class AssetManagementPreferences(AddonPreferences):
         default='4096'
     )
     
+    check_texture_memory: BoolProperty(
+        name="Check Texture Memory",
+        description="Show warning if estimated texture memory exceeds the budget during validation",
+        default=True
+    )
+    
+    texture_memory_target: EnumProperty(
+        name="Memory Budget For",
+        description="Which memory estimate is checked against the budget",
+        items=[
+            ('GPU', "GPU (VRAM)", "Viewport/render textures including mipmaps"),
+            ('CPU', "CPU (RAM)", "Decoded image buffers")
+        ],
+        default='GPU'
+    )
+    
+    texture_memory_budget: IntProperty(
+        name="Texture Memory Budget (MB)",
+        description="Maximum estimated texture memory before validation warns",
+        default=1024,
+        min=16,
+        max=65536
+    )
+    
     # Validation Checks
     check_transform_issues: BoolProperty(
         name="Check Transform Issues",
@@ -144,6 +205,17 @@ class AssetManagementPreferences(AddonPreferences):
         default=False
     )
     
+    analysis_export_format: EnumProperty(
+        name="Structured Export",
+        description="Also stream the analysis as machine-readable records to /reports (timestamped, for automation and Compare Analysis Reports)",
+        items=[
+            ('NONE', "None", "Text reports only"),
+            ('JSONL', "JSON Lines", "One JSON record per line (.jsonl)"),
+            ('CSV', "CSV", "Comma-separated values (.csv)"),
+        ],
+        default='NONE'
+    )
+    
     # Activity Logging
     enable_activity_logging: BoolProperty(
         name="Enable Activity Logging",
@@ -180,6 +252,18 @@ class AssetManagementPreferences(AddonPreferences):
         col = box.column(align=True)
         col.prop(self, "default_publish_path")
         
+        box = layout.box()
+        box.label(text="Publishing", icon='PACKAGE')
+        col = box.column(align=True)
+        col.prop(self, "publish_copy_workers")
+        col.prop(self, "publish_library_workers")
+        col.prop(self, "publish_fsync_policy")
+        
+        box = layout.box()
+        box.label(text="Texture Processing", icon='IMAGE_DATA')
+        col = box.column(align=True)
+        col.prop(self, "texture_workers")
+        
         box = layout.box()
         box.label(text="Validation Settings", icon='CHECKMARK')
         
@@ -191,6 +275,12 @@ class AssetManagementPreferences(AddonPreferences):
         if self.check_texture_resolution:
             col.prop(self, "max_texture_resolution")
         
+        col.prop(self, "check_texture_memory")
+        
+        if self.check_texture_memory:
+            col.prop(self, "texture_memory_target")
+            col.prop(self, "texture_memory_budget")
+        
         col.separator()
         col.label(text="Enable Checks:", icon='SOLO_ON')
         col.prop(self, "check_transform_issues")
@@ -214,6 +304,15 @@ class AssetManagementPreferences(AddonPreferences):
             info_col.label(text="  • Scene_TexturePaths.txt", icon='BLANK1')
             info_col.label(text="Format: Plain Text (.txt), Always overwrite", icon='BLANK1')
         
+        col = box.column(align=True)
+        col.prop(self, "analysis_export_format")
+        
+        if self.analysis_export_format != 'NONE':
+            info_col = box.column(align=True)
+            info_col.scale_y = 0.8
+            info_col.label(text="Records of materials, textures, libraries and orphans", icon='INFO')
+            info_col.label(text="  //reports/Scene_Analysis_<date>_<time>", icon='BLANK1')
+        
         box = layout.box()
         box.label(text="Activity Tracking", icon='FILE_TEXT')
         col = box.column(align=True)
@@ -284,6 +383,8 @@ def reset_publish_validation_on_load(dummy):
         scene.publish_library_count = 0
         scene.publish_library_errors = 0
         scene.publish_library_warnings = 0
+        scene.publish_in_progress = False
+        scene.publish_cancel_requested = False
         
         # Clear library selection list
         scene.publish_library_selection.clear()
@@ -343,6 +444,12 @@ def register():
     
     if reset_publish_validation_on_load not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(reset_publish_validation_on_load)
+    
+    from .utils.scene_index import scene_index_depsgraph_update, scene_index_load_post
+    if scene_index_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(scene_index_load_post)
+    if scene_index_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(scene_index_depsgraph_update)
 
 
 def unregister():
@@ -353,6 +460,12 @@ def unregister():
     if reset_publish_validation_on_load in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(reset_publish_validation_on_load)
     
+    from .utils.scene_index import scene_index_depsgraph_update, scene_index_load_post
+    if scene_index_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(scene_index_load_post)
+    if scene_index_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(scene_index_depsgraph_update)
+    
     panels.unregister()
     operators.unregister()
     
@@ -0,0 +1,406 @@
+"""
+Batch Publish - Command Line Entry Point
+
+Publish many source .blend files without opening each one by hand. A pool
+of background Blender processes works through the queue; each one opens a
+source file, runs Check Publish and Publish (the same operators as the
+panel) and reports back. The result is a JSON summary with per-asset status
+and timings.
+
+Usage:
+    blender -b --python batch_publish.py -- --publish-root /mnt/publish \\
+        --workers 4 "/projects/show/assets/**/*.blend"
+
+    blender -b --python batch_publish.py -- --publish-root /mnt/publish \\
+        --list assets_to_publish.txt --versioning --summary milestone_03.json
+
+Options (after '--'):
+    SOURCES               .blend paths or glob patterns ('**' is recursive)
+    --list FILE           Text file with one source path or pattern per line
+    --publish-root DIR    Publish root (Scene.publish_path) - required
+    --workers N           Background Blender processes (default 2)
+    --versioning          Use Versioning mode (default: Overwrite)
+    --include-libraries   Also publish linked libraries
+    --incremental         Skip unchanged files
+    --staging             Safe Publish (stage, then promote)
+    --force               Publish despite validation warnings
+    --timeout SECONDS     Per-asset timeout (default: none)
+    --summary FILE        Summary JSON (default: <publish-root>/.batch_publish_<stamp>.json)
+    --blender PATH        Blender executable for workers (default: this Blender)
+
+The script can also be run with a plain Python interpreter if --blender is
+given. Exit code is 0 if every asset published, 1 otherwise.
+
+Author: Rizqi Alfajri
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_PACKAGE = os.path.basename(ADDON_DIR)
+
+STATUS_SUCCESS = "SUCCESS"
+STATUS_FAILED = "FAILED"
+STATUS_SKIPPED = "SKIPPED"
+STATUS_TIMEOUT = "TIMEOUT"
+
+OUTPUT_TAIL_LINES = 30
+
+
+# =============================================================================
+# ARGUMENTS
+# =============================================================================
+
+def get_script_args():
+    """Arguments after '--' (Blender keeps its own arguments before it)"""
+    if '--' in sys.argv:
+        return sys.argv[sys.argv.index('--') + 1:]
+    return sys.argv[1:] if bpy is None else []
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="blender -b --python batch_publish.py --",
+        description="Publish many source .blend files with background Blender workers"
+    )
+    parser.add_argument('sources', nargs='*', help=".blend paths or glob patterns")
+    parser.add_argument('--list', dest='list_file', help="Text file with one source per line")
+    parser.add_argument('--publish-root', required=True, help="Publish root folder")
+    parser.add_argument('--workers', type=int, default=2, help="Background Blender processes")
+    parser.add_argument('--versioning', action='store_true', help="Versioning mode instead of Overwrite")
+    parser.add_argument('--include-libraries', action='store_true', help="Publish linked libraries")
+    parser.add_argument('--incremental', action='store_true', help="Skip unchanged files")
+    parser.add_argument('--staging', action='store_true', help="Safe Publish (staging folder)")
+    parser.add_argument('--force', action='store_true', help="Publish despite validation warnings")
+    parser.add_argument('--timeout', type=float, default=None, help="Per-asset timeout in seconds")
+    parser.add_argument('--summary', help="Summary JSON path")
+    parser.add_argument('--blender', help="Blender executable for workers")
+
+    # Internal: set by the coordinator when it starts a worker
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+
+    return parser.parse_args(argv)
+
+
+def collect_sources(args):
+    """Expand paths, glob patterns and --list entries into unique .blend paths"""
+    patterns = list(args.sources)
+
+    if args.list_file:
+        with open(args.list_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    patterns.append(line)
+
+    publish_root = os.path.normcase(os.path.abspath(args.publish_root))
+    sources = []
+    seen = set()
+
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern]
+
+        for path in matches:
+            if not path.lower().endswith('.blend'):
+                continue
+            path = os.path.abspath(path)
+            key = os.path.normcase(path)
+            if key in seen:
+                continue
+            # Never republish files that live in the publish root
+            if key.startswith(publish_root + os.sep):
+                continue
+            seen.add(key)
+            sources.append(path)
+
+    return sources
+
+
+# =============================================================================
+# COORDINATOR
+# =============================================================================
+
+def get_blender_executable(args):
+    if args.blender:
+        return args.blender
+    if bpy is not None and bpy.app.binary_path:
+        return bpy.app.binary_path
+    raise SystemExit("No Blender executable: run inside Blender or pass --blender")
+
+
+def build_worker_command(blender, source, args, result_path):
+    command = [
+        blender, '-b', source,
+        '--python', os.path.abspath(__file__),
+        '--',
+        '--worker',
+        '--result', result_path,
+        '--publish-root', args.publish_root,
+    ]
+    for flag in ('versioning', 'include_libraries', 'incremental', 'staging', 'force'):
+        if getattr(args, flag):
+            command.append('--' + flag.replace('_', '-'))
+    return command
+
+
+def run_worker(blender, source, args):
+    """Publish one source in its own background Blender; returns its result dict"""
+    fd, result_path = tempfile.mkstemp(prefix="batch_publish_", suffix=".json")
+    os.close(fd)
+
+    start = time.perf_counter()
+    result = {
+        'source': source,
+        'status': STATUS_FAILED,
+        'published_path': "",
+        'error': "",
+    }
+
+    try:
+        process = subprocess.run(
+            build_worker_command(blender, source, args, result_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            timeout=args.timeout,
+        )
+        output = process.stdout.decode('utf-8', errors='replace')
+        result['returncode'] = process.returncode
+
+        try:
+            with open(result_path, 'r', encoding='utf-8') as f:
+                result.update(json.load(f))
+        except (OSError, ValueError):
+            result['error'] = f"Worker exited with code {process.returncode} without a result"
+
+        if result['status'] != STATUS_SUCCESS:
+            result['output_tail'] = output.splitlines()[-OUTPUT_TAIL_LINES:]
+
+    except subprocess.TimeoutExpired:
+        result['status'] = STATUS_TIMEOUT
+        result['error'] = f"No result after {args.timeout:.0f}s"
+    except OSError as e:
+        result['error'] = f"Cannot start Blender: {e}"
+    finally:
+        try:
+            os.remove(result_path)
+        except OSError:
+            pass
+
+    result['seconds'] = round(time.perf_counter() - start, 2)
+    return result
+
+
+def run_batch(args):
+    sources = collect_sources(args)
+    if not sources:
+        print("Batch publish: no source .blend files found")
+        return 1
+
+    blender = get_blender_executable(args)
+    workers = max(1, min(args.workers, len(sources)))
+    started = datetime.now()
+    start = time.perf_counter()
+
+    print(f"Batch publish: {len(sources)} assets, {workers} workers -> {args.publish_root}")
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_worker, blender, source, args): source for source in sources}
+        for done_count, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results[futures[future]] = result
+            detail = result['published_path'] or result['error']
+            print(f"[{done_count}/{len(sources)}] {result['status']:<8} {result['seconds']:>7.1f}s  "
+                  f"{os.path.basename(result['source'])}  {detail}")
+
+    assets = [results[source] for source in sources]
+    counts = {}
+    for result in assets:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+
+    summary = {
+        'publish_root': os.path.abspath(args.publish_root),
+        'started': started.isoformat(timespec='seconds'),
+        'finished': datetime.now().isoformat(timespec='seconds'),
+        'total_seconds': round(time.perf_counter() - start, 2),
+        'workers': workers,
+        'options': {
+            'mode': 'VERSIONING' if args.versioning else 'OVERWRITE',
+            'include_libraries': args.include_libraries,
+            'incremental': args.incremental,
+            'staging': args.staging,
+            'force': args.force,
+        },
+        'counts': counts,
+        'assets': assets,
+    }
+
+    summary_path = args.summary or os.path.join(
+        args.publish_root, f".batch_publish_{started.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(summary_path)), exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"Batch publish finished in {summary['total_seconds']:.1f}s: "
+          + ", ".join(f"{count} {status.lower()}" for status, count in sorted(counts.items())))
+    print(f"Summary: {summary_path}")
+
+    return 0 if counts.get(STATUS_SUCCESS, 0) == len(assets) else 1
+
+
+# =============================================================================
+# WORKER (runs inside background Blender with the source file open)
+# =============================================================================
+
+def ensure_addon_loaded():
+    """Register the addon in this Blender session if the user prefs did not"""
+    if hasattr(bpy.types.Scene, 'publish_path'):
+        return
+
+    import addon_utils
+    if addon_utils.enable(ADDON_PACKAGE, default_set=False) and hasattr(bpy.types.Scene, 'publish_path'):
+        return
+
+    # Not on an addon path (e.g. run from a checkout) - import it directly
+    import importlib
+    sys.path.insert(0, os.path.dirname(ADDON_DIR))
+    importlib.import_module(ADDON_PACKAGE).register()
+
+
+_publish_registry = None
+
+
+def load_publish_registry():
+    """utils/publish_registry.py loaded once from its file (it has no addon imports)"""
+    global _publish_registry
+    if _publish_registry is None:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(
+            "_batch_publish_registry", os.path.join(ADDON_DIR, "utils", "publish_registry.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _publish_registry = module
+    return _publish_registry
+
+
+def read_new_log_entry(log_file, offset, source_path):
+    """Find this worker's PUBLISH line among log lines appended after offset"""
+    parse_log_line = load_publish_registry().parse_log_line
+
+    try:
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            lines = f.read().decode('utf-8', errors='replace').splitlines()
+    except OSError:
+        return None, None
+
+    source_key = os.path.normcase(os.path.abspath(source_path))
+    for line in reversed(lines):
+        if '] PUBLISH |' not in line:
+            continue
+        entry = parse_log_line(line)
+        if entry and os.path.normcase(os.path.abspath(entry['source'])) == source_key:
+            return entry['path'], entry['status']
+    return None, None
+
+
+def run_worker_publish(args):
+    """Check and publish the file Blender was started with; writes the result JSON"""
+    result = {'status': STATUS_FAILED, 'published_path': "", 'error': "", 'timings': {}}
+    source = bpy.data.filepath
+
+    try:
+        if not source:
+            raise RuntimeError("Worker started without a .blend file")
+
+        ensure_addon_loaded()
+        scene = bpy.context.scene
+
+        scene.publish_path = os.path.abspath(args.publish_root)
+        scene.publish_versioning_mode = 'VERSIONING' if args.versioning else 'OVERWRITE'
+        scene.publish_incremental = args.incremental
+        scene.publish_use_staging = args.staging
+        scene.publish_force = args.force
+        scene.publish_include_libraries = args.include_libraries
+        os.makedirs(scene.publish_path, exist_ok=True)
+
+        stage_start = time.perf_counter()
+        bpy.ops.asset.check_publish()
+        if args.include_libraries:
+            bpy.ops.asset.validate_libraries()
+        result['timings']['check_seconds'] = round(time.perf_counter() - stage_start, 3)
+
+        if scene.publish_is_published_file:
+            result['status'] = STATUS_SKIPPED
+            result['error'] = "Source is a published file"
+            return result
+
+        if scene.publish_has_errors:
+            raise RuntimeError("Check Publish reported critical errors")
+
+        log_file = os.path.join(scene.publish_path, ".publish_activity.log")
+        try:
+            log_offset = os.path.getsize(log_file)
+        except OSError:
+            log_offset = 0
+
+        stage_start = time.perf_counter()
+        outcome = bpy.ops.asset.publish('EXEC_DEFAULT')
+        result['timings']['publish_seconds'] = round(time.perf_counter() - stage_start, 3)
+
+        published_path, log_status = read_new_log_entry(log_file, log_offset, source)
+        result['published_path'] = published_path or ""
+        result['log_status'] = log_status or ""
+
+        if 'FINISHED' in outcome:
+            result['status'] = STATUS_SUCCESS
+        else:
+            result['error'] = log_status or "Publish cancelled (validation errors?)"
+
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        with open(args.result, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    return result
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+def main():
+    args = parse_args(get_script_args())
+
+    if args.worker:
+        result = run_worker_publish(args)
+        return 0 if result['status'] == STATUS_SUCCESS else 1
+
+    return run_batch(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
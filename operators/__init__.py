@@ -20,12 +20,14 @@ from . import (
     check_highpoly,
     check_transform,
     auto_correct_maps,
+    pack_orm,
     downgrade_resolution,
     convert_image_format,
     consolidate_textures,
     cleanup_unused_textures,
     restore_image_format,
     restore_resolution,
+    texture_lod,
     versioning,
     check_scene,
     clear_orphan_data,
@@ -42,12 +44,14 @@ modules = [
     check_highpoly,
     check_transform,
     auto_correct_maps,
+    pack_orm,
     downgrade_resolution,
     convert_image_format,
     consolidate_textures,
     cleanup_unused_textures,
     restore_image_format,
     restore_resolution,
+    texture_lod,
     versioning,
     copy_log_path,
     check_scene,
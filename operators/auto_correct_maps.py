@@ -48,37 +48,43 @@ class TEXTURE_OT_AutoCorrectMaps(bpy.types.Operator):
         ],
     }
 
-    def execute(self, context):
-        corrected = 0
-        skipped = 0
-
+    @classmethod
+    def find_map_part(cls, name):
+        """
+        Find the map type token in an image name.
+
+        Returns:
+            tuple: (name parts split on '_', index of the token or -1, SOP map name or None)
+        """
         synonym_to_sop = {}
-        for sop_name, synonyms in self.SOP_MAPS.items():
+        for sop_name, synonyms in cls.SOP_MAPS.items():
             for synonym in synonyms:
                 synonym_to_sop[synonym.lower()] = sop_name
 
+        name_without_ext = os.path.splitext(name)[0]
+        parts = name_without_ext.split('_')
+
+        if len(parts) < 2:
+            return parts, -1, None
+
+        for i, part in enumerate(parts):
+            normalized = part.lower().strip()
+            if normalized in synonym_to_sop:
+                return parts, i, synonym_to_sop[normalized]
+
+        return parts, -1, None
+
+    def execute(self, context):
+        corrected = 0
+        skipped = 0
+
         for img in bpy.data.images:
             if img.source != 'FILE' or img.library:
                 skipped += 1
                 continue
 
             original_name = img.name
-            name_without_ext = os.path.splitext(original_name)[0]
-            parts = name_without_ext.split('_')
-
-            if len(parts) < 2:
-                skipped += 1
-                continue
-
-            map_index = -1
-            sop_name = None
-
-            for i, part in enumerate(parts):
-                normalized = part.lower().strip()
-                if normalized in synonym_to_sop:
-                    map_index = i
-                    sop_name = synonym_to_sop[normalized]
-                    break
+            parts, map_index, sop_name = self.find_map_part(original_name)
 
             if map_index >= 0:
                 parts[map_index] = sop_name
@@ -9,20 +9,37 @@ class ASSET_OT_check_highpoly(bpy.types.Operator):
 
     BACKGROUND_COLOR = (0.302, 0.282, 0.157)
 
-    def get_tris_count(self, obj, use_modifiers=True):
+    @staticmethod
+    def count_mesh_tris(mesh):
+        """Triangles of a mesh: an n-gon has n - 2, and every loop belongs to one polygon"""
+        return len(mesh.loops) - 2 * len(mesh.polygons)
+
+    def get_tris_count(self, obj, depsgraph=None, mesh_tris=None):
+        """
+        Triangle count of a mesh object.
+        
+        Args:
+            obj: Object to count
+            depsgraph: Evaluated depsgraph to count with modifiers (None: base mesh)
+            mesh_tris: {mesh name: tris} kept for one run, so meshes shared by
+                several objects without modifiers are counted once
+        """
         if obj.type != 'MESH':
             return 0
 
-        if use_modifiers:
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-            eval_obj = obj.evaluated_get(depsgraph)
-            mesh = eval_obj.to_mesh()
-            tris = sum(len(p.vertices) - 2 for p in mesh.polygons)
-            eval_obj.to_mesh_clear()
+        # Modifiers make the evaluated mesh unique to the object
+        key = obj.data.name_full if depsgraph is None or not obj.modifiers else None
+        if key is not None and mesh_tris is not None and key in mesh_tris:
+            return mesh_tris[key]
+
+        if depsgraph is not None:
+            # Evaluated data is the modified mesh - no to_mesh() copy needed
+            tris = self.count_mesh_tris(obj.evaluated_get(depsgraph).data)
         else:
-            mesh = obj.data
-            tris = sum(len(p.vertices) - 2 for p in mesh.polygons)
+            tris = self.count_mesh_tris(obj.data)
 
+        if key is not None and mesh_tris is not None:
+            mesh_tris[key] = tris
         return tris
 
     def execute(self, context):
@@ -64,9 +81,12 @@ class ASSET_OT_check_highpoly(bpy.types.Operator):
         objects_to_check = [obj for obj in context.view_layer.objects if obj.type == 'MESH']
         hidden_count = len([obj for obj in context.scene.objects if obj.type == 'MESH']) - len(objects_to_check)
 
+        depsgraph = context.evaluated_depsgraph_get() if context.scene.highpoly_use_modifiers else None
+        mesh_tris = {}
+
         high_poly_count = 0
         for obj in objects_to_check:
-            tris = self.get_tris_count(obj, context.scene.highpoly_use_modifiers)
+            tris = self.get_tris_count(obj, depsgraph, mesh_tris)
             if tris > context.scene.highpoly_threshold:
                 obj["_high_poly"] = True
                 obj["_tris_count"] = tris
@@ -2,7 +2,44 @@ import bpy
 import os
 
 
+# Top consumers kept per owner type for the panel
+TEXTURE_MEMORY_TOP_COUNT = 3
+
+
+class TextureMemoryItem(bpy.types.PropertyGroup):
+    """Texture memory of one material, object or collection"""
+    name: bpy.props.StringProperty(name="Name")
+    kind: bpy.props.StringProperty(name="Kind")
+    gpu_mb: bpy.props.FloatProperty(name="GPU Memory (MB)")
+    cpu_mb: bpy.props.FloatProperty(name="CPU Memory (MB)")
+
+
 # Helper Functions - Linked Libraries Validation
+def scan_nested_libraries(context, current_file):
+    """
+    Find libraries linked by linked libraries (up to 3 levels deep)
+    
+    Returns:
+        tuple: ({normcase(path): (depth, path)}, set of normcase paths in a dependency cycle)
+    """
+    from .publish import CircularDependencyError, LinkedLibraryScanner
+    
+    scanner = LinkedLibraryScanner(context.scene.publish_path or os.path.dirname(current_file))
+    cycle_paths = set()
+    
+    try:
+        scanner.scan_recursive(current_file)
+    except CircularDependencyError as e:
+        print(f"Library validation: {e}")
+        cycle_paths = set(e.chain)
+    
+    depths = {
+        os.path.normcase(info['absolute']): (info['depth'], info['absolute'])
+        for info in scanner.libraries
+    }
+    return depths, cycle_paths
+
+
 def quick_validate_linked_libraries(context):
     """Quick validation for linked libraries without publish_path requirement"""
     context.scene.publish_library_selection.clear()
@@ -40,14 +77,32 @@ def quick_validate_linked_libraries(context):
         print(f"Current file: {current_file_normalized}")
         print(f"Current drive: {current_drive}")
         
+        library_entries = []
         for lib in libraries:
             abs_path = bpy.path.abspath(lib.filepath)
-            normalized_path = os.path.abspath(os.path.normpath(abs_path))
-            lib_abs_paths[lib.name] = normalized_path
+            library_entries.append((lib.name, os.path.abspath(os.path.normpath(abs_path))))
+        
+        # Nested (link-in-link) libraries from LI blocks - no file is opened
+        nested_depths, cycle_paths = scan_nested_libraries(context, current_file_normalized)
+        known_paths = {os.path.normcase(path) for _, path in library_entries}
+        used_names = {name for name, _ in library_entries}
+        for lib_key, (depth, lib_path) in nested_depths.items():
+            if lib_key in known_paths:
+                continue
+            lib_name = os.path.basename(lib_path)
+            if lib_name in used_names:
+                lib_name = f"{os.path.basename(os.path.dirname(lib_path))}/{lib_name}"
+            library_entries.append((lib_name, lib_path))
+            known_paths.add(lib_key)
+            used_names.add(lib_name)
+        total_count = len(library_entries)
+        
+        for lib_name, normalized_path in library_entries:
+            lib_abs_paths[lib_name] = normalized_path
             
             lib_drive = os.path.splitdrive(normalized_path)[0]
             
-            print(f"Library: {lib.name}")
+            print(f"Library: {lib_name}")
             print(f"  Path: {normalized_path}")
             print(f"  Drive: {lib_drive}")
             
@@ -55,7 +110,7 @@ def quick_validate_linked_libraries(context):
                 internal_lib_paths.append(normalized_path)
                 print(f"  → Internal (same drive)")
             else:
-                external_libs.append(lib.name)
+                external_libs.append(lib_name)
                 print(f"  → External (different drive: {lib_drive} vs {current_drive})")
         
         common_root = None
@@ -71,11 +126,11 @@ def quick_validate_linked_libraries(context):
             print(f"\nNo internal libraries, using current directory as root: {common_root}")
         
         # Validate each library
-        for lib in libraries:
+        for lib_name, _ in library_entries:
             item = context.scene.publish_library_selection.add()
-            item.name = lib.name
+            item.name = lib_name
             
-            lib_filepath = lib_abs_paths[lib.name]
+            lib_filepath = lib_abs_paths[lib_name]
             item.filepath = lib_filepath
             
             if lib_filepath:
@@ -86,7 +141,7 @@ def quick_validate_linked_libraries(context):
             warnings = []
             is_external = False
             
-            if lib.name in external_libs:
+            if lib_name in external_libs:
                 parent_folder = os.path.basename(os.path.dirname(lib_filepath))
                 is_external = True
                 warnings.append(f"External library (different drive, will copy to _external/{parent_folder}/)")
@@ -103,7 +158,12 @@ def quick_validate_linked_libraries(context):
                 structure = os.path.dirname(rel_path)
                 item.structure = structure
             
-            item.depth = 1
+            lib_key = os.path.normcase(lib_filepath)
+            item.depth = nested_depths.get(lib_key, (1, None))[0]
+            
+            if lib_key in cycle_paths:
+                errors.append("Circular dependency")
+                error_count += 1
             
             # File validation checks
             if not os.path.exists(lib_filepath):
@@ -191,6 +251,9 @@ class ASSET_OT_CheckPublish(bpy.types.Operator):
         external_count = 0
         missing_count = 0
         packed_count = 0
+        lod_count = 0
+        
+        from ..utils.texture_lod import is_lod_path
         
         for img in bpy.data.images:
             if img.name in ('Render Result', 'Viewer Node'):
@@ -211,6 +274,10 @@ class ASSET_OT_CheckPublish(bpy.types.Operator):
                 missing_count += 1
                 continue
             
+            # Relinked by Switch LOD - publish would ship the reduced variant
+            if is_lod_path(os.path.normpath(abs_path)):
+                lod_count += 1
+            
             try:
                 if textures_exist:
                     if os.path.commonpath([abs_path, textures_dir]) != textures_dir:
@@ -223,18 +290,56 @@ class ASSET_OT_CheckPublish(bpy.types.Operator):
         try:
             prefs = context.preferences.addons[__package__.split('.')[0]].preferences
             if prefs.check_texture_resolution:
+                from ..utils.texture_utils import get_image_resolution, get_project_texture_cache
                 max_res = int(prefs.max_texture_resolution)
+                cache = get_project_texture_cache()
                 
                 for img in bpy.data.images:
                     if img.name in ('Render Result', 'Viewer Node'):
                         continue
                     if img.source != 'FILE':
                         continue
-                    if img.size[0] > max_res or img.size[1] > max_res:
+                    # Header probe - img.size would decode unloaded images
+                    width, height = get_image_resolution(img, cache)
+                    if width > max_res or height > max_res:
                         large_texture_count += 1
+                cache.save()
         except Exception:
             pass
         
+        # Check texture memory budget (if enabled)
+        memory_over_budget = False
+        context.scene.publish_texture_memory_top.clear()
+        context.scene.publish_texture_memory_gpu = 0.0
+        context.scene.publish_texture_memory_cpu = 0.0
+        context.scene.publish_texture_memory_budget = 0.0
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            if prefs.check_texture_memory:
+                from ..utils.texture_memory import top_consumers
+                from ..utils.texture_utils import collect_texture_memory, get_project_texture_cache
+                mb = 1024.0 * 1024.0
+                cache = get_project_texture_cache()
+                memory = collect_texture_memory(cache)
+                cache.save()
+                
+                total = memory['total']
+                context.scene.publish_texture_memory_gpu = total.gpu / mb
+                context.scene.publish_texture_memory_cpu = total.cpu / mb
+                context.scene.publish_texture_memory_budget = prefs.texture_memory_budget
+                budgeted = total.gpu if prefs.texture_memory_target == 'GPU' else total.cpu
+                memory_over_budget = budgeted / mb > prefs.texture_memory_budget
+                
+                for kind, key in (('COLLECTION', 'collections'), ('OBJECT', 'objects'), ('MATERIAL', 'materials')):
+                    for name, owner_memory in top_consumers(memory[key], TEXTURE_MEMORY_TOP_COUNT):
+                        item = context.scene.publish_texture_memory_top.add()
+                        item.name = name
+                        item.kind = kind
+                        item.gpu_mb = owner_memory.gpu / mb
+                        item.cpu_mb = owner_memory.cpu / mb
+        except Exception as e:
+            print(f"Texture memory check failed: {e}")
+        
         # Additional validation checks
         # Check transform issues (if enabled)
         transform_issue_count = 0
@@ -321,6 +426,7 @@ class ASSET_OT_CheckPublish(bpy.types.Operator):
         
         context.scene.publish_check_done = True
         context.scene.publish_large_texture_count = large_texture_count
+        context.scene.publish_texture_memory_over_budget = memory_over_budget
         context.scene.publish_transform_issue_count = transform_issue_count
         context.scene.publish_empty_slots_count = empty_slots_count
         context.scene.publish_duplicate_texture_count = duplicate_texture_count
@@ -332,6 +438,7 @@ class ASSET_OT_CheckPublish(bpy.types.Operator):
         context.scene.publish_external_count = external_count
         context.scene.publish_missing_count = missing_count
         context.scene.publish_packed_count = packed_count
+        context.scene.publish_lod_texture_count = lod_count
         
         has_critical_errors = (not context.scene.publish_path)
         
@@ -339,6 +446,8 @@ class ASSET_OT_CheckPublish(bpy.types.Operator):
                        external_count > 0 or 
                        missing_count > 0 or
                        packed_count > 0 or 
+                       lod_count > 0 or
+                       memory_over_budget or
                        transform_issue_count > 0 or
                        empty_slots_count > 0 or
                        duplicate_texture_count > 0 or
@@ -379,6 +488,7 @@ class ASSET_OT_ValidateLibraries(bpy.types.Operator):
 
 
 def register():
+    bpy.utils.register_class(TextureMemoryItem)
     bpy.utils.register_class(ASSET_OT_CheckPublish)
     bpy.utils.register_class(ASSET_OT_ValidateLibraries)
     
@@ -390,11 +500,18 @@ def register():
     bpy.types.Scene.publish_external_count = bpy.props.IntProperty(default=0)
     bpy.types.Scene.publish_missing_count = bpy.props.IntProperty(default=0)
     bpy.types.Scene.publish_packed_count = bpy.props.IntProperty(default=0)
+    bpy.types.Scene.publish_lod_texture_count = bpy.props.IntProperty(default=0)
     bpy.types.Scene.publish_orphan_count = bpy.props.IntProperty(default=0)
     bpy.types.Scene.publish_has_errors = bpy.props.BoolProperty(default=False)
     bpy.types.Scene.publish_has_warnings = bpy.props.BoolProperty(default=False)
     bpy.types.Scene.publish_is_ready = bpy.props.BoolProperty(default=False)
     
+    bpy.types.Scene.publish_texture_memory_gpu = bpy.props.FloatProperty(default=0.0)
+    bpy.types.Scene.publish_texture_memory_cpu = bpy.props.FloatProperty(default=0.0)
+    bpy.types.Scene.publish_texture_memory_budget = bpy.props.FloatProperty(default=0.0)
+    bpy.types.Scene.publish_texture_memory_over_budget = bpy.props.BoolProperty(default=False)
+    bpy.types.Scene.publish_texture_memory_top = bpy.props.CollectionProperty(type=TextureMemoryItem)
+    
     bpy.types.Scene.publish_is_published_file = bpy.props.BoolProperty(
         name="Is Published File",
         description="Current file is a published file",
@@ -409,12 +526,18 @@ def register():
 
 def unregister():
     props_to_delete = [
+        "publish_texture_memory_top",
+        "publish_texture_memory_over_budget",
+        "publish_texture_memory_budget",
+        "publish_texture_memory_cpu",
+        "publish_texture_memory_gpu",
         "publish_source_path",
         "publish_is_published_file",
         "publish_is_ready",
         "publish_has_warnings",
         "publish_has_errors",
         "publish_orphan_count",
+        "publish_lod_texture_count",
         "publish_packed_count",
         "publish_missing_count",
         "publish_external_count",
@@ -431,3 +554,4 @@ def unregister():
     
     bpy.utils.unregister_class(ASSET_OT_ValidateLibraries)
     bpy.utils.unregister_class(ASSET_OT_CheckPublish)
+    bpy.utils.unregister_class(TextureMemoryItem)
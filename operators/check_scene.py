@@ -1,8 +1,12 @@
 import bpy
-import threading
 import os
 from datetime import datetime
 
+from ..utils import scene_report
+from ..utils.copy_engine import format_bytes
+from ..utils.scene_index import build_scene_index_steps, get_scene_index
+from ..utils.texture_utils import get_project_texture_cache, normalize_udim
+
 
 class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
     """Analyze scene deeply and generate detailed reports"""
@@ -11,30 +15,54 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
     bl_description = "Generate comprehensive reports for materials, textures, and usage statistics"
     bl_options = {'REGISTER'}
 
+    # Images / materials / objects captured per timer tick while taking the snapshot
+    SNAPSHOT_CHUNK = 250
+
+    REPORTS = (
+        ("Scene_MaterialUsage", '_generate_material_usage_report'),
+        ("Scene_TextureUsage", '_generate_texture_usage_report'),
+        ("Scene_TexturePaths", '_generate_texture_paths_report'),
+    )
+
+    # Files in the textures folder counted as texture files
+    IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.tga', '.bmp', '.tiff', '.webp', '.exr', '.hdr', '.dds'}
+
     _timer = None
-    _thread = None
-    _is_running = False
+    _executor = None
+    _futures = {}
+    _unused_files = None
+    _export_format = 'NONE'
+    _export_future = None
+    _snapshot = None
+    _snapshot_steps = None
+    _cache = None
     _reports_data = {}
     _progress = 0
 
     def modal(self, context, event):
         wm = context.window_manager
-        if event.type == 'TIMER':
-            wm.progress_update(self._progress)
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
 
-            if not self._is_running and self._thread is not None:
-                wm.event_timer_remove(self._timer)
-                wm.progress_end()
+        try:
+            if self._snapshot_steps is not None:
+                # Phase 1 (main thread): capture bpy data in chunks
+                fraction = next(self._snapshot_steps, 1.0)
+                self._progress = int(50 * fraction)
+                if fraction >= 1.0:
+                    self._snapshot_steps = None
+                    self._start_workers()
+            else:
+                # Phase 2 (worker threads): format reports from the snapshot
+                finished = sum(1 for future in self._futures if future.done())
+                self._progress = 50 + int(50 * finished / len(self._futures))
+                if finished == len(self._futures):
+                    return self._finish(context)
+        except Exception as e:
+            self._reports_data = {'success': False, 'error': str(e)}
+            return self._finish(context)
 
-                if self._reports_data.get('success'):
-                    self._create_text_datablocks_main_thread()
-                    
-                    bpy.ops.scene.show_analysis_result('INVOKE_DEFAULT')
-                    
-                    return {'FINISHED'}
-                else:
-                    self.report({'ERROR'}, self._reports_data.get('error', 'Unknown error'))
-                    return {'CANCELLED'}
+        wm.progress_update(self._progress)
         return {'PASS_THROUGH'}
 
     def execute(self, context):
@@ -43,44 +71,342 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
             return {'CANCELLED'}
 
         wm = context.window_manager
-        self._timer = wm.event_timer_add(0.1, window=context.window)
+        self._timer = wm.event_timer_add(0.05, window=context.window)
         wm.modal_handler_add(self)
 
         wm.progress_begin(0, 100)
         self._progress = 0
-
-        self._is_running = True
         self._reports_data = {}
-        self._thread = threading.Thread(target=self._generate_reports_thread)
-        self._thread.start()
+        self._futures = {}
+        self._executor = None
+        self._cache = get_project_texture_cache()
+        self._snapshot_steps = self._capture_snapshot()
+        self._unused_files = None
+        self._export_future = None
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            self._export_format = prefs.analysis_export_format
+        except Exception:
+            self._export_format = 'NONE'
 
         return {'RUNNING_MODAL'}
-    
-    def _generate_reports_thread(self):
-        try:
-            self._progress = 10
-            tex_paths_report = self._generate_texture_paths_report()
-
-            self._progress = 40
-            material_usage_report = self._generate_material_usage_report()
-
-            self._progress = 70
-            texture_usage_report = self._generate_texture_usage_report()
-
-            self._progress = 90
-            self._reports_data = {
-                'success': True,
-                'reports': [
-                    {'name': "Scene_MaterialUsage", 'content': material_usage_report},
-                    {'name': "Scene_TextureUsage", 'content': texture_usage_report},
-                    {'name': "Scene_TexturePaths", 'content': tex_paths_report}
-                ]
+
+    def cancel(self, context):
+        """Called by Blender when the modal is aborted (e.g. file load)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+            context.window_manager.progress_end()
+
+    def _capture_snapshot(self):
+        """
+        Copy everything the reports need into plain Python data (main thread).
+        
+        Generator - each step builds a chunk of the scene index or captures
+        a chunk of materials/objects and yields the done fraction, so the UI
+        stays responsive on big scenes. Restarts if datablocks are added or
+        removed between chunks.
+        """
+        while True:
+            # Scene index: first half of the snapshot progress
+            for fraction in build_scene_index_steps(self.SNAPSHOT_CHUNK):
+                yield 0.5 * fraction
+            index = get_scene_index()
+
+            materials = bpy.data.materials
+            objects = bpy.data.objects
+            total_materials = len(materials)
+            total_objects = len(objects)
+            total = max(total_materials + total_objects, 1)
+
+            snapshot = {
+                'blend_path': bpy.data.filepath,
+                'blend_dir': os.path.dirname(bpy.data.filepath),
+                # Image records are already in the index - no second pass over bpy.data.images
+                'images': [self._capture_image(record) for record in index.images.values()],
+                'materials': [],
+                'material_usage': {name: list(objects) for name, objects in index.material_objects.items() if objects},
+                'texture_usage': {name: list(materials) for name, materials in index.image_materials.items() if materials},
+                'used_files': index.get_used_texture_paths(include_library=True),
+                'library_datablocks': {
+                    lib_path: {type_name: list(names) for type_name, names in datablocks.items()}
+                    for lib_path, datablocks in index.library_datablocks.items()
+                },
+                'mesh_object_count': 0,
+                'libraries': [lib.filepath for lib in bpy.data.libraries],
+                'unused_libraries': list(index.unused_libraries),
+                'orphans': {label: list(names) for label, names in index.orphans.items()},
             }
-            self._progress = 100
+
+            restarted = False
+            for chunk_start in range(0, total_materials, self.SNAPSHOT_CHUNK):
+                if len(materials) != total_materials:
+                    restarted = True
+                    break
+                for position in range(chunk_start, min(chunk_start + self.SNAPSHOT_CHUNK, total_materials)):
+                    mat = materials[position]
+                    snapshot['materials'].append({
+                        'name': mat.name,
+                        'name_full': mat.name_full,
+                        'library': mat.library.filepath if mat.library else None,
+                    })
+                yield 0.5 + 0.5 * len(snapshot['materials']) / total
+
+            for chunk_start in range(0, total_objects, self.SNAPSHOT_CHUNK):
+                if restarted or len(objects) != total_objects:
+                    restarted = True
+                    break
+                chunk_end = min(chunk_start + self.SNAPSHOT_CHUNK, total_objects)
+                snapshot['mesh_object_count'] += sum(
+                    1 for position in range(chunk_start, chunk_end) if objects[position].type == 'MESH'
+                )
+                yield 0.5 + 0.5 * (total_materials + chunk_end) / total
+
+            if not restarted:
+                self._snapshot = snapshot
+                yield 1.0
+                return
+
+    def _capture_image(self, record):
+        """Plain-data record of one indexed image"""
+        return {
+            'name': record.short_name,
+            'name_full': record.name,
+            'source': record.source,
+            'library': record.library,
+            'packed': record.packed,
+            'filepath': record.filepath,
+            'abs_path': record.abs_path,
+            'size': record.size,
+            'tiles': list(record.tiles),
+            'is_float': record.is_float,
+            'half_float': record.half_float,
+            'generated_size': record.generated_size,
+            'generated_float': record.generated_float,
+        }
+
+    def _start_workers(self):
+        """Format all reports in parallel from the snapshot"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        exporting = self._export_format != 'NONE'
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.REPORTS) + 1 + int(exporting), thread_name_prefix="scene-report"
+        )
+        # Submitted first so it always has a worker - the reports wait for it
+        self._unused_files = self._executor.submit(self._find_unused_folder_textures)
+        self._futures = {
+            self._executor.submit(getattr(self, method_name)): name
+            for name, method_name in self.REPORTS
+        }
+        if exporting:
+            self._export_future = self._executor.submit(self._export_structured_report)
+            self._futures[self._export_future] = None
+
+    def _finish(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if not self._reports_data:
+            reports = {}
+            try:
+                for future, name in self._futures.items():
+                    if name is not None:
+                        reports[name] = future.result()
+                self._reports_data = {
+                    'success': True,
+                    'reports': [{'name': name, 'content': reports[name]} for name, method_name in self.REPORTS]
+                }
+            except Exception as e:
+                self._reports_data = {'success': False, 'error': str(e)}
+
+        self._cache.save()
+        self._snapshot = None
+
+        if self._reports_data.get('success'):
+            self._create_text_datablocks_main_thread()
+            self._report_export()
+            
+            bpy.ops.scene.show_analysis_result('INVOKE_DEFAULT')
+            
+            return {'FINISHED'}
+
+        self.report({'ERROR'}, self._reports_data.get('error', 'Unknown error'))
+        return {'CANCELLED'}
+
+    def _report_export(self):
+        """Report the structured export result (export errors do not fail the analysis)"""
+        if self._export_future is None:
+            return
+        try:
+            path, count = self._export_future.result()
         except Exception as e:
-            self._reports_data = {'success': False, 'error': str(e)}
+            self.report({'WARNING'}, f"Structured report export failed: {e}")
+            return
         finally:
-            self._is_running = False
+            self._export_future = None
+        print(f"Saved structured report: {path} ({count} records)")
+        self.report({'INFO'}, f"Structured report: {os.path.basename(path)} ({count} records)")
+
+    def _find_unused_folder_textures(self):
+        """[(path, file size or None)] of image files in /textures that no image uses"""
+        snapshot = self._snapshot
+        textures_dir = os.path.join(snapshot['blend_dir'], "textures")
+        if not os.path.exists(textures_dir):
+            return []
+
+        used_files = snapshot['used_files']
+        unused = []
+        for root, dirs, files in os.walk(textures_dir):
+            if '.backup' in root:
+                continue
+            for file in files:
+                if os.path.splitext(file)[1].lower() not in self.IMAGE_EXTENSIONS:
+                    continue
+                file_path = os.path.normpath(os.path.join(root, file))
+                if normalize_udim(file_path) in used_files:
+                    continue
+                try:
+                    file_size = os.path.getsize(file_path)
+                except OSError:
+                    file_size = None
+                unused.append((file_path, file_size))
+        return unused
+
+    def _export_structured_report(self):
+        """Stream the snapshot as JSON Lines / CSV to //reports (worker thread)"""
+        reports_dir = os.path.join(self._snapshot['blend_dir'], "reports")
+        os.makedirs(reports_dir, exist_ok=True)
+        path = scene_report.get_report_path(reports_dir, self._export_format)
+        count = scene_report.write_report(path, self._iter_report_records(), self._export_format)
+        return path, count
+
+    def _iter_report_records(self):
+        """Structured report records of the snapshot (see utils.scene_report)"""
+        snapshot = self._snapshot
+        make_record = scene_report.make_record
+
+        yield scene_report.make_scene_record(snapshot['blend_path'])
+
+        for mat in snapshot['materials']:
+            objects = snapshot['material_usage'].get(mat['name_full'], [])
+            yield make_record(
+                scene_report.KIND_MATERIAL, mat['name'],
+                library=mat['library'],
+                users=len(objects),
+                used_by=objects,
+            )
+
+        for img in snapshot['images']:
+            if img['name'] in ('Render Result', 'Viewer Node') or img['source'] not in ('FILE', 'TILED', 'GENERATED'):
+                continue
+            yield self._texture_record(img)
+
+        for file_path, file_size in self._unused_files.result():
+            yield make_record(
+                scene_report.KIND_FILE, os.path.basename(file_path),
+                path=file_path,
+                status=scene_report.STATUS_UNUSED,
+                file_bytes=file_size,
+            )
+
+        unused_libraries = set(snapshot['unused_libraries'])
+        for lib_path in snapshot['libraries']:
+            datablocks = snapshot['library_datablocks'].get(lib_path, {})
+            yield make_record(
+                scene_report.KIND_LIBRARY, os.path.basename(lib_path),
+                path=lib_path,
+                status=scene_report.STATUS_UNUSED if lib_path in unused_libraries else scene_report.STATUS_USED,
+                users=sum(len(names) for names in datablocks.values()),
+                used_by=datablocks.get('collections', []),
+            )
+
+        for label, names in snapshot['orphans'].items():
+            for name in names:
+                yield make_record(scene_report.KIND_ORPHAN, name, type=label)
+
+    def _texture_record(self, image):
+        """Structured report record of one snapshot image"""
+        from ..utils.texture_memory import estimate_image_memory, is_float_image, sum_memory
+
+        materials = self._snapshot['texture_usage'].get(image['name_full'], [])
+        record = scene_report.make_record(
+            scene_report.KIND_TEXTURE, image['name'],
+            type=image['source'],
+            library=image['library'],
+            path=image['abs_path'],
+            users=len(materials),
+            used_by=materials,
+        )
+
+        if image['source'] == 'GENERATED':
+            width, height = image['generated_size']
+            memory = estimate_image_memory(width, height, image['generated_float'], image['half_float'])
+            record.update(status=scene_report.STATUS_GENERATED, width=width, height=height,
+                          gpu_bytes=memory.gpu, cpu_bytes=memory.cpu)
+            return record
+
+        paths = []
+        if image['abs_path'] and not image['packed']:
+            if image['tiles']:
+                paths = [image['abs_path'].replace('<UDIM>', str(tile)) for tile in image['tiles']]
+            else:
+                paths = [image['abs_path']]
+
+        infos = [self._cache.get_info(path) for path in paths]
+        if infos and all(info is not None for info in infos):
+            memory = sum_memory(
+                estimate_image_memory(info.width, info.height,
+                                      is_float_image(info.bit_depth, info.format), image['half_float'],
+                                      channels=info.channels)
+                for info in infos
+            )
+            file_bytes = 0
+            for path in paths:
+                try:
+                    file_bytes += os.path.getsize(path)
+                except OSError:
+                    pass
+            record.update(status=scene_report.STATUS_FOUND, width=infos[0].width, height=infos[0].height,
+                          file_bytes=file_bytes, gpu_bytes=memory.gpu, cpu_bytes=memory.cpu)
+            return record
+
+        if image['packed']:
+            record['status'] = scene_report.STATUS_PACKED
+        elif paths and any(os.path.exists(path) for path in paths):
+            record['status'] = scene_report.STATUS_FOUND
+        else:
+            record['status'] = scene_report.STATUS_MISSING
+
+        if image['size'] and image['size'][0]:
+            width, height = image['size']
+            is_float = image['is_float']
+            if is_float is None:
+                # Not loaded - take the bit depth from whatever the header probe found
+                probed = next((info for info in infos if info is not None), None)
+                is_float = is_float_image(probed.bit_depth, probed.format) if probed else False
+            memory = estimate_image_memory(width, height, is_float, image['half_float'])
+            record.update(width=width, height=height, gpu_bytes=memory.gpu, cpu_bytes=memory.cpu)
+        return record
+
+    def _format_resolution(self, image):
+        """Resolution of a snapshot image as "WxH" (header probe for unloaded images)"""
+        size = image['size']
+        if size is None and image['abs_path'] and image['source'] == 'FILE':
+            size = self._cache.get_size(image['abs_path'])
+        if not size or size[0] == 0:
+            return "Unknown"
+        return f"{size[0]}x{size[1]}"
 
     def _create_text_datablocks_main_thread(self):
         """Create text datablocks and optionally save to files"""
@@ -127,7 +453,8 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         lines.append("=" * 60)
         lines.append("")
 
-        blend_dir = os.path.dirname(bpy.data.filepath)
+        snapshot = self._snapshot
+        blend_dir = snapshot['blend_dir']
         textures_dir = os.path.join(blend_dir, "textures")
 
         found_images = []
@@ -135,28 +462,28 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         packed_images = []
         linked_library_images = {} 
 
-        for img in bpy.data.images:
-            if img.name in ('Render Result', 'Viewer Node'):
+        for img in snapshot['images']:
+            if img['name'] in ('Render Result', 'Viewer Node'):
                 continue
-            if img.source == 'GENERATED':
+            if img['source'] == 'GENERATED':
                 continue
             
-            if img.library:
-                lib_path = img.library.filepath
+            if img['library']:
+                lib_path = img['library']
                 if lib_path not in linked_library_images:
                     linked_library_images[lib_path] = []
                 
-                if img.filepath:
-                    abs_path = bpy.path.abspath(img.filepath, library=img.library)
-                    resolution = f"{img.size[0]}x{img.size[1]}" if img.size[0] > 0 else "Unknown"
+                if img['filepath']:
+                    abs_path = img['abs_path']
+                    resolution = self._format_resolution(img)
                     
-                    if img.filepath.startswith('//'):
-                        display_path = img.filepath
+                    if img['filepath'].startswith('//'):
+                        display_path = img['filepath']
                     else:
-                        display_path = abs_path if os.path.exists(abs_path) else img.filepath
+                        display_path = abs_path if os.path.exists(abs_path) else img['filepath']
                     
                     linked_library_images[lib_path].append({
-                        'name': img.name,
+                        'name': img['name'],
                         'path': display_path,
                         'resolution': resolution,
                         'exists': os.path.exists(abs_path) if abs_path else False
@@ -164,19 +491,19 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
                 continue
             
             # Check if packed
-            if img.packed_file:
-                resolution = f"{img.size[0]}x{img.size[1]}" if img.size[0] > 0 else "Unknown"
+            if img['packed']:
+                resolution = self._format_resolution(img)
                 packed_images.append({
-                    'name': img.name,
+                    'name': img['name'],
                     'resolution': resolution
                 })
                 continue
             
             # Check file path
-            if img.filepath:
-                abs_path = bpy.path.abspath(img.filepath)
-                rel_path = img.filepath
-                resolution = f"{img.size[0]}x{img.size[1]}" if img.size[0] > 0 else "Unknown"
+            if img['filepath']:
+                abs_path = img['abs_path']
+                rel_path = img['filepath']
+                resolution = self._format_resolution(img)
                 
                 if os.path.exists(abs_path):
                     if rel_path.startswith('//'):
@@ -207,82 +534,12 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
                         'abs_path': abs_path
                     })
 
-        # Helper function for UDIM normalization
-        def normalize_udim(path):
-            """Match Blender's UDIM detection: any 4-digit number in standard range (1001-1100)"""
-            import re
-            udim_pattern = r'\b(\d{4})\b'
-            match = re.search(udim_pattern, path)
-            
-            if match:
-                tile_num = int(match.group(1))
-                if 1001 <= tile_num <= 1100:
-                    return path.replace(match.group(1), '<UDIM>', 1)
-            
-            return path
-        
         unused_textures = []
-        if os.path.exists(textures_dir):
-            used_files = set()
-            
-            for mat in bpy.data.materials:
-                if not mat.use_nodes:
-                    continue
-                for node in mat.node_tree.nodes:
-                    if node.type == 'TEX_IMAGE' and node.image:
-                        img = node.image
-                        try:
-                            if img.filepath:
-                                abs_path = bpy.path.abspath(img.filepath)
-                                norm_path = os.path.normpath(abs_path)
-                                
-                                if '<UDIM>' not in norm_path:
-                                    norm_path = normalize_udim(norm_path)
-                                
-                                used_files.add(norm_path)
-                        except Exception:
-                            continue
-            
-            for img in bpy.data.images:
-                if img.source == 'FILE' and img.filepath:
-                    abs_path = bpy.path.abspath(img.filepath)
-                    norm_path = os.path.normpath(abs_path)
-                    
-                    if '<UDIM>' not in norm_path:
-                        norm_path = normalize_udim(norm_path)
-                    
-                    used_files.add(norm_path)
-            
-            # Scan for image files
-            image_extensions = {'.png', '.jpg', '.jpeg', '.tga', '.bmp', '.tiff', '.webp', '.exr', '.hdr', '.dds'}
-            for root, dirs, files in os.walk(textures_dir):
-                if '.backup' in root:
-                    continue
-                for file in files:
-                    file_lower = file.lower()
-                    if any(file_lower.endswith(ext) for ext in image_extensions):
-                        file_path = os.path.normpath(os.path.join(root, file))
-                        
-                        normalized_file_path = normalize_udim(file_path)
-                        
-                        if normalized_file_path not in used_files:
-                            rel_from_textures = os.path.relpath(file_path, textures_dir)
-                            
-                            try:
-                                file_size = os.path.getsize(file_path)
-                                if file_size < 1024:
-                                    size_str = f"{file_size} B"
-                                elif file_size < 1024 * 1024:
-                                    size_str = f"{file_size / 1024:.1f} KB"
-                                else:
-                                    size_str = f"{file_size / (1024 * 1024):.1f} MB"
-                            except Exception:
-                                size_str = "Unknown"
-                            
-                            unused_textures.append({
-                                'path': rel_from_textures,
-                                'size': size_str
-                            })
+        for file_path, file_size in self._unused_files.result():
+            unused_textures.append({
+                'path': os.path.relpath(file_path, textures_dir),
+                'size': format_bytes(file_size) if file_size is not None else "Unknown"
+            })
 
         lines.append(f"Total Textures in Blend: {len(found_images) + len(missing_images) + len(packed_images)}")
         lines.append(f"Linked Library Textures: {sum(len(imgs) for imgs in linked_library_images.values())}")
@@ -349,10 +606,12 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         lines.append("=" * 60)
         lines.append("")
 
-        total_objects = len([obj for obj in bpy.data.objects if obj.type == 'MESH'])
-        total_materials = len(bpy.data.materials)
-        total_textures = len([img for img in bpy.data.images 
-                             if img.source == 'FILE' and img.name not in ('Render Result', 'Viewer Node')])
+        snapshot = self._snapshot
+        textures = [img for img in snapshot['images']
+                    if img['source'] == 'FILE' and img['name'] not in ('Render Result', 'Viewer Node')]
+        total_objects = snapshot['mesh_object_count']
+        total_materials = len(snapshot['materials'])
+        total_textures = len(textures)
 
         lines.append(f"📊 STATISTICS:")
         lines.append(f"  • Total Objects: {total_objects}")
@@ -360,32 +619,11 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         lines.append(f"  • Total Textures: {total_textures}")
         lines.append("")
 
-        material_usage = {}
-        texture_usage = {}
-        
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-            for slot in obj.material_slots:
-                if slot.material:
-                    mat = slot.material
-                    if mat.name not in material_usage:
-                        material_usage[mat.name] = []
-                    if obj.name not in material_usage[mat.name]:
-                        material_usage[mat.name].append(obj.name)
-                    
-                    if mat.use_nodes and mat.node_tree:
-                        for node in mat.node_tree.nodes:
-                            if node.type == 'TEX_IMAGE' and node.image:
-                                if node.image.name not in texture_usage:
-                                    texture_usage[node.image.name] = []
-                                if mat.name not in texture_usage[node.image.name]:
-                                    texture_usage[node.image.name].append(mat.name)
-
-        orphan_materials = [mat.name for mat in bpy.data.materials if mat.name not in material_usage]
-        orphan_textures = [img.name for img in bpy.data.images 
-                          if img.source == 'FILE' and img.name not in ('Render Result', 'Viewer Node') 
-                          and img.name not in texture_usage]
+        material_usage = snapshot['material_usage']
+        texture_usage = snapshot['texture_usage']
+
+        orphan_materials = [mat['name'] for mat in snapshot['materials'] if mat['name_full'] not in material_usage]
+        orphan_textures = [img['name'] for img in textures if img['name_full'] not in texture_usage]
 
         has_warnings = False
         if orphan_materials or orphan_textures:
@@ -398,13 +636,11 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
                 lines.append(f"  • {len(orphan_textures)} textures not used in any material")
             lines.append("")
 
-        linked_collections = {}
-        for collection in bpy.data.collections:
-            if collection.library:
-                lib_path = collection.library.filepath
-                if lib_path not in linked_collections:
-                    linked_collections[lib_path] = []
-                linked_collections[lib_path].append(collection.name)
+        linked_collections = {
+            lib_path: datablocks['collections']
+            for lib_path, datablocks in snapshot['library_datablocks'].items()
+            if datablocks.get('collections')
+        }
         
         if linked_collections:
             if not has_warnings:
@@ -431,32 +667,21 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         lines.append("=" * 60)
         lines.append("")
 
-        material_usage = {}
-        
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-            for slot in obj.material_slots:
-                if slot.material:
-                    mat = slot.material
-                    if mat.name not in material_usage:
-                        material_usage[mat.name] = []
-                    if obj.name not in material_usage[mat.name]:
-                        material_usage[mat.name].append(obj.name)
+        material_usage = self._snapshot['material_usage']
 
         current_file_materials = []
         linked_materials = {}
         
-        for mat in bpy.data.materials:
-            if mat.library:
-                lib_path = mat.library.filepath
+        for mat in self._snapshot['materials']:
+            if mat['library']:
+                lib_path = mat['library']
                 if lib_path not in linked_materials:
                     linked_materials[lib_path] = []
                 linked_materials[lib_path].append(mat)
             else:
                 current_file_materials.append(mat)
 
-        total_materials = len(bpy.data.materials)
+        total_materials = len(self._snapshot['materials'])
         used_materials = len(material_usage)
         orphan_materials = total_materials - used_materials
 
@@ -473,12 +698,12 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         lines.append("")
         
         if current_file_materials:
-            for mat in sorted(current_file_materials, key=lambda x: x.name):
-                if mat.name in material_usage:
-                    usage_list = sorted(material_usage[mat.name])
-                    lines.append(self._format_usage_hybrid(mat.name, usage_list, "objects", threshold=5, emoji="📦 "))
+            for mat in sorted(current_file_materials, key=lambda x: x['name']):
+                if mat['name_full'] in material_usage:
+                    usage_list = sorted(material_usage[mat['name_full']])
+                    lines.append(self._format_usage_hybrid(mat['name'], usage_list, "objects", threshold=5, emoji="📦 "))
                 else:
-                    lines.append(f"📦 {mat.name}: NOT ASSIGNED TO ANY OBJECT ⚠️")
+                    lines.append(f"📦 {mat['name']}: NOT ASSIGNED TO ANY OBJECT ⚠️")
                 lines.append("")
         else:
             lines.append("No materials in current file")
@@ -491,12 +716,12 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
                 lines.append(f"Materials: {len(linked_materials[lib_path])}")
                 lines.append("")
                 
-                for mat in sorted(linked_materials[lib_path], key=lambda x: x.name):
-                    if mat.name in material_usage:
-                        usage_list = sorted(material_usage[mat.name])
-                        lines.append(self._format_usage_hybrid(mat.name, usage_list, "objects", threshold=5, emoji="📦 "))
+                for mat in sorted(linked_materials[lib_path], key=lambda x: x['name']):
+                    if mat['name_full'] in material_usage:
+                        usage_list = sorted(material_usage[mat['name_full']])
+                        lines.append(self._format_usage_hybrid(mat['name'], usage_list, "objects", threshold=5, emoji="📦 "))
                     else:
-                        lines.append(f"📦 {mat.name}: NOT ASSIGNED TO ANY OBJECT ⚠️")
+                        lines.append(f"📦 {mat['name']}: NOT ASSIGNED TO ANY OBJECT ⚠️")
                     lines.append("")
 
         lines.append("=" * 60)
@@ -510,28 +735,17 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         lines.append("=" * 60)
         lines.append("")
 
-        texture_usage = {}
-        
-        for mat in bpy.data.materials:
-            if not mat.use_nodes or not mat.node_tree:
-                continue
-            for node in mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    img_name = node.image.name
-                    if img_name not in texture_usage:
-                        texture_usage[img_name] = []
-                    if mat.name not in texture_usage[img_name]:
-                        texture_usage[img_name].append(mat.name)
+        texture_usage = self._snapshot['texture_usage']
 
-        all_textures = [img for img in bpy.data.images 
-                       if img.source == 'FILE' and img.name not in ('Render Result', 'Viewer Node')]
+        all_textures = [img for img in self._snapshot['images']
+                       if img['source'] == 'FILE' and img['name'] not in ('Render Result', 'Viewer Node')]
         
         current_file_textures = []
         linked_textures = {}
         
         for img in all_textures:
-            if img.library:
-                lib_path = img.library.filepath
+            if img['library']:
+                lib_path = img['library']
                 if lib_path not in linked_textures:
                     linked_textures[lib_path] = []
                 linked_textures[lib_path].append(img)
@@ -555,12 +769,12 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
         lines.append("")
         
         if current_file_textures:
-            for img in sorted(current_file_textures, key=lambda x: x.name):
-                if img.name in texture_usage:
-                    usage_list = sorted(texture_usage[img.name])
-                    lines.append(self._format_usage_hybrid(img.name, usage_list, "materials", threshold=5, emoji="🖼️  "))
+            for img in sorted(current_file_textures, key=lambda x: x['name']):
+                if img['name_full'] in texture_usage:
+                    usage_list = sorted(texture_usage[img['name_full']])
+                    lines.append(self._format_usage_hybrid(img['name'], usage_list, "materials", threshold=5, emoji="🖼️  "))
                 else:
-                    lines.append(f"🖼️  {img.name}: NOT USED IN ANY MATERIAL ⚠️")
+                    lines.append(f"🖼️  {img['name']}: NOT USED IN ANY MATERIAL ⚠️")
                 lines.append("")
         else:
             lines.append("No textures in current file")
@@ -573,12 +787,12 @@ class SCENE_OT_AnalyzeSceneDeep(bpy.types.Operator):
                 lines.append(f"Textures: {len(linked_textures[lib_path])}")
                 lines.append("")
                 
-                for img in sorted(linked_textures[lib_path], key=lambda x: x.name):
-                    if img.name in texture_usage:
-                        usage_list = sorted(texture_usage[img.name])
-                        lines.append(self._format_usage_hybrid(img.name, usage_list, "materials", threshold=5, emoji="🖼️  "))
+                for img in sorted(linked_textures[lib_path], key=lambda x: x['name']):
+                    if img['name_full'] in texture_usage:
+                        usage_list = sorted(texture_usage[img['name_full']])
+                        lines.append(self._format_usage_hybrid(img['name'], usage_list, "materials", threshold=5, emoji="🖼️  "))
                     else:
-                        lines.append(f"🖼️  {img.name}: NOT USED IN ANY MATERIAL ⚠️")
+                        lines.append(f"🖼️  {img['name']}: NOT USED IN ANY MATERIAL ⚠️")
                     lines.append("")
 
         lines.append("=" * 60)
@@ -903,11 +1117,106 @@ class SCENE_OT_ShowAnalysisResult(bpy.types.Operator):
         info_col.label(text="Open Scripting workspace to view full reports", icon='BLANK1')
 
 
+class SCENE_OT_DiffAnalysis(bpy.types.Operator):
+    """Compare two structured scene analysis reports"""
+    bl_idname = "scene.diff_analysis"
+    bl_label = "Compare Analysis Reports"
+    bl_description = "Compare two structured analysis reports (e.g. before and after optimization) and show the deltas in texture bytes, counts and orphans"
+    bl_options = {'REGISTER'}
+
+    TEXT_NAME = "Scene_AnalysisDiff"
+
+    before_path: bpy.props.StringProperty(
+        name="Before",
+        description="Earlier structured report (.jsonl or .csv)",
+        subtype='FILE_PATH'
+    )
+
+    after_path: bpy.props.StringProperty(
+        name="After",
+        description="Later structured report (.jsonl or .csv)",
+        subtype='FILE_PATH'
+    )
+
+    def invoke(self, context, event):
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Please save the .blend file first")
+            return {'CANCELLED'}
+
+        # Default to the two latest runs
+        reports = scene_report.find_reports(os.path.join(os.path.dirname(bpy.data.filepath), "reports"))
+        if len(reports) >= 2:
+            self.before_path, self.after_path = reports[-2], reports[-1]
+        elif reports:
+            self.after_path = reports[-1]
+
+        return context.window_manager.invoke_props_dialog(self, width=500)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "before_path")
+        layout.prop(self, "after_path")
+        layout.separator()
+        layout.label(text="Reports are written by Analyze Scene Deeply", icon='INFO')
+        layout.label(text="(Preferences > Scene Analysis > Structured Export)", icon='BLANK1')
+
+    def execute(self, context):
+        before_path = bpy.path.abspath(self.before_path)
+        after_path = bpy.path.abspath(self.after_path)
+        for path in (before_path, after_path):
+            if not path or not os.path.isfile(path):
+                self.report({'ERROR'}, f"Report not found: {path or '(empty)'}")
+                return {'CANCELLED'}
+
+        try:
+            diff = scene_report.diff_reports(
+                scene_report.read_report(before_path), scene_report.read_report(after_path)
+            )
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not read reports: {e}")
+            return {'CANCELLED'}
+
+        content = scene_report.format_diff(diff, os.path.basename(before_path), os.path.basename(after_path))
+
+        if self.TEXT_NAME in bpy.data.texts:
+            bpy.data.texts.remove(bpy.data.texts[self.TEXT_NAME])
+        text = bpy.data.texts.new(self.TEXT_NAME)
+        text.write(content)
+
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            if prefs.analysis_auto_save:
+                reports_dir = os.path.join(os.path.dirname(bpy.data.filepath), "reports")
+                os.makedirs(reports_dir, exist_ok=True)
+                with open(os.path.join(reports_dir, f"{self.TEXT_NAME}.txt"), 'w', encoding='utf-8') as f:
+                    f.write(content)
+        except Exception as e:
+            print(f"Auto-save diff warning: {e}")
+
+        totals = {label: (before, after) for label, before, after in diff['bytes']}
+        gpu_before, gpu_after = totals["Texture GPU bytes"]
+        orphans_before = sum(before for orphan_type, before, after in diff['orphans'])
+        orphans_after = sum(after for orphan_type, before, after in diff['orphans'])
+        details = (
+            f"GPU: {format_bytes(gpu_before)} → {format_bytes(gpu_after)} | "
+            f"Orphans: {orphans_before} → {orphans_after} | "
+            f"Textures changed: {len(diff['changed'])} | Added: {len(diff['added'])} | Removed: {len(diff['removed'])}"
+        )
+        self.report({'INFO'}, f"{details} (see {self.TEXT_NAME} in Text Editor)")
+
+        from ..utils.activity_logger import log_activity
+        log_activity("DIFF_ANALYSIS", details, context)
+
+        return {'FINISHED'}
+
+
 def register():
     bpy.utils.register_class(SCENE_OT_AnalyzeSceneDeep)
     bpy.utils.register_class(SCENE_OT_ShowAnalysisResult)
+    bpy.utils.register_class(SCENE_OT_DiffAnalysis)
 
 
 def unregister():
+    bpy.utils.unregister_class(SCENE_OT_DiffAnalysis)
     bpy.utils.unregister_class(SCENE_OT_ShowAnalysisResult)
     bpy.utils.unregister_class(SCENE_OT_AnalyzeSceneDeep)
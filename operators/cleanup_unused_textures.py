@@ -26,6 +26,8 @@ class TEXTURE_OT_CleanupUnusedTextures(bpy.types.Operator):
     total_unused = 0
 
     def invoke(self, context, event):
+        from ..utils.texture_utils import get_used_textures
+
         if not bpy.data.filepath:
             self.report({'ERROR'}, "Please save the .blend file first")
             return {'CANCELLED'}
@@ -66,43 +68,7 @@ class TEXTURE_OT_CleanupUnusedTextures(bpy.types.Operator):
             
             return path
 
-        used_textures = set()
-        
-        for mat in bpy.data.materials:
-            if not mat.use_nodes:
-                continue
-            for node in mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    img = node.image
-                    try:
-                        abs_path = bpy.path.abspath(img.filepath)
-                        norm_path = os.path.normpath(abs_path)
-                        
-                        if '<UDIM>' not in norm_path:
-                            norm_path = normalize_udim(norm_path)
-                        
-                        used_textures.add(norm_path)
-                    except Exception:
-                        continue
-        
-        for img in bpy.data.images:
-            if img.source != 'FILE':
-                continue
-            
-            if img.library:
-                continue
-            
-            try:
-                abs_path = bpy.path.abspath(img.filepath)
-                norm_path = os.path.normpath(abs_path)
-                
-                # If already has <UDIM>, keep it as-is
-                if '<UDIM>' not in norm_path:
-                    norm_path = normalize_udim(norm_path)
-                
-                used_textures.add(norm_path)
-            except Exception:
-                continue
+        used_textures = get_used_textures()
 
         self.unused_textures = []
         for tex_path in texture_files:
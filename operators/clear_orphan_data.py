@@ -10,6 +10,7 @@ class SCENE_OT_ClearOrphanData(bpy.types.Operator):
 
     orphan_stats = {}
     unused_libraries = []
+    unused_materials = []
 
     def invoke(self, context, event):
         self.orphan_stats = self._scan_orphan_data()
@@ -44,7 +45,7 @@ class SCENE_OT_ClearOrphanData(bpy.types.Operator):
                 mat_box = layout.box()
                 mat_box.label(text="📦 Unused Materials List:", icon='MATERIAL')
                 
-                unused_materials = [mat.name for mat in bpy.data.materials if mat.users == 0]
+                unused_materials = self.unused_materials
                 
                 # Use grid layout
                 grid = mat_box.grid_flow(row_major=True, columns=2, align=True)
@@ -103,149 +104,18 @@ class SCENE_OT_ClearOrphanData(bpy.types.Operator):
         return {'FINISHED'}
 
     def _scan_orphan_data(self):
-        """Scan for orphan datablocks (0 users)"""
-        stats = {
-            'Meshes': 0,
-            'Materials': 0,
-            'Textures': 0,
-            'Images': 0,
-            'Objects': 0,
-            'Collections': 0,
-            'Actions': 0,
-            'Curves': 0,
-            'Lights': 0,
-            'Cameras': 0,
-        }
-        
-        # Meshes
-        for mesh in bpy.data.meshes:
-            if mesh.users == 0:
-                stats['Meshes'] += 1
-        
-        # Materials
-        for mat in bpy.data.materials:
-            if mat.users == 0:
-                stats['Materials'] += 1
-        
-        # Textures
-        for tex in bpy.data.textures:
-            if tex.users == 0:
-                stats['Textures'] += 1
-        
-        # Images (exclude Render Result and Viewer Node)
-        for img in bpy.data.images:
-            if img.name not in ('Render Result', 'Viewer Node') and img.users == 0:
-                stats['Images'] += 1
-        
-        # Objects
-        for obj in bpy.data.objects:
-            if obj.users == 0:
-                stats['Objects'] += 1
-        
-        # Collections
-        for col in bpy.data.collections:
-            if col.users == 0:
-                stats['Collections'] += 1
-        
-        # Actions
-        for action in bpy.data.actions:
-            if action.users == 0:
-                stats['Actions'] += 1
-        
-        # Curves
-        for curve in bpy.data.curves:
-            if curve.users == 0:
-                stats['Curves'] += 1
-        
-        # Lights
-        for light in bpy.data.lights:
-            if light.users == 0:
-                stats['Lights'] += 1
-        
-        # Cameras
-        for camera in bpy.data.cameras:
-            if camera.users == 0:
-                stats['Cameras'] += 1
+        """Count orphan datablocks (0 users) per type - the rule _clear_orphan_data deletes by"""
+        from ..utils.scene_index import get_scene_index
         
-        return stats
+        orphans = get_scene_index().orphans
+        self.unused_materials = list(orphans.get('Materials', []))
+        return {label: len(names) for label, names in orphans.items()}
 
     def _scan_unused_libraries(self):
-        """Scan for linked libraries with no users (check objects, materials, meshes, node groups, images)"""
-        unused = []
-        
-        for lib in bpy.data.libraries:
-            has_users = False
-            
-            # Check objects from this library
-            for obj in bpy.data.objects:
-                if obj.library == lib and obj.users > 0:
-                    has_users = True
-                    break
-            
-            if not has_users:
-                # Check materials
-                for mat in bpy.data.materials:
-                    if mat.library == lib and mat.users > 0:
-                        has_users = True
-                        break
-            
-            if not has_users:
-                # Check meshes
-                for mesh in bpy.data.meshes:
-                    if mesh.library == lib and mesh.users > 0:
-                        has_users = True
-                        break
-            
-            if not has_users:
-                # Check collections
-                for col in bpy.data.collections:
-                    if col.library == lib and col.users > 0:
-                        has_users = True
-                        break
-            
-            if not has_users:
-                # Check node groups (critical for shader editor)
-                for node_group in bpy.data.node_groups:
-                    if node_group.library == lib:
-
-                        is_used = False
-                        
-                        for mat in bpy.data.materials:
-                            if mat.use_nodes and mat.node_tree:
-                                for node in mat.node_tree.nodes:
-                                    if node.type == 'GROUP' and node.node_tree == node_group:
-                                        is_used = True
-                                        break
-                            if is_used:
-                                break
-                        
-                        if is_used:
-                            has_users = True
-                            break
-            
-            if not has_users:
-                # Check images from this library (textures in shader editor)
-                for img in bpy.data.images:
-                    if img.library == lib:
-                        is_used = False
-                        
-                        for mat in bpy.data.materials:
-                            if mat.use_nodes and mat.node_tree:
-                                for node in mat.node_tree.nodes:
-                                    if node.type == 'TEX_IMAGE' and node.image == img:
-                                        is_used = True
-                                        break
-                            if is_used:
-                                break
-                        
-                        if is_used:
-                            has_users = True
-                            break
-            
-            if not has_users:
-                unused.append(lib.filepath)
+        """Linked libraries none of whose datablocks has a user"""
+        from ..utils.scene_index import get_scene_index
         
-        return unused
+        return list(get_scene_index().unused_libraries)
 
     def _clear_orphan_data(self):
         """Clear orphan datablocks, return count removed"""
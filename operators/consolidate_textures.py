@@ -42,12 +42,15 @@ class ASSET_OT_ConsolidateTextures(bpy.types.Operator):
     conflicting_textures = []  # Same filename exists in target
 
     def invoke(self, context, event):
+        from ..utils.texture_utils import get_project_texture_cache
+        
         if not bpy.data.filepath:
             self.report({'ERROR'}, "Please save the .blend file first.")
             return {'CANCELLED'}
 
         blend_dir = os.path.dirname(bpy.data.filepath)
         target_dir = os.path.join(blend_dir, "textures")
+        cache = get_project_texture_cache()
         
         self.textures_to_move = []
         self.packed_textures = []
@@ -97,6 +100,10 @@ class ASSET_OT_ConsolidateTextures(bpy.types.Operator):
                 dest_size = os.path.getsize(dest_path)
                 
                 is_same_file = (source_mtime == dest_mtime and source_size == dest_size)
+                if not is_same_file and source_size == dest_size:
+                    # Same size, different date - compare cached content hashes
+                    source_hash = cache.get_hash(source_path)
+                    is_same_file = source_hash is not None and source_hash == cache.get_hash(dest_path)
                 
                 self.conflicting_textures.append({
                     "image": img,
@@ -117,6 +124,8 @@ class ASSET_OT_ConsolidateTextures(bpy.types.Operator):
                     "filename": filename,
                 })
 
+        cache.save()
+
         # Auto-select default conflict resolution based on detection
         if self.conflicting_textures:
             same_count = sum(1 for c in self.conflicting_textures if c['is_same_file'])
@@ -174,8 +174,209 @@ class TEXTURE_OT_ConvertImageFormat(bpy.types.Operator):
 
         return {'FINISHED'}
 
+class TEXTURE_OT_DemoteChannels(bpy.types.Operator):
+    """Rewrite grayscale textures as single-channel and drop fully opaque alpha."""
+    bl_idname = "texture.demote_channels"
+    bl_label = "Demote Channels"
+    bl_description = "Find RGB/RGBA textures that are effectively grayscale or fully opaque and rewrite them with fewer channels"
+
+    # Formats that can be rewritten losslessly with fewer channels
+    DEMOTE_FORMATS = {'PNG', 'TARGA', 'TIFF'}
+
+    tolerance: bpy.props.IntProperty(
+        name="Tolerance",
+        description="Max channel difference (0-255 steps) still treated as equal",
+        default=1,
+        min=0,
+        max=8
+    )
+
+    backup_original: bpy.props.BoolProperty(
+        name="Backup Original",
+        description="Backup original files into `.backup` folder with .fmt extension",
+        default=True,
+    )
+
+    candidates = []
+    skipped_lossy = 0
+
+    def invoke(self, context, event):
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Please save the .blend file first")
+            return {'CANCELLED'}
+
+        self.candidates = self.scan(context)
+        if not self.candidates:
+            self.report({'INFO'}, "No grayscale or opaque-alpha textures to demote")
+            return {'CANCELLED'}
+
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def scan(self, context):
+        """
+        Flag textures whose stored channels exceed their content.
+
+        Returns:
+            list: dicts with image name, path, stored channels and target color mode
+        """
+        from ..utils.texture_detector import detect_external_and_packed_textures
+        from ..utils.texture_utils import analyze_image_pixels, get_project_texture_cache
+
+        external_imgs, packed_imgs, local_imgs = detect_external_and_packed_textures(context)
+        cache = get_project_texture_cache()
+        tolerance = self.tolerance / 255.0
+        self.skipped_lossy = 0
+
+        candidates = []
+        wm = context.window_manager
+        images = [img for img in bpy.data.images
+                  if img.source == 'FILE' and not img.packed_file and not img.library
+                  and img.name not in external_imgs and img.name not in packed_imgs]
+        wm.progress_begin(0, max(len(images), 1))
+        try:
+            for index, img in enumerate(images):
+                wm.progress_update(index)
+                abs_path = bpy.path.abspath(img.filepath_raw)
+                info = cache.get_info(abs_path)
+                # Stored channel count comes from the file - Blender always reports 4
+                if info is None or info.channels < 2:
+                    continue
+                if info.format not in self.DEMOTE_FORMATS:
+                    self.skipped_lossy += 1
+                    continue
+
+                has_alpha = info.channels in (2, 4)
+                if self.tolerance == 1:
+                    flags = cache.get_pixel_flags(abs_path, lambda img=img: analyze_image_pixels(img))
+                else:
+                    flags = analyze_image_pixels(img, tolerance)
+                if flags is None:
+                    continue
+                uniform, grayscale, opaque = flags
+
+                # Blender writes BW without alpha - gray with real alpha stays as is
+                if has_alpha and not opaque:
+                    continue
+                if grayscale and info.channels >= 3:
+                    color_mode = 'BW'
+                elif has_alpha:
+                    color_mode = 'BW' if info.channels == 2 else 'RGB'
+                else:
+                    continue
+
+                candidates.append({
+                    'name': img.name,
+                    'path': abs_path,
+                    'format': info.format,
+                    'bit_depth': info.bit_depth,
+                    'channels': info.channels,
+                    'color_mode': color_mode,
+                })
+        finally:
+            wm.progress_end()
+            cache.save()
+
+        return candidates
+
+    def draw(self, context):
+        layout = self.layout
+        to_bw = sum(1 for c in self.candidates if c['color_mode'] == 'BW')
+        to_rgb = len(self.candidates) - to_bw
+
+        box = layout.box()
+        if to_bw:
+            box.label(text=f"{to_bw} texture(s) → single channel (grayscale)", icon='IMAGE_ALPHA')
+        if to_rgb:
+            box.label(text=f"{to_rgb} texture(s) → RGB (opaque alpha dropped)", icon='IMAGE_RGB')
+        for candidate in self.candidates[:5]:
+            box.label(text=f"  • {candidate['name']}", icon='BLANK1')
+        if len(self.candidates) > 5:
+            box.label(text=f"  ... and {len(self.candidates) - 5} more", icon='BLANK1')
+        if self.skipped_lossy:
+            layout.label(text=f"{self.skipped_lossy} JPEG/WebP/EXR texture(s) not checked", icon='INFO')
+
+        layout.prop(self, "backup_original")
+        if self.backup_original:
+            layout.label(text="Backups saved as: filename.png.fmt", icon='INFO')
+        layout.separator()
+        layout.label(text="Original files will be overwritten!", icon='ERROR')
+
+    def execute(self, context):
+        from ..utils.copy_engine import format_bytes
+
+        demoted = 0
+        failed = 0
+        bytes_before = 0
+        bytes_after = 0
+
+        # Settings of a temporary scene drive the written color mode/depth;
+        # Standard view keeps pixel values unchanged
+        temp_scene = bpy.data.scenes.new("__demote_channels")
+        try:
+            settings = temp_scene.render.image_settings
+            temp_scene.view_settings.view_transform = 'Standard'
+            temp_scene.view_settings.look = 'None'
+            temp_scene.view_settings.exposure = 0.0
+            temp_scene.view_settings.gamma = 1.0
+
+            for candidate in self.candidates:
+                img = bpy.data.images.get(candidate['name'])
+                abs_path = candidate['path']
+                if img is None or not os.path.exists(abs_path):
+                    failed += 1
+                    continue
+
+                try:
+                    if self.backup_original:
+                        backup_dir = os.path.join(os.path.dirname(abs_path), ".backup")
+                        os.makedirs(backup_dir, exist_ok=True)
+                        backup_path = os.path.join(backup_dir, os.path.basename(abs_path) + ".fmt")
+                        if not os.path.exists(backup_path):
+                            shutil.copy2(abs_path, backup_path)
+
+                    size_before = os.path.getsize(abs_path)
+                    settings.file_format = candidate['format']
+                    settings.color_mode = candidate['color_mode']
+                    if candidate['format'] in ('PNG', 'TIFF'):
+                        settings.color_depth = '16' if (candidate['bit_depth'] or 8) > 8 else '8'
+
+                    img.save_render(abs_path, scene=temp_scene)
+                    img.reload()
+
+                    bytes_before += size_before
+                    bytes_after += os.path.getsize(abs_path)
+                    demoted += 1
+                except Exception as e:
+                    failed += 1
+                    self.report({'WARNING'}, f"Failed to demote {candidate['name']}: {str(e)}")
+        finally:
+            bpy.data.scenes.remove(temp_scene)
+
+        msg = f"Demoted: {demoted}"
+        if failed > 0:
+            msg += f" | Failed: {failed}"
+        if demoted > 0:
+            msg += f" | Saved: {format_bytes(max(bytes_before - bytes_after, 0))} on disk"
+
+        if demoted > 0:
+            self.report({'INFO'}, msg)
+        else:
+            self.report({'WARNING'}, msg)
+
+        # Log activity
+        from ..utils.activity_logger import log_activity
+        details = f"Demoted: {demoted}"
+        if failed > 0:
+            details += f" | Failed: {failed}"
+        log_activity("DEMOTE_CHANNELS", details, context)
+
+        return {'FINISHED'}
+
+
 def register():
     bpy.utils.register_class(TEXTURE_OT_ConvertImageFormat)
+    bpy.utils.register_class(TEXTURE_OT_DemoteChannels)
 
 def unregister():
+    bpy.utils.unregister_class(TEXTURE_OT_DemoteChannels)
     bpy.utils.unregister_class(TEXTURE_OT_ConvertImageFormat)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import bpy
 import os
 import shutil
+import time
 
 class TEXTURE_OT_DowngradeResolution(bpy.types.Operator):
     """Downgrade texture resolution to 2K, 1K, or 512."""
@@ -13,27 +14,116 @@ class TEXTURE_OT_DowngradeResolution(bpy.types.Operator):
         items=[
             ('2K', "2K (2048)", "Downgrade to 2048px max dimension"),
             ('1K', "1K (1024)", "Downgrade to 1024px max dimension"),
-            ('512', "512 (512)", "Downgrade to 512px max dimension")
+            ('512', "512 (512)", "Downgrade to 512px max dimension"),
+            ('BUDGET', "Budget", "Pick a size per texture so the texture memory fits a budget")
         ],
         default='2K'
     )
     
+    memory_budget: bpy.props.IntProperty(
+        name="Memory Budget (MB)",
+        description="Total texture memory to fit (GPU or CPU as set in preferences)",
+        default=1024,
+        min=16,
+        max=65536
+    )
+    
+    min_resolution: bpy.props.EnumProperty(
+        name="Minimum Size",
+        description="Textures are never reduced below this size",
+        items=[
+            ('128', "128", ""),
+            ('256', "256", ""),
+            ('512', "512", ""),
+            ('1024', "1K", "")
+        ],
+        default='256'
+    )
+    
+    priority_color: bpy.props.FloatProperty(
+        name="Base Color",
+        description="Priority of base color maps (higher keeps more resolution)",
+        default=2.0,
+        min=0.1,
+        max=10.0
+    )
+    
+    priority_detail: bpy.props.FloatProperty(
+        name="Normal / Height",
+        description="Priority of normal, bump and height maps (higher keeps more resolution)",
+        default=3.0,
+        min=0.1,
+        max=10.0
+    )
+    
+    priority_mask: bpy.props.FloatProperty(
+        name="Masks",
+        description="Priority of roughness, metallic, specular, AO and alpha maps (higher keeps more resolution)",
+        default=1.0,
+        min=0.1,
+        max=10.0
+    )
+    
+    priority_other: bpy.props.FloatProperty(
+        name="Other",
+        description="Priority of textures without a recognized map type (higher keeps more resolution)",
+        default=2.0,
+        min=0.1,
+        max=10.0
+    )
+    
+    resample_filter: bpy.props.EnumProperty(
+        name="Filter",
+        items=[
+            ('BOX', "Box", "Area average - fastest, slightly soft"),
+            ('BILINEAR', "Bilinear", "Smooth triangle filter - good default"),
+            ('LANCZOS', "Lanczos", "Sharpest - may ring on hard edges")
+        ],
+        default='BILINEAR'
+    )
+    
     backup_original: bpy.props.BoolProperty(
         name="Backup Original",
         description="Backup original files into `.backup` folder with .hires extension",
         default=True
     )
     
+    _timer = None
+    _pool = None
+    _save_scene = None
+    _queue = []
+    _in_flight = {}
+    _stats = {}
+    _cancelled = False
+    
     def invoke(self, context, event):
         if not bpy.data.filepath:
             self.report({'ERROR'}, "Please save the .blend file first")
             return {'CANCELLED'}
         
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            self.memory_budget = prefs.texture_memory_budget
+        except Exception:
+            pass
+        
         return context.window_manager.invoke_props_dialog(self)
     
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "resolution", expand=True)
+        if self.resolution == 'BUDGET':
+            box = layout.box()
+            col = box.column(align=True)
+            col.prop(self, "memory_budget")
+            col.prop(self, "min_resolution")
+            col.separator()
+            col.label(text="Map Priorities:", icon='SORTSIZE')
+            col.prop(self, "priority_detail")
+            col.prop(self, "priority_color")
+            col.prop(self, "priority_mask")
+            col.prop(self, "priority_other")
+        layout.prop(self, "resample_filter")
         layout.prop(self, "backup_original")
         if self.backup_original:
             layout.label(text="Backups saved as: filename.png.hires", icon='INFO')
@@ -42,89 +132,372 @@ class TEXTURE_OT_DowngradeResolution(bpy.types.Operator):
         layout.separator()
         layout.label(text="Note: External & packed textures will be skipped", icon='INFO')
     
-    def execute(self, context):
+    def get_workers(self, context):
+        """Get resample process count from addon preferences"""
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            return prefs.texture_workers
+        except Exception:
+            return 4
+    
+    def get_memory_target(self, context):
+        """'GPU' or 'CPU' - which estimate the budget applies to (from preferences)"""
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            return prefs.texture_memory_target
+        except Exception:
+            return 'GPU'
+    
+    def collect_images(self, context):
+        """Yield (image, absolute path) of images that can be downgraded; counts skips"""
         from ..utils.texture_detector import detect_external_and_packed_textures
+        from ..utils.texture_lod import is_lod_path
         
         # Detect textures to skip
         external_imgs, packed_imgs, local_imgs = detect_external_and_packed_textures(context)
         
-        if self.resolution == '2K':
-            target_size = 2048
-        elif self.resolution == '1K':
-            target_size = 1024
-        else:
-            target_size = 512
-        
-        downgraded = 0
-        skipped = 0
-        skipped_external = 0
-        skipped_packed = 0
-        errors = 0
-        udim_skipped = 0
+        stats = self._stats
         
         for img in bpy.data.images:
             if img.name in ('Render Result', 'Viewer Node'):
                 continue
             if img.source != 'FILE':
-                skipped += 1
+                stats['skipped'] += 1
                 continue
             
             # Skip external textures
             if img.name in external_imgs:
-                skipped_external += 1
+                stats['skipped_external'] += 1
                 continue
             
             # Skip packed textures
             if img.name in packed_imgs:
-                skipped_packed += 1
+                stats['skipped_packed'] += 1
                 continue
             
             if hasattr(img, "tiles") and len(img.tiles) > 1:
-                udim_skipped += 1
-                skipped += 1
+                stats['udim_skipped'] += 1
+                stats['skipped'] += 1
                 continue
             
             abs_path = bpy.path.abspath(img.filepath_raw)
+            
+            # Skip images linked to a LOD variant (switch to Full first)
+            if abs_path and is_lod_path(os.path.normpath(abs_path)):
+                stats['skipped'] += 1
+                continue
+            
             if not abs_path or not os.path.exists(abs_path):
                 self.report({'WARNING'}, f"File not found for {img.name}")
-                skipped += 1
+                stats['skipped'] += 1
                 continue
             
+            yield img, abs_path
+    
+    def collect_jobs(self, context, target_size):
+        """Pick images to downgrade (same skip rules as before); returns list of job dicts"""
+        from ..utils.image_resample import get_target_size
+        
+        jobs = []
+        for img, abs_path in self.collect_images(context):
             original_width, original_height = img.size
             max_dimension = max(original_width, original_height)
             
             if max_dimension <= target_size:
-                skipped += 1
+                self._stats['skipped'] += 1
                 continue
             
-            try:
-                # Backup original with .hires extension marker
-                if self.backup_original:
-                    backup_dir = os.path.join(os.path.dirname(abs_path), ".backup")
-                    os.makedirs(backup_dir, exist_ok=True)
-                    
-                    original_filename = os.path.basename(abs_path)
-                    backup_filename = original_filename + ".hires"
-                    backup_path = os.path.join(backup_dir, backup_filename)
-                    
-                    if not os.path.exists(backup_path):
-                        shutil.copy2(abs_path, backup_path)
-                
-                if original_width > original_height:
-                    new_width = target_size
-                    new_height = int(original_height * (target_size / original_width))
-                else:
-                    new_height = target_size
-                    new_width = int(original_width * (target_size / original_height))
-                
-                img.scale(new_width, new_height)
-                img.save()
+            new_width, new_height = get_target_size(original_width, original_height, target_size)
+            jobs.append({
+                'name': img.name,
+                'path': abs_path,
+                'size': (new_width, new_height),
+            })
+        
+        return jobs
+    
+    def collect_budget_jobs(self, context):
+        """
+        Pick a size per image so the texture memory fits memory_budget.
+        
+        Images that cannot be downgraded (external, packed, UDIM...) still
+        count towards the budget.
+        """
+        from .auto_correct_maps import TEXTURE_OT_AutoCorrectMaps
+        from ..utils.resolution_solver import SolverTexture, get_map_group, solve_resolutions
+        from ..utils.texture_utils import collect_texture_memory, get_image_memory, get_image_resolution, get_project_texture_cache
+        
+        use_gpu = self.get_memory_target(context) == 'GPU'
+        priorities = {
+            'COLOR': self.priority_color,
+            'DETAIL': self.priority_detail,
+            'MASK': self.priority_mask,
+            'OTHER': self.priority_other,
+        }
+        
+        cache = get_project_texture_cache()
+        memory = collect_texture_memory(cache)
+        total = memory['total'].gpu if use_gpu else memory['total'].cpu
+        
+        paths = {}
+        textures = []
+        adjustable = 0
+        for img, abs_path in self.collect_images(context):
+            # Orphans are dropped on save and are not in the memory totals
+            if img.users == 0:
+                self._stats['skipped'] += 1
+                continue
+            
+            # Header probe - img.size would decode every image up front
+            width, height = get_image_resolution(img, cache)
+            image_memory = get_image_memory(img, cache)
+            image_bytes = image_memory.gpu if use_gpu else image_memory.cpu
+            if width == 0 or height == 0 or image_bytes == 0:
+                self._stats['skipped'] += 1
+                continue
+            
+            parts, map_index, sop_map = TEXTURE_OT_AutoCorrectMaps.find_map_part(img.name)
+            priority = priorities[get_map_group(sop_map)]
+            textures.append(SolverTexture(img.name, width, height, image_bytes / (width * height), priority))
+            paths[img.name] = abs_path
+            adjustable += image_bytes
+        cache.save()
+        
+        budget = self.memory_budget * 1024 * 1024
+        result = solve_resolutions(
+            textures, budget, reserved=max(total - adjustable, 0), min_size=int(self.min_resolution)
+        )
+        self._stats['budget_total'] = result.total
+        self._stats['budget_fits'] = result.fits
+        self._stats['skipped'] += len(textures) - len(result.sizes)
+        
+        return [
+            {'name': name, 'path': paths[name], 'size': size}
+            for name, size in result.sizes.items()
+        ]
+    
+    def execute(self, context):
+        from ..utils.image_resample import ResamplePool
+        from ..utils.texture_utils import new_image_save_scene
+        
+        if self.resolution == '2K':
+            target_size = 2048
+        elif self.resolution == '1K':
+            target_size = 1024
+        elif self.resolution == 'BUDGET':
+            target_size = 0
+        else:
+            target_size = 512
+        
+        self._stats = {
+            'target_size': target_size,
+            'downgraded': 0,
+            'skipped': 0,
+            'skipped_external': 0,
+            'skipped_packed': 0,
+            'errors': 0,
+            'udim_skipped': 0,
+            'pixels_in': 0,
+            'bytes_before': 0,
+            'bytes_after': 0,
+            'total': 0,
+            'budget_total': None,
+            'budget_fits': True,
+            'start': time.perf_counter(),
+        }
+        if self.resolution == 'BUDGET':
+            self._queue = self.collect_budget_jobs(context)
+        else:
+            self._queue = self.collect_jobs(context, target_size)
+        self._in_flight = {}
+        self._cancelled = False
+        self._stats['total'] = len(self._queue)
+        
+        if not self._queue:
+            return self.finish(context)
+        
+        # Pixels are resampled in worker processes; image read/write stays here
+        # (bpy image access is main-thread only)
+        self._pool = ResamplePool(max_workers=min(self.get_workers(context), len(self._queue)))
+        self._save_scene = new_image_save_scene("__downgrade_resolution")
+        
+        if bpy.app.background or context.window is None:
+            while not self.step(context, blocking=True):
+                pass
+            return self.finish(context)
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._cancelled = True
+            self._queue = []
+            self.report({'WARNING'}, "Cancelling downgrade (finishing images in progress)...")
+            return {'RUNNING_MODAL'}
+        
+        if event.type == 'TIMER':
+            if self.step(context, blocking=False):
+                self.stop_progress(context)
+                return self.finish(context)
+            self.update_progress(context)
+        
+        return {'PASS_THROUGH'}
+    
+    def cancel(self, context):
+        """Called by Blender when the modal is aborted (e.g. file load)"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel=True)
+            self._pool = None
+        self.remove_save_scene()
+        self.stop_progress(context)
+    
+    def remove_save_scene(self):
+        if self._save_scene is not None:
+            bpy.data.scenes.remove(self._save_scene)
+            self._save_scene = None
+    
+    def step(self, context, blocking):
+        """
+        Advance the pipeline: write back finished images, queue new ones
+        
+        Modal mode handles at most one write and one read per tick so the UI
+        stays responsive. Returns True when all work is done.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        
+        if blocking and self._in_flight and (not self._queue or len(self._in_flight) >= self._pool.max_workers):
+            wait(list(self._in_flight), return_when=FIRST_COMPLETED)
+        
+        for future in [f for f in self._in_flight if f.done()]:
+            self.write_back(self._in_flight.pop(future), future)
+            if not blocking:
+                break
+        
+        while self._queue and len(self._in_flight) < self._pool.max_workers:
+            self.submit_next()
+            if not blocking:
+                break
+        
+        return not self._queue and not self._in_flight
+    
+    def submit_next(self):
+        """Backup the original, read its pixels and queue the resample"""
+        from ..utils.texture_utils import get_project_texture_cache
+        
+        job = self._queue.pop(0)
+        img = bpy.data.images.get(job['name'])
+        if img is None:
+            self._stats['skipped'] += 1
+            return
+        
+        abs_path = job['path']
+        
+        try:
+            # Backup original with .hires extension marker
+            if self.backup_original:
+                backup_dir = os.path.join(os.path.dirname(abs_path), ".backup")
+                os.makedirs(backup_dir, exist_ok=True)
                 
-                downgraded += 1
+                original_filename = os.path.basename(abs_path)
+                backup_filename = original_filename + ".hires"
+                backup_path = os.path.join(backup_dir, backup_filename)
                 
-            except Exception as e:
-                errors += 1
-                self.report({'ERROR'}, f"Error downgrading {img.name}: {str(e)}")
+                if not os.path.exists(backup_path):
+                    shutil.copy2(abs_path, backup_path)
+            
+            job['bytes_before'] = os.path.getsize(abs_path)
+            info = get_project_texture_cache().get_info(abs_path)
+            job['bit_depth'] = info.bit_depth if info else None
+            
+            width, height = img.size
+            pixels = self._pool.allocate((height, width, img.channels))
+            try:
+                img.pixels.foreach_get(pixels.ravel())
+            except Exception:
+                self._pool.discard(pixels)
+                raise
+            
+            self._stats['pixels_in'] += width * height
+            new_width, new_height = job['size']
+            future = self._pool.submit(
+                pixels, new_width, new_height, self.resample_filter, clamp=not img.is_float
+            )
+            del pixels
+            self._in_flight[future] = job
+        
+        except Exception as e:
+            self._stats['errors'] += 1
+            self.report({'ERROR'}, f"Error downgrading {job['name']}: {str(e)}")
+    
+    def write_back(self, job, future):
+        """Save the resampled pixels over the original and reload the image"""
+        from ..utils.texture_utils import save_resized_pixels
+        
+        try:
+            result = future.result()
+            img = bpy.data.images.get(job['name'])
+            if img is None:
+                raise RuntimeError("Image was removed")
+            
+            new_width, new_height = job['size']
+            # Written from a new image of the target size - the pool result is the only resample
+            save_resized_pixels(
+                img, result, new_width, new_height, job['path'], self._save_scene, job['bit_depth']
+            )
+            img.reload()
+            
+            self._stats['downgraded'] += 1
+            self._stats['bytes_before'] += job['bytes_before']
+            self._stats['bytes_after'] += os.path.getsize(job['path'])
+        
+        except Exception as e:
+            self._stats['errors'] += 1
+            self.report({'ERROR'}, f"Error downgrading {job['name']}: {str(e)}")
+    
+    def update_progress(self, context):
+        stats = self._stats
+        done = stats['downgraded'] + stats['errors']
+        progress = done / stats['total'] if stats['total'] else 1.0
+        
+        context.window_manager.progress_update(int(progress * 100))
+        if context.workspace:
+            context.workspace.status_text_set(
+                f"Downgrading textures: {done}/{stats['total']}  (ESC to cancel)"
+            )
+    
+    def stop_progress(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+            wm.progress_end()
+        if context.workspace:
+            context.workspace.status_text_set(None)
+    
+    def finish(self, context):
+        from ..utils.copy_engine import format_bytes
+        
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.remove_save_scene()
+        
+        stats = self._stats
+        downgraded = stats['downgraded']
+        skipped = stats['skipped']
+        udim_skipped = stats['udim_skipped']
+        skipped_external = stats['skipped_external']
+        skipped_packed = stats['skipped_packed']
+        errors = stats['errors']
+        
+        elapsed = time.perf_counter() - stats['start']
+        images_per_second = downgraded / elapsed if elapsed > 0 else 0.0
+        megapixels_per_second = stats['pixels_in'] / 1e6 / elapsed if elapsed > 0 else 0.0
+        saved_bytes = stats['bytes_before'] - stats['bytes_after']
         
         msg = f"Downgraded: {downgraded}"
         if skipped > 0:
@@ -137,22 +510,38 @@ class TEXTURE_OT_DowngradeResolution(bpy.types.Operator):
             msg += f" | Packed: {skipped_packed}"
         if errors > 0:
             msg += f" | Errors: {errors}"
-        
+        if self._cancelled:
+            msg += " | Cancelled"
+        if stats['budget_total'] is not None:
+            msg += f" | Estimated: {format_bytes(stats['budget_total'])} of {format_bytes(self.memory_budget * 1024 * 1024)}"
+            if not stats['budget_fits']:
+                msg += f" (over budget at {self.min_resolution}px minimum)"
         if downgraded > 0:
+            msg += (
+                f" | {elapsed:.1f}s ({images_per_second:.1f} img/s, {megapixels_per_second:.0f} MP/s)"
+                f" | Saved: {format_bytes(max(saved_bytes, 0))}"
+            )
+        
+        if (downgraded > 0 or stats['budget_total'] is not None) and stats['budget_fits']:
             self.report({'INFO'}, msg)
         else:
             self.report({'WARNING'}, msg)
         
         # Log activity
         from ..utils.activity_logger import log_activity
-        target = f"{target_size}px"
-        details = f"Target: {target} | Processed: {downgraded}"
+        if self.resolution == 'BUDGET':
+            target = f"budget {self.memory_budget} MB"
+        else:
+            target = f"{stats['target_size']}px"
+        details = f"Target: {target} | Filter: {self.resample_filter} | Processed: {downgraded}"
         if skipped_external > 0:
             details += f" | External: {skipped_external}"
         if skipped_packed > 0:
             details += f" | Packed: {skipped_packed}"
         if errors > 0:
             details += f" | Errors: {errors}"
+        if downgraded > 0:
+            details += f" | Time: {elapsed:.1f}s | Throughput: {megapixels_per_second:.0f} MP/s"
         
         log_activity("DOWNGRADE_RESOLUTION", details, context)
         
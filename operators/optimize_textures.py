@@ -3,13 +3,32 @@ import os
 from collections import defaultdict
 
 class ASSET_OT_optimize_texture_duplicates(bpy.types.Operator):
-    """Merge duplicate images that reference the same file path into a single image."""
+    """Merge duplicate images (same file path or identical file content) into a single image."""
     bl_idname = "asset.optimize_texture_duplicates"
     bl_label = "Optimize Texture Duplicates"
-    bl_description = "Merge duplicate textures (same file path) into single texture"
+    bl_description = "Merge duplicate textures (same file path or byte-identical files) into single texture"
     bl_options = {'REGISTER', 'UNDO'}
 
+    match_mode: bpy.props.EnumProperty(
+        name="Match",
+        items=[
+            ('CONTENT', "Same Content", "Byte-identical files under any name or folder (includes same path)"),
+            ('PATH', "Same Path", "Only images whose file path is identical"),
+            ('SIMILAR', "Similar Look", "Perceptually similar images (other format or resolution); merged onto the best quality one")
+        ],
+        default='CONTENT'
+    )
+
+    similarity_threshold: bpy.props.IntProperty(
+        name="Similarity Threshold",
+        description="Max fingerprint difference in bits (of 64) for Similar Look - lower is stricter",
+        default=5,
+        min=0,
+        max=16
+    )
+
     duplicate_groups = []
+    identical_file_count = 0
 
     def get_sort_key(self, img):
         """Return a sort key for image selection.
@@ -23,12 +42,105 @@ class ASSET_OT_optimize_texture_duplicates(bpy.types.Operator):
 
     def find_duplicates(self, context):
         """Find groups of images that share identical filepaths (external images only)."""
+        if self.match_mode == 'CONTENT':
+            return self.find_content_duplicates(context)
+        if self.match_mode == 'SIMILAR':
+            return self.find_similar_duplicates(context)
+
         image_groups = defaultdict(list)
         for img in bpy.data.images:
             if img.filepath:
                 image_groups[img.filepath].append(img)
         return [images for images in image_groups.values() if len(images) > 1]
 
+    def get_file_images(self):
+        """(image, absolute path) of local, unpacked, non-UDIM images whose file exists"""
+        from ..utils.scene_index import get_scene_index
+
+        images = []
+        for record in get_scene_index().images.values():
+            if record.source != 'FILE' or record.packed or record.library or not record.abs_path:
+                continue
+            if '<UDIM>' in record.abs_path or not os.path.isfile(record.abs_path):
+                continue
+            img = bpy.data.images.get(record.name)
+            if img is not None:
+                images.append((img, record.abs_path))
+        return images
+
+    def find_content_duplicates(self, context):
+        """Find groups of images whose files are byte-identical, wherever they are."""
+        from ..utils.duplicate_finder import find_identical_files
+        from ..utils.texture_utils import get_project_texture_cache
+
+        images_by_path = defaultdict(list)
+        for img, abs_path in self.get_file_images():
+            images_by_path[os.path.normcase(abs_path)].append((abs_path, img))
+
+        paths = [entries[0][0] for entries in images_by_path.values()]
+        cache = get_project_texture_cache()
+        file_groups = find_identical_files(paths, cache)
+        cache.save()
+
+        self.identical_file_count = sum(len(group) - 1 for group in file_groups)
+
+        # Paths not in any content group can still be shared by several images
+        path_groups = [[os.path.normcase(path) for path in group] for group in file_groups]
+        grouped = set(key for group in path_groups for key in group)
+        path_groups.extend([key] for key in images_by_path if key not in grouped)
+
+        groups = []
+        for keys in path_groups:
+            # Same pixels only merge if they are interpreted the same way
+            by_settings = defaultdict(list)
+            for key in keys:
+                for abs_path, img in images_by_path[key]:
+                    by_settings[(img.colorspace_settings.name, img.alpha_mode)].append(img)
+            groups.extend(images for images in by_settings.values() if len(images) > 1)
+        return groups
+
+    def find_similar_duplicates(self, context):
+        """Find clusters of perceptually similar images; best quality image first."""
+        from ..utils.image_fingerprint import cluster_fingerprints
+        from ..utils.texture_utils import (
+            compute_image_fingerprint, get_image_resolution, get_project_texture_cache
+        )
+
+        cache = get_project_texture_cache()
+        candidates = self.get_file_images()
+
+        wm = context.window_manager
+        wm.progress_begin(0, max(len(candidates), 1))
+        items = []
+        quality = {}
+        try:
+            for index, (img, abs_path) in enumerate(candidates):
+                wm.progress_update(index)
+                # Decoded once per file version, then read from the cache
+                fingerprint = cache.get_fingerprint(abs_path, lambda img=img: compute_image_fingerprint(img))
+                if fingerprint is None:
+                    continue
+
+                width, height = get_image_resolution(img, cache)
+                if width == 0 or height == 0:
+                    continue
+
+                info = cache.get_info(abs_path)
+                lossy = info is not None and info.format in ('JPEG', 'WEBP')
+                bit_depth = info.bit_depth if info is not None and info.bit_depth else 8
+                quality[img.name] = (-(width * height), lossy, -bit_depth, self.get_sort_key(img))
+
+                # Only compare images with the same aspect ratio and interpretation
+                group = (round(width / height, 2), img.colorspace_settings.name, img.alpha_mode)
+                items.append((img.name, group, fingerprint))
+        finally:
+            wm.progress_end()
+            cache.save()
+
+        # Clusters are built around the best image, which stays first
+        clusters = cluster_fingerprints(items, self.similarity_threshold, sort_key=quality.get)
+        return [[bpy.data.images[name] for name in names] for names in clusters]
+
     def invoke(self, context, event):
         self.duplicate_groups = self.find_duplicates(context)
         if not self.duplicate_groups:
@@ -46,6 +158,11 @@ class ASSET_OT_optimize_texture_duplicates(bpy.types.Operator):
         box = layout.box()
         box.label(text=f"🖼️ Found {total_groups} duplicate group(s)", icon='INFO')
         box.label(text=f"Total {total_duplicates} texture(s) will be merged", icon='TEXTURE')
+        if self.match_mode == 'CONTENT' and self.identical_file_count:
+            box.label(text=f"{self.identical_file_count} identical file(s) under different names", icon='DUPLICATE')
+        if self.match_mode == 'SIMILAR':
+            box.label(text="Similar, not identical - review before merging", icon='ERROR')
+            box.label(text="Base = highest resolution / lossless member", icon='INFO')
         
         layout.separator()
         
@@ -112,15 +229,17 @@ class ASSET_OT_optimize_texture_duplicates(bpy.types.Operator):
     def execute(self, context):
         textures_removed = 0
         for group in self.duplicate_groups:
-            images_sorted = sorted(group, key=self.get_sort_key)
+            # Similar groups are already ordered by quality
+            if self.match_mode == 'SIMILAR':
+                images_sorted = group
+            else:
+                images_sorted = sorted(group, key=self.get_sort_key)
             main_image = images_sorted[0]
 
             for img in images_sorted[1:]:
-                for material in bpy.data.materials:
-                    if material.use_nodes:
-                        for node in material.node_tree.nodes:
-                            if node.type == 'TEX_IMAGE' and node.image == img:
-                                node.image = main_image
+                # Remaps every user (material and group nodes, worlds, brushes)
+                # without scanning all materials per duplicate
+                img.user_remap(main_image)
                 bpy.data.images.remove(img)
                 textures_removed += 1
 
@@ -0,0 +1,280 @@
+import bpy
+import os
+
+from .auto_correct_maps import TEXTURE_OT_AutoCorrectMaps
+
+
+# ORM channel order (glTF / Unreal convention)
+ORM_CHANNELS = (
+    ('ao', 'Red'),
+    ('roughness', 'Green'),
+    ('metallic', 'Blue'),
+)
+
+# Principled BSDF inputs used to identify maps not named by SOP rules
+PRINCIPLED_ROLES = {
+    'Roughness': 'roughness',
+    'Metallic': 'metallic',
+}
+
+PRINCIPLED_SOCKETS = {role: socket for socket, role in PRINCIPLED_ROLES.items()}
+
+
+class TEXTURE_OT_PackORM(bpy.types.Operator):
+    """Pack grayscale AO, roughness and metallic maps into one ORM texture per material."""
+    bl_idname = "texture.pack_orm"
+    bl_label = "Pack ORM Maps"
+    bl_description = "Pack AO/roughness/metallic maps into a single ORM texture (R=AO, G=Roughness, B=Metallic) and rewire materials"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Please save the .blend file first")
+            return {'CANCELLED'}
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="R = AO | G = Roughness | B = Metallic", icon='INFO')
+        layout.label(text="Source maps stay on disk unchanged (undo with Ctrl+Z)", icon='INFO')
+        layout.separator()
+        layout.label(text="Needs 2+ grayscale maps per material", icon='INFO')
+        layout.label(text="Note: Packed, linked & UDIM textures will be skipped", icon='INFO')
+
+    def find_orm_nodes(self, material):
+        """
+        Map roles to image texture nodes of a material.
+
+        Returns:
+            tuple: ({role: [nodes sharing one image]}, principled node),
+                or (None, reason) if not packable
+        """
+        nodes = material.node_tree.nodes
+        principled = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        if principled is None:
+            return None, "no Principled BSDF"
+
+        roles = {}
+        for node in nodes:
+            if node.type != 'TEX_IMAGE' or not node.image:
+                continue
+
+            parts, map_index, role = TEXTURE_OT_AutoCorrectMaps.find_map_part(node.image.name)
+            if role not in dict(ORM_CHANNELS):
+                role = None
+                for link in node.outputs['Color'].links:
+                    if link.to_node == principled and link.to_socket.name in PRINCIPLED_ROLES:
+                        role = PRINCIPLED_ROLES[link.to_socket.name]
+                        break
+            if role is None:
+                continue
+
+            if role in roles and roles[role][0].image != node.image:
+                return None, f"several {role} maps"
+            roles.setdefault(role, []).append(node)
+
+        if len(roles) < 2:
+            return None, None
+
+        for role, role_nodes in roles.items():
+            img = role_nodes[0].image
+            if img.source != 'FILE' or img.packed_file or img.library:
+                return None, f"{role} map is not a local file"
+            if any(node.outputs['Alpha'].is_linked for node in role_nodes):
+                return None, f"{role} map alpha is used"
+
+        return roles, principled
+
+    def execute(self, context):
+        from ..utils.texture_utils import get_project_texture_cache
+
+        cache = get_project_texture_cache()
+        packed_images = {}
+        originals = set()
+        packed = 0
+        skipped = 0
+        errors = 0
+
+        for material in bpy.data.materials:
+            if material.library or not material.use_nodes or not material.node_tree:
+                continue
+
+            roles, principled = self.find_orm_nodes(material)
+            if roles is None:
+                if principled:
+                    skipped += 1
+                    print(f"Pack ORM: skipped {material.name} ({principled})")
+                continue
+
+            # Materials sharing the same maps share one ORM texture
+            key = tuple(roles[role][0].image.name if role in roles else None for role, channel in ORM_CHANNELS)
+            try:
+                if key not in packed_images:
+                    packed_images[key] = self.build_orm_image(roles, principled, cache)
+                orm_image = packed_images[key]
+            except Exception as e:
+                packed_images[key] = None
+                errors += 1
+                self.report({'WARNING'}, f"Could not pack ORM for {material.name}: {str(e)}")
+                continue
+
+            if orm_image is None:
+                skipped += 1
+                continue
+
+            for role_nodes in roles.values():
+                originals.add(role_nodes[0].image)
+            self.rewire_material(material, roles, orm_image)
+            packed += 1
+
+        cache.save()
+
+        removed = 0
+        for img in originals:
+            # Source files stay on disk - other .blend files may still use them
+            if img.users == 0:
+                bpy.data.images.remove(img)
+                removed += 1
+
+        textures_created = sum(1 for img in packed_images.values() if img is not None)
+        msg = f"Packed: {packed} material(s) | ORM textures: {textures_created} | Maps removed: {removed}"
+        if skipped > 0:
+            msg += f" | Skipped: {skipped}"
+        if errors > 0:
+            msg += f" | Errors: {errors}"
+
+        self.report({'INFO'} if packed > 0 else {'WARNING'}, msg)
+
+        # Log activity
+        from ..utils.activity_logger import log_activity
+        details = f"Materials: {packed} | ORM: {textures_created} | Removed: {removed}"
+        if skipped > 0:
+            details += f" | Skipped: {skipped}"
+        if errors > 0:
+            details += f" | Errors: {errors}"
+        log_activity("PACK_ORM", details, context)
+
+        return {'FINISHED'}
+
+    def build_orm_image(self, roles, principled, cache):
+        """
+        Pack the role maps into a new 8-bit PNG next to the project textures.
+
+        Returns:
+            bpy.types.Image, or None if a map is not grayscale
+        """
+        import numpy as np
+        from ..utils.image_resample import FILTER_BILINEAR, resample
+        from ..utils.texture_utils import get_pixel_flags, read_image_pixels
+
+        channels = {}
+        for role, role_nodes in roles.items():
+            img = role_nodes[0].image
+            abs_path = bpy.path.abspath(img.filepath_raw)
+
+            # Cached flags let known color maps be skipped without decoding
+            flags = cache.get_pixel_flags(abs_path, lambda: None)
+            if flags is not None and not flags[1]:
+                print(f"Pack ORM: {img.name} is not grayscale")
+                return None
+
+            pixels = read_image_pixels(img)
+            if pixels is None:
+                raise RuntimeError(f"{img.name} has no pixels")
+            uniform, grayscale, opaque = get_pixel_flags(pixels)
+            cache.set_pixel_flags(abs_path, uniform, grayscale, opaque)
+            if not grayscale:
+                print(f"Pack ORM: {img.name} is not grayscale")
+                return None
+
+            channels[role] = pixels[:, :, 0]
+
+        height, width = max(channel.shape for channel in channels.values())
+        orm = np.ones((height, width, 4), dtype=np.float32)
+        for index, (role, channel_name) in enumerate(ORM_CHANNELS):
+            if role in channels:
+                channel = channels[role]
+                if channel.shape != (height, width):
+                    channel = resample(channel[:, :, None], width, height, FILTER_BILINEAR)[:, :, 0]
+                orm[:, :, index] = channel
+            elif role != 'ao':
+                # Missing map - bake the material's current value
+                orm[:, :, index] = principled.inputs[PRINCIPLED_SOCKETS[role]].default_value
+
+        first = self.get_first_node(roles)
+        target_path = self.get_orm_path(first.image)
+
+        orm_image = bpy.data.images.new(
+            os.path.splitext(os.path.basename(target_path))[0], width, height, alpha=False
+        )
+        orm_image.colorspace_settings.name = 'Non-Color'
+        orm_image.pixels.foreach_set(orm.ravel())
+        orm_image.filepath_raw = target_path
+        orm_image.file_format = 'PNG'
+        orm_image.save()
+        orm_image.source = 'FILE'
+        orm_image.filepath = bpy.path.relpath(target_path)
+        return orm_image
+
+    def get_first_node(self, roles):
+        """Node the ORM texture is named after and placed at"""
+        for role in ('roughness', 'metallic', 'ao'):
+            if role in roles:
+                return roles[role][0]
+
+    def get_orm_path(self, image):
+        """ORM file path: map token replaced by 'orm', saved in the project textures folder"""
+        parts, map_index, role = TEXTURE_OT_AutoCorrectMaps.find_map_part(image.name)
+        if map_index >= 0:
+            parts[map_index] = "orm"
+            name = '_'.join(parts)
+        else:
+            name = bpy.path.clean_name(os.path.splitext(image.name)[0]) + "_orm"
+
+        source_dir = os.path.dirname(bpy.path.abspath(image.filepath_raw))
+        textures_dir = os.path.join(os.path.dirname(bpy.data.filepath), "textures")
+        target_dir = textures_dir if os.path.isdir(textures_dir) else source_dir
+
+        target_path = os.path.join(target_dir, name + ".png")
+        counter = 1
+        while os.path.exists(target_path):
+            target_path = os.path.join(target_dir, f"{name}_{counter:02d}.png")
+            counter += 1
+        return target_path
+
+    def rewire_material(self, material, roles, orm_image):
+        """Replace role texture nodes by one ORM texture through a Separate Color node"""
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+        first = self.get_first_node(roles)
+
+        orm_node = nodes.new('ShaderNodeTexImage')
+        orm_node.image = orm_image
+        orm_node.location = first.location
+        orm_node.interpolation = first.interpolation
+        orm_node.projection = first.projection
+        orm_node.extension = first.extension
+        orm_node.label = "ORM"
+
+        separate = nodes.new('ShaderNodeSeparateColor')
+        separate.location = (first.location.x + 300, first.location.y)
+        links.new(orm_node.outputs['Color'], separate.inputs['Color'])
+
+        vector_links = first.inputs['Vector'].links
+        if vector_links:
+            links.new(vector_links[0].from_socket, orm_node.inputs['Vector'])
+
+        for role, channel_name in ORM_CHANNELS:
+            for node in roles.get(role, []):
+                for link in list(node.outputs['Color'].links):
+                    links.new(separate.outputs[channel_name], link.to_socket)
+                nodes.remove(node)
+
+
+def register():
+    bpy.utils.register_class(TEXTURE_OT_PackORM)
+
+
+def unregister():
+    bpy.utils.unregister_class(TEXTURE_OT_PackORM)
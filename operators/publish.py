@@ -18,11 +18,32 @@ import os
 import shutil
 import glob
 import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import getpass
-from bpy.props import StringProperty, BoolProperty, IntProperty, CollectionProperty, EnumProperty
+from bpy.props import StringProperty, BoolProperty, IntProperty, FloatProperty, CollectionProperty, EnumProperty
 from bpy.types import PropertyGroup
 
+from ..utils.blend_reader import BlendReadError, get_image_paths, get_library_paths
+from ..utils.copy_engine import link_or_copy, break_hardlink
+from ..utils.file_compare import files_identical
+from ..utils.publish_paths import get_master_structure, get_master_target_path
+from ..utils.publish_registry import update_publish_registry
+from ..utils.publish_staging import FSYNC_FILES, PublishRollback, PublishStaging, cleanup_stale_staging
+from ..utils.texture_utils import normalize_udim
+from ..utils.texture_lod import LOD_FOLDER, is_lod_path, split_lod_path
+from ..utils.version_allocator import (
+    allocate_version, get_version_name, release_version
+)
+from ..utils.publish_manifest import (
+    ROLE_MASTER, ROLE_TEXTURE, ROLE_LIBRARY, ROLE_LIBRARY_TEXTURE,
+    build_file_entry, find_previous_manifest, get_known_hashes, get_manifest_path,
+    lookup_known_hash, read_manifest, write_manifest
+)
+
 
 # =============================================================================
 # DATA CLASSES & PROPERTY GROUPS
@@ -178,7 +199,10 @@ class PathResolver:
 
 class CircularDependencyError(Exception):
     """Custom exception for circular library dependencies"""
-    pass
+    
+    def __init__(self, message, chain=None):
+        super().__init__(message)
+        self.chain = chain or []
 
 
 class LinkedLibraryScanner:
@@ -223,8 +247,90 @@ class LinkedLibraryScanner:
         return self.libraries
     
     def scan_recursive(self, blend_file_path, current_depth=0):
-        """Recursively scan nested libraries (requires opening files - slow)"""
-        pass
+        """
+        Scan nested libraries breadth-first, down to max_depth levels
+        
+        Only the LI blocks of each .blend are read (utils/blend_reader.py,
+        cached per path/size/mtime) - no file is loaded into the session.
+        
+        Returns:
+            list: lib_info dicts (as scan()) with 'depth' and 'parent'
+        
+        Raises:
+            CircularDependencyError: A library links back to one of its parents
+        """
+        root = os.path.normpath(os.path.abspath(blend_file_path))
+        root_key = os.path.normcase(root)
+        self.visited.add(root_key)
+        
+        links = {}
+        queue = deque([(root, current_depth)])
+        
+        while queue:
+            filepath, depth = queue.popleft()
+            if depth >= self.max_depth:
+                continue
+            
+            parent_key = os.path.normcase(filepath)
+            try:
+                library_paths = get_library_paths(filepath)
+            except BlendReadError as e:
+                print(f"Cannot read libraries of {os.path.basename(filepath)}: {e}")
+                continue
+            
+            links[parent_key] = [os.path.normcase(path) for path in library_paths]
+            
+            for lib_path in library_paths:
+                lib_key = os.path.normcase(lib_path)
+                if lib_key in self.visited:
+                    continue
+                self.visited.add(lib_key)
+                
+                lib_info = self.path_resolver.extract_structure_from_link(lib_path)
+                lib_info['exists'] = os.path.exists(lib_info['absolute'])
+                lib_info['has_textures'] = os.path.exists(lib_info['textures_dir'])
+                lib_info['depth'] = depth + 1
+                lib_info['library_name'] = os.path.basename(lib_path)
+                lib_info['parent'] = filepath
+                self.libraries.append(lib_info)
+                
+                if lib_info['exists']:
+                    queue.append((lib_path, depth + 1))
+        
+        cycle = self.find_cycle(links, root_key)
+        if cycle:
+            names = " → ".join(os.path.basename(path) for path in cycle)
+            raise CircularDependencyError(f"Circular dependency: {names}", chain=cycle)
+        
+        return self.libraries
+    
+    @staticmethod
+    def find_cycle(links, start):
+        """Return the first cycle reachable from start in {file: [linked files]}, or None"""
+        in_progress = []
+        done = set()
+        stack = [(start, iter(links.get(start, ())))]
+        in_progress.append(start)
+        
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            
+            if child is None:
+                stack.pop()
+                in_progress.pop()
+                done.add(node)
+                continue
+            
+            if child in in_progress:
+                return in_progress[in_progress.index(child):] + [child]
+            if child in done:
+                continue
+            
+            in_progress.append(child)
+            stack.append((child, iter(links.get(child, ()))))
+        
+        return None
 
 
 # =============================================================================
@@ -247,6 +353,21 @@ class ASSET_OT_Publish(bpy.types.Operator):
     is_forced = False
     libraries_to_publish = []
     
+    _prepared = False
+    _timer = None
+    _engine = None
+    _publish_state = {}
+    _publish_start = 0.0
+    _skipped_files = 0
+    _stats_lock = threading.Lock()
+    _known_hashes = {}
+    _manifest_files = []
+    _timings = {}
+    _staging = None
+    _rollback = None
+    _reservations = []
+    _deferred_promote = []
+    
     def write_publish_log(self, publish_path, asset_path, target_path, texture_count, status, notes=""):
         """Write to centralized publish log"""
         log_file = os.path.join(publish_path, ".publish_activity.log")
@@ -273,6 +394,9 @@ class ASSET_OT_Publish(bpy.types.Operator):
                 f.write(log_entry)
         except Exception as e:
             print(f"Warning: Could not write to log: {e}")
+            return
+        
+        update_publish_registry(log_file)
     
     def get_asset_name(self):
         """Get asset name from parent folder of .blend file"""
@@ -344,37 +468,12 @@ class ASSET_OT_Publish(bpy.types.Operator):
     
     def get_used_textures(self):
         """Get list of textures actually used in the blend file"""
-        used_textures = set()
-        
-        def normalize_udim(path):
-            """Match Blender's UDIM detection: any 4-digit number in standard range (1001-1100)"""
-            udim_pattern = r'\b(\d{4})\b'
-            match = re.search(udim_pattern, path)
-            
-            if match:
-                tile_num = int(match.group(1))
-                if 1001 <= tile_num <= 1100:
-                    return path.replace(match.group(1), '<UDIM>', 1)
-            
-            return path
+        from ..utils.scene_index import get_scene_index
         
-        for img in bpy.data.images:
-            if img.name in ('Render Result', 'Viewer Node'):
-                continue
-            if img.source != 'FILE':
-                continue
-            if img.packed_file:
-                continue
-            
-            try:
-                abs_path = bpy.path.abspath(img.filepath)
-                norm_path = os.path.normpath(abs_path)
-                norm_path = normalize_udim(norm_path)
-                used_textures.add(norm_path)
-            except Exception:
-                continue
-        
-        return used_textures
+        # File images only (linked included, packed skipped) - shared scene index
+        return get_scene_index().get_used_texture_paths(
+            include_material_nodes=False, include_library=True, include_packed=False
+        )
     
     def scan_textures_folder(self, textures_dir):
         """Scan textures folder recursively and categorize files"""
@@ -385,8 +484,8 @@ class ASSET_OT_Publish(bpy.types.Operator):
         
         all_files = []
         for root, dirs, files in os.walk(textures_dir):
-            # Skip hidden folders (.backup, .trash)
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            # Skip hidden folders (.backup, .trash) - but keep .lod, images may point into it
+            dirs[:] = [d for d in dirs if not d.startswith('.') or d == LOD_FOLDER]
             
             for file in files:
                 ext = file.rsplit('.', 1)[-1].lower() if '.' in file else ''
@@ -394,6 +493,8 @@ class ASSET_OT_Publish(bpy.types.Operator):
                     all_files.append(os.path.join(root, file))
         
         used_textures = self.get_used_textures()
+        # A used LOD variant keeps its source so the publish can switch back to Full
+        used_textures |= {split_lod_path(path)[0] for path in used_textures if is_lod_path(path)}
         
         textures_to_copy = []
         unused_files = []
@@ -416,28 +517,28 @@ class ASSET_OT_Publish(bpy.types.Operator):
             
             if norm_path in used_textures:
                 textures_to_copy.append(file_path)
-            else:
+            elif not is_lod_path(file_path):
+                # Unused LOD variants are a rebuildable cache, not unused files
                 unused_files.append(file_path)
         
         return textures_to_copy, unused_files
     
     def get_target_path(self, context):
-        """Get target publish path with versioning"""
-        publish_path = context.scene.publish_path
-        base_path = os.path.join(publish_path, self.asset_name)
-        
-        if context.scene.publish_versioning_mode == 'OVERWRITE':
-            return base_path
-        
-        version_num = 1
-        while True:
-            versioned_path = f"{base_path}_v{version_num:03d}"
-            if not os.path.exists(versioned_path):
-                return versioned_path
-            version_num += 1
+        """Get target publish path of the master blend (next version number is a preview)"""
+        return get_master_target_path(
+            context.scene.publish_path,
+            bpy.data.filepath,
+            [lib_info['filepath'] for lib_info in self.libraries_to_publish],
+            versioning=context.scene.publish_versioning_mode == 'VERSIONING'
+        )
     
-    def relink_external_libraries(self, blend_file_path, published_libraries, publish_root, context):
-        """Relink external libraries in published blend file to use new relative paths"""
+    def relink_external_libraries(self, blend_file_path, published_libraries, publish_root, context,
+                                  published_dir=None):
+        """
+        Relink external libraries in published blend file to use new relative paths
+        
+        published_dir: Final folder of the blend when blend_file_path is a staged copy
+        """
         try:
             from bpy_extras import blendfile
             
@@ -456,7 +557,10 @@ class ASSET_OT_Publish(bpy.types.Operator):
                 return 0
             
             print(f"\nRelinking libraries in: {blend_file_path}")
-            published_file_dir = os.path.dirname(blend_file_path)
+            published_file_dir = published_dir or os.path.dirname(blend_file_path)
+            
+            # Incremental publish may hardlink versions - never edit a shared file
+            break_hardlink(blend_file_path)
             
             with blendfile.open_blend(blend_file_path, mode='r+b') as blend:
                 for block in blend.blocks:
@@ -495,7 +599,9 @@ class ASSET_OT_Publish(bpy.types.Operator):
             
         except ImportError:
             print("⚠ Low-level blendfile library not available, using fallback method")
-            return self._relink_by_opening_file(blend_file_path, published_libraries, publish_root, context)
+            return self._relink_by_opening_file(
+                blend_file_path, published_libraries, publish_root, context, published_dir
+            )
             
         except Exception as e:
             print(f"⚠ Warning: Failed to relink libraries: {e}")
@@ -503,7 +609,8 @@ class ASSET_OT_Publish(bpy.types.Operator):
             traceback.print_exc()
             return 0
     
-    def _relink_by_opening_file(self, blend_file_path, published_libraries, publish_root, context):
+    def _relink_by_opening_file(self, blend_file_path, published_libraries, publish_root, context,
+                                published_dir=None):
         try:
             import bpy
             
@@ -522,7 +629,7 @@ class ASSET_OT_Publish(bpy.types.Operator):
             print(f"Opening file for relink (fallback method): {blend_file_path}")
             bpy.ops.wm.open_mainfile(filepath=blend_file_path)
             
-            published_file_dir = os.path.dirname(blend_file_path)
+            published_file_dir = published_dir or os.path.dirname(blend_file_path)
             for lib in bpy.data.libraries:
                 lib_folder_name = os.path.basename(os.path.dirname(bpy.path.abspath(lib.filepath)))
                 
@@ -555,46 +662,75 @@ class ASSET_OT_Publish(bpy.types.Operator):
     
     def publish_master_file(self, source_path, target_folder, context):
         """Publish master file with versioning support (overwrite or increment)"""
-        os.makedirs(target_folder, exist_ok=True)
-        
         base_filename = os.path.basename(source_path)
         name_without_ext = os.path.splitext(base_filename)[0]
+        incremental = context.scene.publish_incremental
         
         if context.scene.publish_versioning_mode == 'VERSIONING':
-            version_num = 1
-            while True:
-                versioned_name = f"{name_without_ext}_v{version_num:03d}.blend"
-                versioned_path = os.path.join(target_folder, versioned_name)
-                if not os.path.exists(versioned_path):
-                    published_path = versioned_path
-                    break
-                version_num += 1
+            # Claim number atomically - concurrent publishers never share a version
+            # Reservation is released when the publish finishes (after promote)
+            version_num, published_path, reservation = allocate_version(
+                target_folder, name_without_ext, '.blend'
+            )
+            self._reservations.append(reservation)
             
-            self.copy_blend_file_with_cleanup(source_path, published_path)
+            previous_path = None
+            if version_num > 1:
+                previous_path = os.path.join(
+                    target_folder, get_version_name(name_without_ext, version_num - 1, '.blend')
+                )
+            
+            previous_hash = lookup_known_hash(self._known_hashes, previous_path) if previous_path else None
+            if incremental and previous_path and files_identical(source_path, previous_path, previous_hash):
+                # Unchanged since last version - share data with previous version
+                if link_or_copy(previous_path, self.write_path(published_path)):
+                    print(f"✓ Unchanged, hardlinked from: {os.path.basename(previous_path)}")
+                self._skipped_files += 1
+            else:
+                self.copy_blend_file_with_cleanup(source_path, published_path)
             
             if context.scene.publish_sync_to_master:
                 master_path = os.path.join(target_folder, base_filename)
-                self.copy_blend_file_with_cleanup(source_path, master_path)
-                print(f"✓ Auto-synced to master: {master_path}")
+                self._deferred_promote.append(master_path)
+                if incremental and files_identical(source_path, master_path):
+                    print(f"✓ Master unchanged, skipped sync: {master_path}")
+                    self._skipped_files += 1
+                else:
+                    self.copy_blend_file_with_cleanup(source_path, master_path)
+                    print(f"✓ Auto-synced to master: {master_path}")
         else:
             published_path = os.path.join(target_folder, base_filename)
-            self.copy_blend_file_with_cleanup(source_path, published_path)
+            if incremental and files_identical(source_path, published_path):
+                print(f"✓ Master file unchanged, skipped: {published_path}")
+                self._skipped_files += 1
+            else:
+                self.copy_blend_file_with_cleanup(source_path, published_path)
         
         return published_path
     
-    def publish_linked_library(self, lib_info, context):
-        """Publish linked library with structure mirroring"""
+    def publish_linked_library(self, lib_info, publish_root, incremental=False):
+        """
+        Publish linked library with structure mirroring
+        
+        Runs on a library worker thread - must not touch bpy or context.
+        """
         source_path = lib_info['filepath']
-        publish_root = context.scene.publish_path
         structure = lib_info.get('structure', '')
         folder_name = lib_info.get('folder_name', os.path.basename(os.path.dirname(source_path)))
         
         target_folder = os.path.join(publish_root, structure)
-        os.makedirs(target_folder, exist_ok=True)
         
         base_filename = os.path.basename(source_path)
         target_path = os.path.join(target_folder, base_filename)
-        shutil.copy2(source_path, target_path)
+        
+        target_hash = lookup_known_hash(self._known_hashes, target_path)
+        if incremental and files_identical(source_path, target_path, target_hash):
+            print(f"Library unchanged, skipped: {folder_name}")
+            self.add_skipped(1)
+        else:
+            self.copy_published_file(source_path, target_path)
+        
+        self._manifest_files.append({'path': target_path, 'role': ROLE_LIBRARY, 'source': source_path})
         
         print(f"Published library: {folder_name}")
         print(f"  Source: {source_path}")
@@ -609,12 +745,167 @@ class ASSET_OT_Publish(bpy.types.Operator):
         
         Args:
             source_path: Source .blend file
-            target_path: Destination .blend file
+            target_path: Destination .blend file (final publish path)
         """
-        shutil.copy2(source_path, target_path)
+        self.copy_published_file(source_path, target_path)
+    
+    def write_path(self, final_path):
+        """Path a published file is written to (inside staging folder when staging is on)"""
+        if self._staging is not None:
+            return self._staging.stage_path(final_path)
+        if self._rollback is not None:
+            self._rollback.record(final_path)
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        return final_path
+    
+    def current_path(self, final_path):
+        """Where the newest content of a published file is (staged copy or final path)"""
+        if self._staging is not None:
+            return self._staging.current_path(final_path)
+        return final_path
+    
+    def copy_published_file(self, source_path, final_path):
+        """Copy one file to its publish location (staged and fsync'd when staging is on)"""
+        target = self.write_path(final_path)
+        shutil.copy2(source_path, target)
+        if self._staging is not None:
+            self._staging.sync_file(target)
+        return target
     
-    def copy_library_textures(self, lib_info, target_folder):
-        """Copy textures folder with subdirectories (skips hidden folders)"""
+    def add_skipped(self, count):
+        """Count unchanged files (thread-safe, libraries publish in parallel)"""
+        with self._stats_lock:
+            self._skipped_files += count
+    
+    def publish_library_job(self, lib_info, publish_root, incremental):
+        """
+        Worker job: publish one library blend and its textures
+        
+        Returns:
+            tuple: (published_path, texture_count)
+        """
+        lib_path = self.publish_linked_library(lib_info, publish_root, incremental)
+        tex_count = self.copy_library_textures(
+            lib_info,
+            os.path.dirname(lib_path),
+            incremental=incremental
+        )
+        return lib_path, tex_count
+    
+    def publish_library_group(self, indices, publish_root, incremental):
+        """
+        Worker job: publish libraries sharing one target folder, one after another
+        
+        Libraries in the same folder copy into the same textures/ files, so
+        they must not run concurrently.
+        
+        Returns:
+            list: [(index, (published_path, texture_count) or None, error or None), ...]
+        """
+        outcomes = []
+        for index in indices:
+            try:
+                result = self.publish_library_job(self.libraries_to_publish[index], publish_root, incremental)
+                outcomes.append((index, result, None))
+            except Exception as e:
+                outcomes.append((index, None, e))
+        return outcomes
+    
+    def publish_libraries(self, context, publish_path):
+        """
+        Publish all linked libraries on a thread pool.
+        
+        Libraries are grouped by target folder; groups run in parallel, the
+        libraries of one group in sequence. Workers only copy files; reports
+        and activity log entries are written here on the main thread as each
+        group finishes. Returns after every library job is done, so the
+        master publish and relink see all results.
+        
+        Returns:
+            list: Published library dicts in the order of libraries_to_publish
+        """
+        from ..utils.activity_logger import log_activity
+        
+        if not self.libraries_to_publish:
+            return []
+        
+        incremental = context.scene.publish_incremental
+        results = [None] * len(self.libraries_to_publish)
+        
+        groups = {}
+        for index, lib_info in enumerate(self.libraries_to_publish):
+            target_folder = os.path.join(publish_path, lib_info.get('structure', ''))
+            groups.setdefault(os.path.normcase(os.path.normpath(target_folder)), []).append(index)
+        
+        max_workers = min(self.get_library_workers(context), len(groups))
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="publish-lib") as executor:
+            futures = [
+                executor.submit(self.publish_library_group, indices, publish_path, incremental)
+                for indices in groups.values()
+            ]
+            
+            for future in as_completed(futures):
+                for index, result, error in future.result():
+                    lib_info = self.libraries_to_publish[index]
+                    
+                    if error is None:
+                        lib_path, tex_count = result
+                        results[index] = {
+                            'name': lib_info['folder_name'],
+                            'path': lib_path,
+                            'structure': lib_info['structure'],
+                            'source': lib_info['filepath']
+                        }
+                        
+                        self.report({'INFO'}, f"Published library: {lib_info['folder_name']}")
+                        
+                        log_activity(
+                            "PUBLISH_LIBRARY",
+                            f"{lib_info['folder_name']} | Structure: {lib_info['structure']} | Textures: {tex_count} | Status: SUCCESS",
+                            context
+                        )
+                    else:
+                        self.report({'WARNING'}, f"Failed to publish library {lib_info['folder_name']}: {str(error)}")
+                        
+                        log_activity(
+                            "PUBLISH_LIBRARY",
+                            f"{lib_info['folder_name']} | Structure: {lib_info['structure']} | Status: FAILED - {str(error)}",
+                            context
+                        )
+        
+        return [lib for lib in results if lib is not None]
+    
+    def get_library_used_textures(self, library_path):
+        """
+        Get textures used by a library .blend without opening it
+        
+        Image blocks are read with utils/blend_reader.py; UDIM tiles are matched
+        through normalize_udim like scan_textures_folder does for the master.
+        
+        Returns:
+            set or None: Normalized texture keys, None if the file cannot be read
+        """
+        try:
+            image_paths = get_image_paths(library_path)
+        except BlendReadError as e:
+            print(f"  Could not read images of {os.path.basename(library_path)}: {e}")
+            return None
+        
+        used_textures = set()
+        for image_path in image_paths:
+            if '<UDIM>' not in image_path:
+                image_path = normalize_udim(image_path)
+            used_textures.add(os.path.normcase(image_path))
+        return used_textures
+    
+    def copy_library_textures(self, lib_info, target_folder, incremental=False):
+        """
+        Copy used textures with subdirectories (skips hidden folders, unused and unchanged files)
+        
+        Falls back to copying the whole textures folder if the library's image
+        blocks cannot be read.
+        """
         source_lib_dir = os.path.dirname(lib_info['filepath'])
         source_textures_dir = os.path.join(source_lib_dir, 'textures')
         
@@ -623,9 +914,11 @@ class ASSET_OT_Publish(bpy.types.Operator):
             return
         
         target_textures_dir = os.path.join(target_folder, 'textures')
-        os.makedirs(target_textures_dir, exist_ok=True)
+        used_textures = self.get_library_used_textures(lib_info['filepath'])
         
         copied_count = 0
+        skipped_count = 0
+        unused_count = 0
         for root, dirs, files in os.walk(source_textures_dir):
             dirs[:] = [d for d in dirs if not d.startswith('.')]
             rel_path = os.path.relpath(root, source_textures_dir)
@@ -634,7 +927,6 @@ class ASSET_OT_Publish(bpy.types.Operator):
                 target_dir = target_textures_dir
             else:
                 target_dir = os.path.join(target_textures_dir, rel_path)
-                os.makedirs(target_dir, exist_ok=True)
             
             for filename in files:
                 if filename.startswith('.'):
@@ -642,24 +934,48 @@ class ASSET_OT_Publish(bpy.types.Operator):
                 
                 source_file = os.path.join(root, filename)
                 target_file = os.path.join(target_dir, filename)
-                shutil.copy2(source_file, target_file)
-                copied_count += 1
-        
-        print(f"  Copied {copied_count} textures")
+                
+                if used_textures is not None:
+                    texture_key = os.path.normcase(normalize_udim(os.path.abspath(source_file)))
+                    if texture_key not in used_textures:
+                        unused_count += 1
+                        continue
+                
+                target_hash = lookup_known_hash(self._known_hashes, target_file)
+                if incremental and files_identical(source_file, target_file, target_hash):
+                    skipped_count += 1
+                else:
+                    self.copy_published_file(source_file, target_file)
+                    copied_count += 1
+                
+                self._manifest_files.append({
+                    'path': target_file,
+                    'role': ROLE_LIBRARY_TEXTURE,
+                    'source': source_file
+                })
+        
+        self.add_skipped(skipped_count)
+        print(f"  Copied {copied_count} textures ({skipped_count} unchanged, {unused_count} unused)")
         return copied_count
     
-    def invoke(self, context, event):
+    def check_can_publish(self, context):
+        """Return an error message if this file cannot be published, else None"""
         if not context.scene.publish_check_done:
-            self.report({'ERROR'}, "Run 'Check Publish' first to validate asset readiness")
-            return {'CANCELLED'}
+            return "Run 'Check Publish' first to validate asset readiness"
         
         if context.scene.publish_is_published_file:
-            self.report({'ERROR'}, "Cannot publish from publish directory! Open the source file instead.")
-            return {'CANCELLED'}
+            return "Cannot publish from publish directory! Open the source file instead."
         
         self.asset_name = self.get_asset_name()
         if not self.asset_name:
-            self.report({'ERROR'}, "Could not determine asset name")
+            return "Could not determine asset name"
+        
+        return None
+    
+    def invoke(self, context, event):
+        error = self.check_can_publish(context)
+        if error:
+            self.report({'ERROR'}, error)
             return {'CANCELLED'}
         
         validation_passed = self.validate_publish(context)
@@ -668,9 +984,12 @@ class ASSET_OT_Publish(bpy.types.Operator):
         if not validation_passed and not self.is_forced:
             return context.window_manager.invoke_props_dialog(self, width=500)
         
-        if self.is_forced and self.validation_warnings:
-            pass
+        self.prepare_publish(context)
         
+        return context.window_manager.invoke_props_dialog(self, width=600)
+    
+    def prepare_publish(self, context):
+        """Collect textures and selected libraries to publish (after validation)"""
         blend_dir = os.path.dirname(bpy.data.filepath)
         textures_dir = os.path.join(blend_dir, "textures")
         
@@ -713,7 +1032,7 @@ class ASSET_OT_Publish(bpy.types.Operator):
             for lib in self.libraries_to_publish:
                 print(f"  - {lib['folder_name']} ({lib['structure']})")
         
-        return context.window_manager.invoke_props_dialog(self, width=600)
+        self._prepared = True
     
     def draw(self, context):
         layout = self.layout
@@ -763,17 +1082,10 @@ class ASSET_OT_Publish(bpy.types.Operator):
         row.label(text=context.scene.publish_path)
         
         target_path = self.get_target_path(context)
-        target_folder = os.path.basename(target_path).replace('.blend', '')
-        
-        # For include libraries, show parent folder like single publish
-        if self.libraries_to_publish:
-            current_folder = os.path.dirname(bpy.data.filepath)
-            parent_folder_name = os.path.basename(current_folder)
-            target_folder = parent_folder_name
         
         row = col.row(align=True)
-        row.label(text="Target Folder:")
-        row.label(text=target_folder)
+        row.label(text="Target:")
+        row.label(text=os.path.relpath(target_path, context.scene.publish_path))
         
         layout.separator()
         
@@ -879,12 +1191,80 @@ class ASSET_OT_Publish(bpy.types.Operator):
         
         if self.libraries_to_publish:
             layout.label(text="  • Linked libraries will be published", icon='BLANK1')
+        
+        if context.scene.publish_incremental:
+            layout.label(text="  • Unchanged files will be skipped (incremental)", icon='BLANK1')
+        
+        if context.scene.publish_use_staging:
+            layout.label(text="  • Files are staged and moved into place when complete", icon='BLANK1')
+    
+    def get_copy_workers(self, context):
+        """Get texture copy worker count from addon preferences"""
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            return prefs.publish_copy_workers
+        except Exception:
+            return 4
+    
+    def get_library_workers(self, context):
+        """Get number of libraries published in parallel from addon preferences"""
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            return prefs.publish_library_workers
+        except Exception:
+            return 4
+    
+    def get_fsync_policy(self, context):
+        """Get staging fsync policy from addon preferences"""
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            return prefs.publish_fsync_policy
+        except Exception:
+            return FSYNC_FILES
+    
+    def release_reservations(self):
+        """Release version numbers claimed by this publish"""
+        for reservation in self._reservations:
+            release_version(reservation)
+        self._reservations = []
+    
+    def discard_staging(self):
+        """Undo an unfinished publish (staging folder or direct writes) and release its version numbers"""
+        if self._staging is not None:
+            self._staging.discard()
+            self._staging = None
+        if self._rollback is not None:
+            self._rollback.rollback()
+            self._rollback = None
+        self.release_reservations()
     
     def execute(self, context):
+        if not self._prepared:
+            # Called without invoke (scripts, batch_publish.py)
+            error = self.check_can_publish(context)
+            if error:
+                self.report({'ERROR'}, error)
+                return {'CANCELLED'}
+            
+            self.validate_publish(context)
+            self.is_forced = context.scene.publish_force
+            if not self.validation_errors:
+                self.prepare_publish(context)
+        
         if self.validation_errors:
             self.report({'ERROR'}, "Cannot publish: fix critical errors first")
             return {'CANCELLED'}
         
+        self._publish_start = time.perf_counter()
+        self._skipped_files = 0
+        self._known_hashes = {}
+        self._manifest_files = []
+        self._timings = {}
+        self._staging = None
+        self._rollback = None
+        self._reservations = []
+        self._deferred_promote = []
+        
         try:
             publish_path = context.scene.publish_path
             
@@ -896,6 +1276,20 @@ class ASSET_OT_Publish(bpy.types.Operator):
                     self.report({'ERROR'}, f"Cannot create publish path: {str(e)}")
                     return {'CANCELLED'}
             
+            removed = cleanup_stale_staging(publish_path)
+            if removed:
+                print(f"Removed {removed} stale staging folders")
+            
+            # Safe publish: write everything to .staging/, promote with renames at the end
+            if context.scene.publish_use_staging:
+                self._staging = PublishStaging(
+                    publish_path, self.asset_name, self.get_fsync_policy(context)
+                )
+                print(f"Staging publish in: {self._staging.stage_dir}")
+            else:
+                # Direct writes - journal them so cancel/failure can undo the run
+                self._rollback = PublishRollback(publish_path, self.asset_name)
+            
             self.report({'INFO'}, "Cleaning blend file...")
             bpy.ops.outliner.orphans_purge(do_recursive=True)
             bpy.ops.wm.save_mainfile()
@@ -904,38 +1298,10 @@ class ASSET_OT_Publish(bpy.types.Operator):
             current_folder = os.path.dirname(current_file)
             current_filename = os.path.basename(current_file)
             
-            current_file_normalized = os.path.abspath(os.path.normpath(current_file))
-            
-            internal_lib_paths = [current_file_normalized]
-            
-            current_drive = os.path.splitdrive(current_file_normalized)[0]
-            for lib_info in self.libraries_to_publish:
-                lib_filepath = lib_info['filepath']
-                lib_filepath_normalized = os.path.abspath(os.path.normpath(lib_filepath))
-                lib_drive = os.path.splitdrive(lib_filepath_normalized)[0]
-                
-                if lib_drive == current_drive:
-                    internal_lib_paths.append(lib_filepath_normalized)
-            
-            if len(internal_lib_paths) > 1:
-                try:
-                    common_root = os.path.commonpath(internal_lib_paths)
-                except ValueError:
-                    common_root = os.path.dirname(current_file_normalized)
-            else:
-                common_root = os.path.dirname(current_file_normalized)
-            
-            rel_path = os.path.relpath(current_file_normalized, common_root)
-            master_structure = os.path.dirname(rel_path)
-            
-            # For single publish (no libraries), add asset folder level
-            if not self.libraries_to_publish or len(self.libraries_to_publish) == 0:
-                asset_folder_name = os.path.basename(current_folder)
-                
-                if not master_structure or master_structure == '.':
-                    master_structure = asset_folder_name
-                elif not master_structure.endswith(asset_folder_name):
-                    master_structure = os.path.join(master_structure, asset_folder_name)
+            # Same structure the target preview shows (utils/publish_paths.py)
+            common_root, master_structure = get_master_structure(
+                current_file, [lib_info['filepath'] for lib_info in self.libraries_to_publish]
+            )
             
             master_target_folder = os.path.join(publish_path, master_structure)
             master_textures_dir = os.path.join(current_folder, "textures")
@@ -945,6 +1311,15 @@ class ASSET_OT_Publish(bpy.types.Operator):
             print(f"  Structure: {master_structure}")
             print(f"  Target: {master_target_folder}")
             
+            # Hashes from the last manifest let incremental checks skip re-reading targets
+            previous_manifest = find_previous_manifest(master_target_folder, current_filename)
+            if previous_manifest:
+                self._known_hashes = get_known_hashes(
+                    read_manifest(previous_manifest),
+                    os.path.dirname(previous_manifest)
+                )
+            
+            stage_start = time.perf_counter()
             library_count = 0
             if context.scene.publish_include_libraries and self.libraries_to_publish:
                 library_count = len(self.libraries_to_publish)
@@ -957,38 +1332,11 @@ class ASSET_OT_Publish(bpy.types.Operator):
                     context
                 )
             
-            published_libraries = []
-            from ..utils.activity_logger import log_activity
+            # Libraries publish in parallel; master waits for all of them
+            published_libraries = self.publish_libraries(context, publish_path)
             
-            for lib_info in self.libraries_to_publish:
-                try:
-                    lib_path = self.publish_linked_library(lib_info, context)
-                    published_libraries.append({
-                        'name': lib_info['folder_name'],
-                        'path': lib_path,
-                        'structure': lib_info['structure'],
-                        'source': lib_info['filepath']
-                    })
-                    
-                    lib_folder = os.path.dirname(lib_path)
-                    tex_count = self.copy_library_textures(lib_info, lib_folder)
-                    
-                    self.report({'INFO'}, f"Published library: {lib_info['folder_name']}")
-                    
-                    log_activity(
-                        "PUBLISH_LIBRARY",
-                        f"{lib_info['folder_name']} | Structure: {lib_info['structure']} | Textures: {tex_count} | Status: SUCCESS",
-                        context
-                    )
-                    
-                except Exception as e:
-                    self.report({'WARNING'}, f"Failed to publish library {lib_info['folder_name']}: {str(e)}")
-                    
-                    log_activity(
-                        "PUBLISH_LIBRARY",
-                        f"{lib_info['folder_name']} | Structure: {lib_info['structure']} | Status: FAILED - {str(e)}",
-                        context
-                    )
+            self._timings['libraries'] = time.perf_counter() - stage_start
+            stage_start = time.perf_counter()
             
             published_path = self.publish_master_file(
                 source_path=current_file,
@@ -996,29 +1344,173 @@ class ASSET_OT_Publish(bpy.types.Operator):
                 context=context
             )
             
-            self.report({'INFO'}, f"Published master file: {os.path.basename(published_path)}")
+            self._timings['master'] = time.perf_counter() - stage_start
             
-            from ..utils.activity_logger import log_activity
+            self.report({'INFO'}, f"Published master file: {os.path.basename(published_path)}")
             
             target_textures = os.path.join(master_target_folder, "textures")
-            os.makedirs(target_textures, exist_ok=True)
+            if self._staging is None:
+                os.makedirs(target_textures, exist_ok=True)
             
-            copied_count = 0
+            # Texture copy runs on worker threads (see utils/copy_engine.py)
+            copy_jobs = []
             if os.path.exists(master_textures_dir) and self.textures_to_copy:
                 for tex_path in self.textures_to_copy:
                     # Preserve subfolder structure (wood/, metal/, etc)
                     rel_path = os.path.relpath(tex_path, master_textures_dir)
                     target_tex = os.path.join(target_textures, rel_path)
-                    
-                    # Create subfolder if needed
-                    target_subdir = os.path.dirname(target_tex)
-                    os.makedirs(target_subdir, exist_ok=True)
-                    
-                    shutil.copy2(tex_path, target_tex)
-                    copied_count += 1
+                    # Not write_path() - unchanged textures are skipped by the engine and must
+                    # not be journaled; the engine records files it actually rewrites
+                    write_tex = self._staging.stage_path(target_tex) if self._staging is not None else target_tex
+                    copy_jobs.append((tex_path, target_tex, write_tex))
             elif not os.path.exists(master_textures_dir):
                 self.report({'INFO'}, "No textures folder found - publishing without textures")
             
+            self._publish_state = {
+                'publish_path': publish_path,
+                'published_path': published_path,
+                'current_file': current_file,
+                'master_target_folder': master_target_folder,
+                'published_libraries': published_libraries,
+            }
+            
+            from ..utils.copy_engine import CopyEngine
+            self._engine = CopyEngine(
+                copy_jobs,
+                max_workers=self.get_copy_workers(context),
+                incremental=context.scene.publish_incremental,
+                known_hashes=self._known_hashes,
+                fsync=self._staging is not None and self._staging.fsync_files,
+                before_write=self._rollback.record if self._rollback is not None else None
+            )
+            self._engine.start()
+            
+            # No event loop in background mode - copy synchronously
+            if bpy.app.background or context.window is None:
+                self._engine.wait()
+                return self.finish_publish(context)
+            
+            wm = context.window_manager
+            self._timer = wm.event_timer_add(0.1, window=context.window)
+            wm.modal_handler_add(self)
+            wm.progress_begin(0, 100)
+            
+            context.scene.publish_in_progress = True
+            context.scene.publish_cancel_requested = False
+            self.update_progress(context)
+            
+            return {'RUNNING_MODAL'}
+            
+        except Exception as e:
+            return self.fail_publish(context, e)
+    
+    def modal(self, context, event):
+        if event.type == 'ESC' or context.scene.publish_cancel_requested:
+            if not self._engine.cancelled:
+                self._engine.cancel()
+                self.report({'WARNING'}, "Cancelling publish...")
+            if event.type == 'ESC':
+                return {'RUNNING_MODAL'}
+        
+        if event.type == 'TIMER':
+            self.update_progress(context)
+            
+            if self._engine.done:
+                self.stop_progress(context)
+                return self.finish_publish(context)
+        
+        return {'PASS_THROUGH'}
+    
+    def cancel(self, context):
+        """Called by Blender when the modal is aborted (e.g. file load)"""
+        if self._engine is not None:
+            self._engine.cancel()
+            self._engine.shutdown()
+        self.discard_staging()
+        self.stop_progress(context)
+    
+    def update_progress(self, context):
+        """Push copy engine status to scene properties, progress cursor and status bar"""
+        engine = self._engine
+        scene = context.scene
+        
+        scene.publish_progress = engine.progress * 100.0
+        current = f" | {engine.current_file}" if engine.current_file else ""
+        scene.publish_progress_info = f"{engine.status_text()}{current}"
+        
+        context.window_manager.progress_update(int(engine.progress * 100))
+        
+        if context.workspace:
+            context.workspace.status_text_set(
+                f"Publishing textures: {scene.publish_progress_info}  (ESC to cancel)"
+            )
+        
+        for window in context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    
+    def stop_progress(self, context):
+        """Remove timer and clear progress UI"""
+        wm = context.window_manager
+        
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+            wm.progress_end()
+        
+        if context.workspace:
+            context.workspace.status_text_set(None)
+        
+        context.scene.publish_in_progress = False
+        context.scene.publish_cancel_requested = False
+        context.scene.publish_progress = 0.0
+        context.scene.publish_progress_info = ""
+    
+    def finish_publish(self, context):
+        """Final publish stage after texture copy: relink, logs and report"""
+        from ..utils.activity_logger import log_activity
+        from ..utils.copy_engine import format_bytes
+        
+        engine = self._engine
+        engine.shutdown()
+        
+        state = self._publish_state
+        publish_path = state['publish_path']
+        published_path = state['published_path']
+        master_target_folder = state['master_target_folder']
+        published_libraries = state['published_libraries']
+        
+        if engine.cancelled:
+            # Nothing of this run stays in the publish folder, so no real path is logged
+            self.discard_staging()
+            self.write_publish_log(
+                publish_path=publish_path,
+                asset_path=os.path.dirname(state['current_file']),
+                target_path="CANCELLED",
+                texture_count=0,
+                status="CANCELLED",
+                notes=f"Rolled back after {engine.completed_files}/{engine.total_files} textures"
+            )
+            log_activity(
+                "PUBLISH_CANCELLED",
+                f"Asset: {self.asset_name} | Textures: {engine.completed_files}/{engine.total_files}",
+                context
+            )
+            self.report({'WARNING'}, f"Publish cancelled and rolled back ({engine.completed_files}/{engine.total_files} textures had been copied)")
+            return {'CANCELLED'}
+        
+        try:
+            if engine.errors:
+                failed_source, message = engine.errors[0]
+                raise RuntimeError(
+                    f"Texture copy failed for {len(engine.errors)} files "
+                    f"({os.path.basename(failed_source)}: {message})"
+                )
+            
+            copied_count = engine.completed_files
+            skipped_count = self._skipped_files + engine.skipped_files
+            
             log_activity(
                 "PUBLISH_MASTER",
                 f"{os.path.basename(published_path)} | Textures: {copied_count} | Target: {os.path.basename(master_target_folder)}",
@@ -1027,10 +1519,11 @@ class ASSET_OT_Publish(bpy.types.Operator):
             
             if published_libraries:
                 relinked_count = self.relink_external_libraries(
-                    published_path, 
+                    self.current_path(published_path), 
                     published_libraries, 
                     publish_path,
-                    context
+                    context,
+                    published_dir=master_target_folder
                 )
                 if relinked_count > 0:
                     self.report({'INFO'}, f"Relinked {relinked_count} external libraries")
@@ -1042,23 +1535,51 @@ class ASSET_OT_Publish(bpy.types.Operator):
                 status = "SUCCESS (FORCED)"
                 notes = f"{len(self.validation_warnings)} warnings ignored"
             
+            try:
+                manifest_path = self.write_publish_manifest(context, status)
+                print(f"✓ Manifest written: {manifest_path}")
+            except Exception as e:
+                print(f"Warning: Could not write publish manifest: {e}")
+            
+            # Everything is written - make the version visible (blend last)
+            if self._staging is not None:
+                self._staging.promote(deferred=self._deferred_promote + [
+                    get_manifest_path(published_path),
+                    published_path,
+                ])
+                self._staging = None
+                print("✓ Staged publish promoted")
+            if self._rollback is not None:
+                self._rollback.discard()
+                self._rollback = None
+            self.release_reservations()
+            
+            duration = time.perf_counter() - self._publish_start
+            
             self.write_publish_log_v2(
                 publish_path=publish_path,
                 published_path=published_path,
-                source_path=current_file,
+                source_path=state['current_file'],
                 texture_count=copied_count,
                 linked_libraries=published_libraries,
                 status=status,
-                notes=notes
+                notes=notes,
+                duration=duration,
+                copied_bytes=engine.copied_bytes,
+                throughput=engine.throughput,
+                skipped_count=skipped_count if context.scene.publish_incremental else None
             )
             
             force_text = " (FORCED)" if self.is_forced else ""
             lib_text = f" + {len(published_libraries)} libraries" if published_libraries else ""
+            if skipped_count:
+                lib_text += f" | {skipped_count} unchanged files skipped"
             
             self.report(
                 {'INFO'},
                 f"Published {self.asset_name}{force_text}{lib_text} | "
-                f"{copied_count} textures | Target: {master_target_folder}"
+                f"{copied_count} textures ({format_bytes(engine.copied_bytes)} @ {format_bytes(engine.throughput)}/s) | "
+                f"{duration:.1f}s | Target: {master_target_folder}"
             )
             
             successful_libs = len(published_libraries)
@@ -1083,30 +1604,104 @@ class ASSET_OT_Publish(bpy.types.Operator):
             return {'FINISHED'}
             
         except Exception as e:
+            return self.fail_publish(context, e)
+    
+    def write_publish_manifest(self, context, status):
+        """Write <published>.manifest.json listing every published file with hash and role"""
+        engine = self._engine
+        state = self._publish_state
+        published_path = state['published_path']
+        root_dir = os.path.dirname(published_path)
+        
+        entries = [(published_path, ROLE_MASTER, state['current_file'], None)]
+        for result in engine.results:
+            entries.append((result['target'], ROLE_TEXTURE, result['source'], result.get('hash')))
+        for item in self._manifest_files:
+            entries.append((item['path'], item['role'], item['source'], None))
+        
+        files = []
+        for path, role, source, file_hash in entries:
             try:
-                publish_path = context.scene.publish_path
-                self.write_publish_log(
-                    publish_path=publish_path,
-                    asset_path=os.path.dirname(bpy.data.filepath),
-                    target_path="FAILED",
-                    texture_count=0,
-                    status=f"FAILED - {str(e)}"
-                )
-            except:
-                pass
-            
-            from ..utils.activity_logger import log_activity
-            log_activity(
-                "PUBLISH_FAILED",
-                f"Asset: {self.asset_name} | Error: {str(e)}",
-                context
+                files.append(build_file_entry(
+                    path, role, root_dir,
+                    source=source,
+                    file_hash=file_hash,
+                    known_hashes=self._known_hashes,
+                    stat_path=self.current_path(path)
+                ))
+            except OSError as e:
+                print(f"  Manifest: skipped {os.path.basename(path)} ({e})")
+        
+        files.sort(key=lambda entry: (entry['role'], entry['path']))
+        
+        self._timings['textures'] = engine.elapsed
+        total_seconds = time.perf_counter() - self._publish_start
+        
+        manifest = {
+            'asset': self.asset_name,
+            'published_path': published_path,
+            'source': state['current_file'],
+            'user': getpass.getuser(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'mode': context.scene.publish_versioning_mode,
+            'incremental': context.scene.publish_incremental,
+            'status': status,
+            'timing': {
+                'total_seconds': round(total_seconds, 3),
+                'libraries_seconds': round(self._timings.get('libraries', 0.0), 3),
+                'master_seconds': round(self._timings.get('master', 0.0), 3),
+                'textures_seconds': round(self._timings.get('textures', 0.0), 3),
+                'copied_bytes': engine.copied_bytes,
+                'skipped_files': self._skipped_files + engine.skipped_files,
+                'throughput_bytes_per_second': round(engine.throughput, 1),
+            },
+            'dependencies': [
+                {
+                    'name': lib['name'],
+                    'structure': lib['structure'],
+                    'path': lib['path'],
+                    'source': lib.get('source', ''),
+                }
+                for lib in state['published_libraries']
+            ],
+            'files': files,
+        }
+        
+        write_to = None
+        if self._staging is not None:
+            write_to = self._staging.stage_path(get_manifest_path(published_path))
+        return write_manifest(published_path, manifest, write_to=write_to)
+    
+    def fail_publish(self, context, error):
+        """Record a failed publish in both logs and report it"""
+        self.discard_staging()
+        
+        try:
+            publish_path = context.scene.publish_path
+            self.write_publish_log(
+                publish_path=publish_path,
+                asset_path=os.path.dirname(bpy.data.filepath),
+                target_path="FAILED",
+                texture_count=0,
+                status=f"FAILED - {str(error)}"
             )
-            
-            self.report({'ERROR'}, f"Publish failed: {str(e)}")
-            return {'CANCELLED'}
+        except:
+            pass
+        
+        from ..utils.activity_logger import log_activity
+        log_activity(
+            "PUBLISH_FAILED",
+            f"Asset: {self.asset_name} | Error: {str(error)}",
+            context
+        )
+        
+        self.report({'ERROR'}, f"Publish failed: {str(error)}")
+        return {'CANCELLED'}
     
     def write_publish_log_v2(self, publish_path, published_path, source_path, 
-                            texture_count, linked_libraries, status, notes=""):
+                            texture_count, linked_libraries, status, notes="",
+                            duration=None, copied_bytes=None, throughput=None,
+                            skipped_count=None):
         log_file = os.path.join(publish_path, ".publish_activity.log")
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         username = getpass.getuser()
@@ -1122,6 +1717,18 @@ class ASSET_OT_Publish(bpy.types.Operator):
             f"Status: {status}"
         )
         
+        if duration is not None:
+            log_entry += f" | Time: {duration:.1f}s"
+        
+        if copied_bytes is not None:
+            from ..utils.copy_engine import format_bytes
+            log_entry += f" | Copied: {format_bytes(copied_bytes)}"
+            if throughput is not None:
+                log_entry += f" | Throughput: {format_bytes(throughput)}/s"
+        
+        if skipped_count is not None:
+            log_entry += f" | Unchanged: {skipped_count}"
+        
         if notes:
             log_entry += f" | Notes: {notes}"
         
@@ -1141,6 +1748,26 @@ class ASSET_OT_Publish(bpy.types.Operator):
                 f.write(log_entry)
         except Exception as e:
             print(f"Warning: Could not write to log: {e}")
+            return
+        
+        update_publish_registry(log_file)
+
+
+class ASSET_OT_CancelPublish(bpy.types.Operator):
+    """Cancel the running publish"""
+    bl_idname = "asset.cancel_publish"
+    bl_label = "Cancel Publish"
+    bl_description = "Stop copying textures and cancel the running publish"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return context.scene.publish_in_progress
+    
+    def execute(self, context):
+        context.scene.publish_cancel_requested = True
+        self.report({'INFO'}, "Cancel requested")
+        return {'FINISHED'}
 
 
 # ============================================================================
@@ -1296,6 +1923,7 @@ class ASSET_OT_CopySourcePath(bpy.types.Operator):
 def register():
     bpy.utils.register_class(LibrarySelectionItem)
     bpy.utils.register_class(ASSET_OT_Publish)
+    bpy.utils.register_class(ASSET_OT_CancelPublish)
     bpy.utils.register_class(ASSET_OT_CopyLibraryPath)
     bpy.utils.register_class(ASSET_OT_ReloadLibrary)
     bpy.utils.register_class(ASSET_OT_OpenLibraryFile)
@@ -1331,6 +1959,20 @@ def register():
         default=False
     )
     
+    bpy.types.Scene.publish_incremental = BoolProperty(
+        name="Incremental Publish",
+        description="Skip files that are unchanged in the publish target (size/date, then content hash). "
+                    "In Versioning mode unchanged blends are hardlinked from the previous version",
+        default=False
+    )
+    
+    bpy.types.Scene.publish_use_staging = BoolProperty(
+        name="Safe Publish",
+        description="Write the publish into a hidden .staging folder and move it into place only "
+                    "when complete. A failed or cancelled publish leaves the publish folder untouched",
+        default=False
+    )
+    
     bpy.types.Scene.publish_sync_to_master = BoolProperty(
         name="Auto-sync to Master",
         description="Also update master file (without _v suffix) when publishing versioned file",
@@ -1410,6 +2052,35 @@ def register():
         description="Number of duplicate materials that can be optimized",
         default=0
     )
+    
+    # ===== PUBLISH PROGRESS =====
+    
+    bpy.types.Scene.publish_in_progress = BoolProperty(
+        name="Publish In Progress",
+        description="A publish is currently copying files",
+        default=False
+    )
+    
+    bpy.types.Scene.publish_cancel_requested = BoolProperty(
+        name="Cancel Requested",
+        description="Cancel was requested for the running publish",
+        default=False
+    )
+    
+    bpy.types.Scene.publish_progress = FloatProperty(
+        name="Publish Progress",
+        description="Texture copy progress of the running publish",
+        subtype='PERCENTAGE',
+        min=0.0,
+        max=100.0,
+        default=0.0
+    )
+    
+    bpy.types.Scene.publish_progress_info = StringProperty(
+        name="Publish Progress Info",
+        description="Files, bytes and throughput of the running publish",
+        default=""
+    )
 
 
 def toggle_all_libraries(context):
@@ -1423,9 +2094,14 @@ def unregister():
     bpy.utils.unregister_class(ASSET_OT_OpenLibraryFile)
     bpy.utils.unregister_class(ASSET_OT_ReloadLibrary)
     bpy.utils.unregister_class(ASSET_OT_CopyLibraryPath)
+    bpy.utils.unregister_class(ASSET_OT_CancelPublish)
     bpy.utils.unregister_class(ASSET_OT_Publish)
     bpy.utils.unregister_class(LibrarySelectionItem)
     
+    del bpy.types.Scene.publish_progress_info
+    del bpy.types.Scene.publish_progress
+    del bpy.types.Scene.publish_cancel_requested
+    del bpy.types.Scene.publish_in_progress
     del bpy.types.Scene.publish_duplicate_material_count
     del bpy.types.Scene.publish_duplicate_texture_count
     del bpy.types.Scene.publish_empty_slots_count
@@ -1439,6 +2115,8 @@ def unregister():
     del bpy.types.Scene.publish_library_selection
     del bpy.types.Scene.publish_include_libraries
     del bpy.types.Scene.publish_sync_to_master
+    del bpy.types.Scene.publish_incremental
+    del bpy.types.Scene.publish_use_staging
     del bpy.types.Scene.publish_force
     del bpy.types.Scene.publish_versioning_mode
     del bpy.types.Scene.publish_path
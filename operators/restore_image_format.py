@@ -2,6 +2,20 @@ import bpy
 import os
 import shutil
 
+
+# Stored channel count -> Blender color mode label
+CHANNEL_LABELS = {1: 'BW', 2: 'BWA', 3: 'RGB', 4: 'RGBA'}
+
+
+def is_channel_demoted(backup_path, current_path, cache):
+    """True if current_path was rewritten in place with fewer channels than its backup"""
+    backup_info = cache.get_info(backup_path)
+    current_info = cache.get_info(current_path)
+    if backup_info is None or current_info is None:
+        return False
+    return current_info.channels < backup_info.channels
+
+
 class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
     """Restore all converted textures to their original format from .backup folder."""
     bl_idname = "texture.restore_image_format"
@@ -13,11 +27,15 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
     backup_info = []  
 
     def invoke(self, context, event):
+        from ..utils.image_probe import get_format_label
+        from ..utils.texture_utils import get_project_texture_cache
+
         if not bpy.data.filepath:
             self.report({'ERROR'}, "Please save the .blend file first")
             return {'CANCELLED'}
 
         blend_dir = os.path.dirname(bpy.data.filepath)
+        cache = get_project_texture_cache()
         self.backup_folders_found = []
         self.total_backups = 0
         self.backup_info = []
@@ -45,7 +63,10 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
 
                     for fmt_file in fmt_files:
                         original_name = fmt_file[:-4]
-                        backup_ext = os.path.splitext(original_name)[1].upper().replace('.', '')
+                        # Formats come from file headers, extension only as fallback
+                        backup_ext = get_format_label(
+                            os.path.join(backup_dir, fmt_file), original_name, cache.get_info
+                        )
                         root_name = os.path.splitext(original_name)[0]
 
                         current_ext = None
@@ -53,9 +74,7 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
                         for ext in ['.png', '.jpg', '.jpeg', '.PNG', '.JPG', '.JPEG']:
                             check_path = os.path.join(parent_dir, root_name + ext)
                             if os.path.exists(check_path):
-                                current_ext = ext.upper().replace('.', '')
-                                if current_ext == 'JPEG':
-                                    current_ext = 'JPG'
+                                current_ext = get_format_label(check_path, probe=cache.get_info)
                                 break
 
                         if current_ext and backup_ext != current_ext:
@@ -64,6 +83,18 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
                                 'backup_format': backup_ext,
                                 'current_format': current_ext
                             })
+                        elif is_channel_demoted(os.path.join(backup_dir, fmt_file),
+                                                os.path.join(parent_dir, original_name), cache):
+                            # Same file rewritten with fewer channels (Demote Channels)
+                            backup_channels = cache.get_info(os.path.join(backup_dir, fmt_file)).channels
+                            current_channels = cache.get_info(os.path.join(parent_dir, original_name)).channels
+                            self.backup_info.append({
+                                'name': root_name,
+                                'backup_format': f"{backup_ext} {CHANNEL_LABELS.get(backup_channels, backup_channels)}",
+                                'current_format': f"{backup_ext} {CHANNEL_LABELS.get(current_channels, current_channels)}"
+                            })
+
+        cache.save()
 
         if not self.backup_folders_found:
             self.report({'INFO'}, "No format backup files (.fmt) found")
@@ -114,6 +145,9 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
 
     def execute(self, context):
         from ..utils.texture_detector import detect_external_and_packed_textures
+        from ..utils.texture_utils import get_project_texture_cache
+        
+        cache = get_project_texture_cache()
         
         # Detect textures to skip
         external_imgs, packed_imgs, local_imgs = detect_external_and_packed_textures(context)
@@ -167,7 +201,17 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
                         continue
 
                     if os.path.exists(restore_path):
-                        skipped += 1
+                        if not is_channel_demoted(backup_path, restore_path, cache):
+                            skipped += 1
+                            continue
+                        # Demoted in place - overwrite with the original channels
+                        shutil.copy2(backup_path, restore_path)
+                        restored += 1
+                        self._reload_images(restore_path)
+                        try:
+                            os.remove(backup_path)
+                        except:
+                            pass
                         continue
 
                     shutil.copy2(backup_path, restore_path)
@@ -192,6 +236,8 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
                     self.report({'WARNING'}, f"Failed to restore {os.path.basename(backup_path)}: {str(e)}")
                     continue
 
+        cache.save()
+
         msg = f"Restored {restored} file(s)"
         if deleted_converted > 0:
             msg += f" | Deleted {deleted_converted} converted"
@@ -222,6 +268,17 @@ class TEXTURE_OT_RestoreImageFormat(bpy.types.Operator):
         
         return {'FINISHED'}
 
+    def _reload_images(self, restored_path):
+        restored_abs = os.path.normpath(restored_path)
+        for img in bpy.data.images:
+            if img.source != 'FILE' or not img.filepath:
+                continue
+            if os.path.normpath(bpy.path.abspath(img.filepath)) == restored_abs:
+                try:
+                    img.reload()
+                except:
+                    pass
+
     def _update_image_datablock(self, restored_path, converted_files, blend_dir):
         restored_abs = os.path.normpath(restored_path)
         search_paths = [os.path.normpath(f) for f in converted_files]
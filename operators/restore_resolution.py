@@ -13,11 +13,14 @@ class TEXTURE_OT_RestoreResolution(bpy.types.Operator):
     backup_info = [] 
 
     def invoke(self, context, event):
+        from ..utils.texture_utils import get_project_texture_cache
+        
         if not bpy.data.filepath:
             self.report({'ERROR'}, "Please save the .blend file first")
             return {'CANCELLED'}
 
         blend_dir = os.path.dirname(bpy.data.filepath)
+        cache = get_project_texture_cache()
         self.backup_folders_found = []
         self.total_backups = 0
         self.backup_info = []
@@ -49,23 +52,16 @@ class TEXTURE_OT_RestoreResolution(bpy.types.Operator):
                         root_name = os.path.splitext(original_name)[0]
                         parent_dir = os.path.dirname(backup_dir)
                         
+                        # Cached header reads (no image decode per backup)
                         backup_path = os.path.join(backup_dir, hires_file)
-                        try:
-                            temp_img = bpy.data.images.load(backup_path, check_existing=False)
-                            backup_res = f"{temp_img.size[0]}x{temp_img.size[1]}"
-                            bpy.data.images.remove(temp_img)
-                        except:
-                            backup_res = "Unknown"
+                        backup_size = cache.get_size(backup_path)
+                        backup_res = f"{backup_size[0]}x{backup_size[1]}" if backup_size else "Unknown"
                         
                         current_res = None
                         current_path = os.path.join(parent_dir, original_name)
                         if os.path.exists(current_path):
-                            try:
-                                temp_img = bpy.data.images.load(current_path, check_existing=False)
-                                current_res = f"{temp_img.size[0]}x{temp_img.size[1]}"
-                                bpy.data.images.remove(temp_img)
-                            except:
-                                current_res = "Unknown"
+                            current_size = cache.get_size(current_path)
+                            current_res = f"{current_size[0]}x{current_size[1]}" if current_size else "Unknown"
                         
                         if current_res and backup_res != current_res:
                             self.backup_info.append({
@@ -74,6 +70,8 @@ class TEXTURE_OT_RestoreResolution(bpy.types.Operator):
                                 'current_res': current_res
                             })
 
+        cache.save()
+
         if not self.backup_folders_found:
             self.report({'INFO'}, "No resolution backup files (.hires) found")
             return {'CANCELLED'}
@@ -0,0 +1,330 @@
+import bpy
+import os
+import time
+
+from ..utils.texture_lod import LEVEL_FULL
+
+
+LOD_LEVEL_ITEMS = [
+    (LEVEL_FULL, "Full", "Original resolution files"),
+    ('2K', "2K", "2048px max dimension variants"),
+    ('1K', "1K", "1024px max dimension variants"),
+    ('512', "512", "512px max dimension variants"),
+]
+
+
+class TEXTURE_OT_BuildLODPyramid(bpy.types.Operator):
+    """Build 2K, 1K and 512 variants of every texture in one pass."""
+    bl_idname = "texture.build_lod_pyramid"
+    bl_label = "Build LOD Pyramid"
+    bl_description = "Build 2K/1K/512 variants of all textures into a .lod sidecar folder (originals untouched)"
+    
+    resample_filter: bpy.props.EnumProperty(
+        name="Filter",
+        items=[
+            ('BOX', "Box", "Area average - fastest, slightly soft"),
+            ('BILINEAR', "Bilinear", "Smooth triangle filter - good default"),
+            ('LANCZOS', "Lanczos", "Sharpest - may ring on hard edges")
+        ],
+        default='BILINEAR'
+    )
+    
+    rebuild: bpy.props.BoolProperty(
+        name="Rebuild All",
+        description="Rebuild variants even if they are newer than their source",
+        default=False
+    )
+    
+    def invoke(self, context, event):
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Please save the .blend file first")
+            return {'CANCELLED'}
+        
+        return context.window_manager.invoke_props_dialog(self)
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "resample_filter")
+        layout.prop(self, "rebuild")
+        layout.label(text="Variants saved as: .lod/<level>/filename.png", icon='INFO')
+        layout.separator()
+        layout.label(text="Note: External, packed & UDIM textures will be skipped", icon='INFO')
+    
+    def get_workers(self, context):
+        """Get resample process count from addon preferences"""
+        try:
+            prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+            return prefs.texture_workers
+        except Exception:
+            return 4
+    
+    def collect_jobs(self, context, stats):
+        """Pick images that need variants; returns list of job dicts"""
+        from ..utils.texture_detector import detect_external_and_packed_textures
+        from ..utils.image_resample import get_target_size
+        from ..utils.texture_lod import get_lod_path, get_pyramid_sizes, is_lod_path, is_variant_current
+        from ..utils.texture_utils import get_project_texture_cache
+        
+        external_imgs, packed_imgs, local_imgs = detect_external_and_packed_textures(context)
+        cache = get_project_texture_cache()
+        
+        jobs = []
+        for img in bpy.data.images:
+            if img.name in ('Render Result', 'Viewer Node'):
+                continue
+            if img.source != 'FILE' or img.name in external_imgs or img.name in packed_imgs:
+                stats['skipped'] += 1
+                continue
+            
+            if hasattr(img, "tiles") and len(img.tiles) > 1:
+                stats['skipped'] += 1
+                continue
+            
+            abs_path = os.path.normpath(bpy.path.abspath(img.filepath_raw))
+            if is_lod_path(abs_path):
+                # Pixels in memory are a variant, not the source
+                stats['lod_active'] += 1
+                continue
+            
+            if not os.path.exists(abs_path):
+                self.report({'WARNING'}, f"File not found for {img.name}")
+                stats['skipped'] += 1
+                continue
+            
+            width, height = img.size
+            levels = get_pyramid_sizes(width, height)
+            if not levels:
+                stats['small'] += 1
+                continue
+            
+            variants = [get_lod_path(abs_path, level) for level, size in levels]
+            if not self.rebuild and all(is_variant_current(abs_path, v) for v in variants):
+                stats['current'] += 1
+                continue
+            
+            info = cache.get_info(abs_path)
+            jobs.append({
+                'name': img.name,
+                'bit_depth': info.bit_depth if info else None,
+                'variants': variants,
+                'sizes': [get_target_size(width, height, size) for level, size in levels],
+            })
+        
+        return jobs
+    
+    def execute(self, context):
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from ..utils.image_resample import ResamplePool
+        from ..utils.texture_utils import new_image_save_scene
+        
+        stats = {
+            'built': 0,
+            'variants': 0,
+            'current': 0,
+            'small': 0,
+            'lod_active': 0,
+            'skipped': 0,
+            'errors': 0,
+        }
+        start = time.perf_counter()
+        
+        queue = self.collect_jobs(context, stats)
+        total = len(queue)
+        
+        if queue:
+            # Each source is read once; all levels are resampled in one worker job
+            pool = ResamplePool(max_workers=min(self.get_workers(context), total))
+            scene = new_image_save_scene("__lod_pyramid")
+            in_flight = {}
+            wm = context.window_manager
+            wm.progress_begin(0, 100)
+            try:
+                while queue or in_flight:
+                    while queue and len(in_flight) < pool.max_workers:
+                        job = queue.pop(0)
+                        future = self.submit_job(pool, job, stats)
+                        if future is not None:
+                            in_flight[future] = job
+                    
+                    if not in_flight:
+                        continue
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.write_variants(in_flight.pop(future), future, stats, scene)
+                    
+                    wm.progress_update(int((total - len(queue) - len(in_flight)) / total * 100))
+            finally:
+                pool.shutdown()
+                bpy.data.scenes.remove(scene)
+                wm.progress_end()
+        
+        elapsed = time.perf_counter() - start
+        
+        msg = f"Built: {stats['built']} texture(s), {stats['variants']} variant(s)"
+        if stats['current'] > 0:
+            msg += f" | Up to date: {stats['current']}"
+        if stats['small'] > 0:
+            msg += f" | Already small: {stats['small']}"
+        if stats['lod_active'] > 0:
+            msg += f" | On LOD (switch to Full first): {stats['lod_active']}"
+        if stats['skipped'] > 0:
+            msg += f" | Skipped: {stats['skipped']}"
+        if stats['errors'] > 0:
+            msg += f" | Errors: {stats['errors']}"
+        msg += f" | {elapsed:.1f}s"
+        
+        self.report({'WARNING'} if stats['errors'] else {'INFO'}, msg)
+        
+        from ..utils.activity_logger import log_activity
+        details = f"Filter: {self.resample_filter} | Built: {stats['built']} | Variants: {stats['variants']}"
+        if stats['current'] > 0:
+            details += f" | Up to date: {stats['current']}"
+        if stats['errors'] > 0:
+            details += f" | Errors: {stats['errors']}"
+        details += f" | Time: {elapsed:.1f}s"
+        log_activity("BUILD_LOD_PYRAMID", details, context)
+        
+        return {'FINISHED'}
+    
+    def submit_job(self, pool, job, stats):
+        """Read source pixels and queue the pyramid resample"""
+        img = bpy.data.images.get(job['name'])
+        if img is None:
+            stats['skipped'] += 1
+            return None
+        
+        try:
+            width, height = img.size
+            pixels = pool.allocate((height, width, img.channels))
+            try:
+                img.pixels.foreach_get(pixels.ravel())
+            except Exception:
+                pool.discard(pixels)
+                raise
+            
+            return pool.submit_pyramid(pixels, job['sizes'], self.resample_filter, clamp=not img.is_float)
+        
+        except Exception as e:
+            stats['errors'] += 1
+            self.report({'ERROR'}, f"Error reading {job['name']}: {str(e)}")
+            return None
+    
+    def write_variants(self, job, future, stats, scene):
+        """Save each resampled level from a new image of the level's size"""
+        from ..utils.texture_utils import save_resized_pixels
+        
+        try:
+            levels = future.result()
+            img = bpy.data.images.get(job['name'])
+            if img is None:
+                raise RuntimeError("Image was removed")
+            
+            for variant_path, (width, height), pixels in zip(job['variants'], job['sizes'], levels):
+                os.makedirs(os.path.dirname(variant_path), exist_ok=True)
+                save_resized_pixels(img, pixels, width, height, variant_path, scene, job['bit_depth'])
+                stats['variants'] += 1
+            
+            stats['built'] += 1
+        
+        except Exception as e:
+            stats['errors'] += 1
+            self.report({'ERROR'}, f"Error building LOD for {job['name']}: {str(e)}")
+
+
+class TEXTURE_OT_SwitchLOD(bpy.types.Operator):
+    """Switch textures between full resolution and prebuilt LOD variants."""
+    bl_idname = "texture.switch_lod"
+    bl_label = "Switch LOD"
+    bl_description = "Relink textures to a prebuilt resolution level (no re-encoding)"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    level: bpy.props.EnumProperty(
+        name="Level",
+        items=LOD_LEVEL_ITEMS,
+        default=LEVEL_FULL
+    )
+    
+    def execute(self, context):
+        from ..utils.texture_lod import get_lod_path, split_lod_path
+        
+        start = time.perf_counter()
+        switched = 0
+        unchanged = 0
+        missing = 0
+        failed = 0
+        
+        for img in bpy.data.images:
+            if img.source != 'FILE' or img.packed_file or img.library or not img.filepath:
+                continue
+            
+            current_path = os.path.normpath(bpy.path.abspath(img.filepath))
+            source_path, current_level = split_lod_path(current_path)
+            
+            if self.level == LEVEL_FULL:
+                new_path = source_path
+            else:
+                new_path = get_lod_path(source_path, self.level)
+                if not os.path.exists(new_path):
+                    # Not built, or the source is already at or below this level
+                    missing += 1
+                    new_path = source_path
+            
+            if new_path == current_path:
+                unchanged += 1
+                continue
+            
+            try:
+                if img.filepath.startswith('//'):
+                    img.filepath = bpy.path.relpath(new_path)
+                else:
+                    img.filepath = new_path
+                switched += 1
+            except Exception as e:
+                failed += 1
+                self.report({'WARNING'}, f"Could not relink {img.name}: {str(e)}")
+        
+        context.scene.texture_lod_level = self.level
+        elapsed = time.perf_counter() - start
+        
+        label = {key: name for key, name, description in LOD_LEVEL_ITEMS}[self.level]
+        msg = f"LOD {label}: switched {switched}"
+        if unchanged > 0:
+            msg += f" | Unchanged: {unchanged}"
+        if missing > 0 and self.level != LEVEL_FULL:
+            msg += f" | No variant (full res): {missing}"
+        if failed > 0:
+            msg += f" | Failed: {failed}"
+        msg += f" | {elapsed:.1f}s"
+        self.report({'INFO'}, msg)
+        
+        from ..utils.activity_logger import log_activity
+        details = f"Level: {label} | Switched: {switched}"
+        if missing > 0 and self.level != LEVEL_FULL:
+            details += f" | No variant: {missing}"
+        if failed > 0:
+            details += f" | Failed: {failed}"
+        log_activity("SWITCH_LOD", details, context)
+        
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(TEXTURE_OT_BuildLODPyramid)
+    bpy.utils.register_class(TEXTURE_OT_SwitchLOD)
+    
+    bpy.types.Scene.texture_lod_level = bpy.props.EnumProperty(
+        name="Texture LOD",
+        description="Resolution level textures are currently linked to",
+        items=LOD_LEVEL_ITEMS,
+        default=LEVEL_FULL
+    )
+
+
+def unregister():
+    bpy.utils.unregister_class(TEXTURE_OT_SwitchLOD)
+    bpy.utils.unregister_class(TEXTURE_OT_BuildLODPyramid)
+    
+    try:
+        del bpy.types.Scene.texture_lod_level
+    except Exception:
+        pass
@@ -6,6 +6,8 @@ import hashlib
 import fnmatch
 from datetime import datetime
 
+from ..utils.version_allocator import allocate_version, release_version
+
 LOG_FILENAME = "versioning_activity.log"
 
 
@@ -97,17 +99,18 @@ def save_current_file_copy(main_filepath):
     versions_dir = ensure_versions_dir(main_filepath)
     if not versions_dir:
         return None
-    existing = [f for f in os.listdir(versions_dir) if f.startswith(base + "_v") and f.endswith(ext)]
-    existing.sort()
-    version_count = len(existing)
-    new_name = f"{base}_v{version_count + 1:03d}{ext}"
-    dest = os.path.join(versions_dir, new_name)
+    try:
+        _version, dest, reservation = allocate_version(versions_dir, base, ext)
+    except OSError:
+        return None
     try:
         shutil.copy2(main_filepath, dest)
         append_log_compact(main_filepath, f"Versioning created: {os.path.basename(dest)}")
         return dest
     except Exception:
         return None
+    finally:
+        release_version(reservation)
 
 
 def try_operator_find_missing(textures_root):
@@ -41,11 +41,32 @@ class TEXTURE_PT_FileManagementPanel(bpy.types.Panel):
         row.separator()
         row.operator("texture.restore_resolution", text="", icon='FILE_REFRESH')
 
+        row = texture_opt_box.row(align=True)
+        row.enabled = not is_published
+        row.operator("texture.pack_orm", text="Pack ORM Maps", icon='NODE_COMPOSITING')
+
+        row = texture_opt_box.row(align=True)
+        row.enabled = not is_published
+        row.operator("texture.build_lod_pyramid", text="Build LOD Pyramid", icon='TEXTURE')
+
+        row = texture_opt_box.row(align=True)
+        row.enabled = not is_published
+        for level, label in (('FULL', "Full"), ('2K', "2K"), ('1K', "1K"), ('512', "512")):
+            op = row.operator(
+                "texture.switch_lod", text=label,
+                depress=getattr(context.scene, "texture_lod_level", 'FULL') == level
+            )
+            op.level = level
+
         row = texture_opt_box.row(align=True)
         row.enabled = not is_published
         row.operator("texture.convert_image_format", text="Convert Image Format", icon='IMAGE_PLANE')
         row.separator()
         row.operator("texture.restore_image_format", text="", icon='FILE_REFRESH')
+
+        row = texture_opt_box.row(align=True)
+        row.enabled = not is_published
+        row.operator("texture.demote_channels", text="Demote Channels", icon='IMAGE_ALPHA')
         
         file_ops_box = layout.box()
         file_ops_box.label(text="File Operations", icon='FILE_FOLDER')
@@ -39,22 +39,29 @@ class ASSET_STATS_PT_panel(bpy.types.Panel):
         total_libraries = len(bpy.data.libraries)
         total_nodegroups = len(bpy.data.node_groups)
         
-        total_unused = 0
-        for mesh in bpy.data.meshes:
-            if mesh.users == 0:
-                total_unused += 1
-        for mat in bpy.data.materials:
-            if mat.users == 0:
-                total_unused += 1
-        for img in bpy.data.images:
-            if img.name not in ('Render Result', 'Viewer Node') and img.users == 0:
-                total_unused += 1
-        for obj in bpy.data.objects:
-            if obj.users == 0:
-                total_unused += 1
-        for col in bpy.data.collections:
-            if col.users == 0:
-                total_unused += 1
+        # Cached scene index when current (never rebuilt from draw), else count directly
+        from ..utils.scene_index import peek_scene_index
+        index = peek_scene_index()
+        if index is not None:
+            total_unused = sum(len(index.orphans.get(label, ()))
+                               for label in ('Meshes', 'Materials', 'Images', 'Objects', 'Collections'))
+        else:
+            total_unused = 0
+            for mesh in bpy.data.meshes:
+                if mesh.users == 0:
+                    total_unused += 1
+            for mat in bpy.data.materials:
+                if mat.users == 0:
+                    total_unused += 1
+            for img in bpy.data.images:
+                if img.name not in ('Render Result', 'Viewer Node') and img.users == 0:
+                    total_unused += 1
+            for obj in bpy.data.objects:
+                if obj.users == 0:
+                    total_unused += 1
+            for col in bpy.data.collections:
+                if col.users == 0:
+                    total_unused += 1
         
         box = layout.box()
         
@@ -80,6 +87,7 @@ class ASSET_STATS_PT_panel(bpy.types.Panel):
         row = layout.row(align=True)
         row.scale_y = 1.3
         row.operator("scene.analyze_deep", icon='TEXT', text="Analyze Scene Deeply")        
+        row.operator("scene.diff_analysis", icon='ARROW_LEFTRIGHT', text="")
 
 
 class ASSET_ANALYSIS_PT_panel(bpy.types.Panel):
@@ -279,10 +287,12 @@ class ASSET_OPTIMIZATION_PT_panel(bpy.types.Panel):
         row.operator("asset.optimize_material_duplicates", text="Optimize Material Duplicates", icon='MATERIAL')
         
         # Texture Duplicates
-        row = optimization_box.row()
+        row = optimization_box.row(align=True)
         row.enabled = not is_published
         row.scale_y = 1.2
-        row.operator("asset.optimize_texture_duplicates", text="Optimize Texture Duplicates", icon='TEXTURE')
+        row.operator("asset.optimize_texture_duplicates", text="Optimize Texture Duplicates", icon='TEXTURE').match_mode = 'CONTENT'
+        row.separator()
+        row.operator("asset.optimize_texture_duplicates", text="", icon='VIEWZOOM').match_mode = 'SIMILAR'
                 
         # ====================================================================
         # CLEANUP SECTION
@@ -1,6 +1,8 @@
 import bpy
 import os
 
+from ..utils.publish_paths import get_master_target_path
+
 
 class ASSET_PT_Publish(bpy.types.Panel):
     """Asset Publishing Panel"""
@@ -90,6 +92,16 @@ class ASSET_PT_Publish(bpy.types.Panel):
                 else:
                     col.label(text=f"{scene.publish_packed_count} packed textures", icon='INFO')
             
+            # Textures switched to a reduced LOD level
+            if hasattr(scene, 'publish_lod_texture_count') and scene.publish_lod_texture_count > 0:
+                lod_text = f"{scene.publish_lod_texture_count} textures use a reduced LOD (switch to Full)"
+                if not scene.publish_force:
+                    row = col.row()
+                    row.alert = True
+                    row.label(text=lod_text, icon='ERROR')
+                else:
+                    col.label(text=lod_text, icon='INFO')
+            
             # Large textures warning (if enabled in preferences)
             if hasattr(scene, 'publish_large_texture_count') and scene.publish_large_texture_count > 0:
                 # Get max resolution from preferences for display
@@ -111,6 +123,33 @@ class ASSET_PT_Publish(bpy.types.Panel):
                 else:
                     col.label(text=f"{scene.publish_large_texture_count} textures exceed {max_res_label} resolution", icon='INFO')
             
+            # Texture memory budget (if enabled in preferences)
+            if hasattr(scene, 'publish_texture_memory_budget') and scene.publish_texture_memory_budget > 0:
+                from ..utils.copy_engine import format_bytes
+                mb = 1024 * 1024
+                memory_text = (f"Texture memory: {format_bytes(scene.publish_texture_memory_gpu * mb)} VRAM"
+                               f" / {format_bytes(scene.publish_texture_memory_cpu * mb)} RAM")
+                budget_text = format_bytes(scene.publish_texture_memory_budget * mb)
+                
+                if not scene.publish_texture_memory_over_budget:
+                    col.label(text=f"{memory_text} (budget {budget_text})", icon='CHECKMARK')
+                elif not scene.publish_force:
+                    row = col.row()
+                    row.alert = True
+                    row.label(text=f"{memory_text} exceeds {budget_text} budget", icon='ERROR')
+                else:
+                    col.label(text=f"{memory_text} exceeds {budget_text} budget", icon='INFO')
+                
+                if scene.publish_texture_memory_top:
+                    top_col = col.column(align=True)
+                    top_col.scale_y = 0.8
+                    kind_icons = {'COLLECTION': 'OUTLINER_COLLECTION', 'OBJECT': 'OBJECT_DATA', 'MATERIAL': 'MATERIAL'}
+                    for item in scene.publish_texture_memory_top:
+                        top_col.label(
+                            text=f"  {item.name}: {format_bytes(item.gpu_mb * mb)} VRAM",
+                            icon=kind_icons.get(item.kind, 'BLANK1')
+                        )
+            
             # ===== NEW VALIDATION CHECKS =====
             
             # Transform issues
@@ -337,24 +376,52 @@ class ASSET_PT_Publish(bpy.types.Panel):
         if scene.publish_is_published_file:
             row.enabled = False
         
+        # Incremental publish (skip unchanged files)
+        col.separator(factor=0.5)
+        row = col.row()
+        row.prop(scene, "publish_incremental", text="Skip Unchanged Files", icon='FILE_REFRESH')
+        if scene.publish_is_published_file:
+            row.enabled = False
+        
+        # Safe publish (stage, then promote with renames)
+        row = col.row()
+        row.prop(scene, "publish_use_staging", text="Safe Publish (Staging)", icon='LOCKED')
+        if scene.publish_is_published_file:
+            row.enabled = False
+        
         # Preview target path
         if scene.publish_path and bpy.data.filepath:
-            blend_dir = os.path.dirname(bpy.data.filepath)
-            asset_name = os.path.basename(blend_dir)
-            
-            if scene.publish_versioning_mode == 'VERSIONING':
-                # Find next version
-                base_path = os.path.join(scene.publish_path, asset_name)
-                version_num = 1
-                while os.path.exists(f"{base_path}_v{version_num:03d}"):
-                    version_num += 1
-                target_preview = f"{asset_name}_v{version_num:03d}"
-            else:
-                target_preview = asset_name
+            # Same folder and file name the publish claims (one cached folder scan)
+            library_paths = []
+            if scene.publish_include_libraries:
+                library_paths = [item.filepath for item in scene.publish_library_selection if item.selected]
+            target_path = get_master_target_path(
+                scene.publish_path, bpy.data.filepath, library_paths,
+                versioning=scene.publish_versioning_mode == 'VERSIONING'
+            )
+            target_preview = os.path.relpath(target_path, scene.publish_path)
             
             col.separator(factor=0.5)
             col.label(text=f"→ {target_preview}", icon='FORWARD')
         
+        # Publish progress (texture copy runs in background threads)
+        if scene.publish_in_progress:
+            layout.separator()
+            progress_box = layout.box()
+            progress_box.label(text="Publishing...", icon='SORTTIME')
+            
+            progress_row = progress_box.row()
+            progress_row.enabled = False
+            progress_row.prop(scene, "publish_progress", text="Progress", slider=True)
+            
+            info_col = progress_box.column(align=True)
+            info_col.scale_y = 0.8
+            info_col.label(text=scene.publish_progress_info, icon='BLANK1')
+            
+            row = progress_box.row()
+            row.scale_y = 1.2
+            row.operator("asset.cancel_publish", text="Cancel Publish", icon='CANCEL')
+        
         # Publish button
         layout.separator()
         row = layout.row()
@@ -371,6 +438,9 @@ class ASSET_PT_Publish(bpy.types.Panel):
         elif not scene.publish_path:
             can_publish = False
             disable_reason = "Publish path not set"
+        elif scene.publish_in_progress:
+            can_publish = False
+            disable_reason = "Publish in progress"
         # PRIORITY 2: Must run validation check first
         elif not scene.publish_check_done:
             can_publish = False
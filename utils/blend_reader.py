@@ -0,0 +1,471 @@
+"""
+Blend File Reader Utility
+
+Minimal read-only .blend parser - lists image and library data-blocks
+without opening the file in Blender (no open_mainfile, no UI reload).
+
+Only block headers are walked; the data of IM (Image) and LI (Library)
+blocks is kept and decoded with the file's own SDNA (the DNA1 block), so
+field offsets are correct for any Blender version and pointer size.
+
+Supported containers:
+- Uncompressed .blend (legacy 12-byte header and the Blender 5.x header)
+- Gzip compressed .blend (Blender < 3.0 "Compress" option)
+- Zstandard compressed .blend (Blender 3.0+), needs the 'zstandard' module
+  or Python 3.14 compression.zstd - otherwise BlendReadError is raised
+
+Results are cached per (path, size, mtime), so repeated scans of the same
+library during one session cost one stat.
+"""
+
+import gzip
+import os
+import struct
+from collections import namedtuple
+
+
+# Image.source values (DNA_image_types.h)
+IMA_SRC_FILE = 1
+IMA_SRC_SEQUENCE = 2
+IMA_SRC_MOVIE = 3
+IMA_SRC_GENERATED = 4
+IMA_SRC_VIEWER = 5
+IMA_SRC_TILED = 6
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# ID block codes are two letters padded to four bytes
+CODE_IMAGE = b'IM\0\0'
+CODE_LIBRARY = b'LI\0\0'
+
+_READ_CODES = (CODE_IMAGE, CODE_LIBRARY)
+
+ImageRef = namedtuple('ImageRef', ['name', 'filepath', 'source', 'packed', 'linked'])
+LibraryRef = namedtuple('LibraryRef', ['name', 'filepath'])
+BlendInfo = namedtuple('BlendInfo', ['images', 'libraries', 'version'])
+
+# {normcase(path): ((size, mtime_ns), BlendInfo)}
+_info_cache = {}
+
+
+class BlendReadError(Exception):
+    """File is not a readable .blend (corrupt, unsupported compression, ...)"""
+    pass
+
+
+# =============================================================================
+# STREAM HANDLING
+# =============================================================================
+
+def _open_zstd(raw):
+    try:
+        import zstandard
+        return zstandard.ZstdDecompressor().stream_reader(raw)
+    except ImportError:
+        pass
+    try:
+        from compression import zstd
+        return zstd.ZstdFile(raw)
+    except ImportError:
+        raise BlendReadError("Zstandard compressed .blend needs the 'zstandard' module")
+
+
+def _open_stream(filepath):
+    """Open .blend as a readable byte stream (decompressing if needed)"""
+    raw = open(filepath, 'rb')
+    magic = raw.read(4)
+    raw.seek(0)
+
+    try:
+        if magic[:2] == GZIP_MAGIC:
+            return gzip.GzipFile(fileobj=raw, mode='rb'), raw
+        if magic == ZSTD_MAGIC:
+            return _open_zstd(raw), raw
+    except Exception:
+        raw.close()
+        raise
+
+    return raw, None
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise BlendReadError("Unexpected end of file")
+    return data
+
+
+def _skip(stream, size):
+    """Skip bytes - seek on plain files, read and discard on compressed streams"""
+    if size <= 0:
+        return
+    try:
+        if stream.seekable():
+            stream.seek(size, os.SEEK_CUR)
+            return
+    except (AttributeError, OSError):
+        pass
+
+    while size > 0:
+        chunk = stream.read(min(size, 1024 * 1024))
+        if not chunk:
+            raise BlendReadError("Unexpected end of file")
+        size -= len(chunk)
+
+
+# =============================================================================
+# SDNA
+# =============================================================================
+
+class _StructLayout:
+    """Field offsets of one DNA struct"""
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        # {field_name: (offset, type_name, field_size, is_pointer)}
+        self.fields = {}
+
+
+class _SDNA:
+    """Decoded DNA1 block: struct layouts indexed by SDNA number"""
+
+    def __init__(self, data, endian, pointer_size):
+        self.endian = endian
+        self.pointer_size = pointer_size
+        self.structs = []
+        self.structs_by_name = {}
+        self._parse(data)
+
+    def _parse(self, data):
+        endian = self.endian
+        offset = 0
+
+        def expect(tag):
+            nonlocal offset
+            if data[offset:offset + 4] != tag:
+                raise BlendReadError(f"Bad SDNA section, expected {tag!r}")
+            offset += 4
+
+        def align4():
+            nonlocal offset
+            offset = (offset + 3) & ~3
+
+        def read_int():
+            nonlocal offset
+            value = struct.unpack_from(endian + 'i', data, offset)[0]
+            offset += 4
+            return value
+
+        def read_names(count):
+            nonlocal offset
+            names = []
+            for _ in range(count):
+                end = data.index(b'\0', offset)
+                names.append(data[offset:end].decode('latin-1'))
+                offset = end + 1
+            return names
+
+        expect(b'SDNA')
+        expect(b'NAME')
+        names = read_names(read_int())
+        align4()
+
+        expect(b'TYPE')
+        types = read_names(read_int())
+        align4()
+
+        expect(b'TLEN')
+        type_lengths = struct.unpack_from(f"{endian}{len(types)}h", data, offset)
+        offset += 2 * len(types)
+        align4()
+
+        expect(b'STRC')
+        struct_count = read_int()
+        for _ in range(struct_count):
+            type_index, field_count = struct.unpack_from(endian + 'hh', data, offset)
+            offset += 4
+            layout = _StructLayout(types[type_index], type_lengths[type_index])
+
+            field_offset = 0
+            for _ in range(field_count):
+                field_type, field_name = struct.unpack_from(endian + 'hh', data, offset)
+                offset += 4
+
+                raw_name = names[field_name]
+                is_pointer = raw_name.startswith('*') or raw_name.startswith('(*')
+                size = self.pointer_size if is_pointer else type_lengths[field_type]
+                size *= _array_length(raw_name)
+
+                layout.fields[_bare_name(raw_name)] = (
+                    field_offset, types[field_type], size, is_pointer
+                )
+                field_offset += size
+
+            self.structs.append(layout)
+            self.structs_by_name[layout.name] = layout
+
+    def field(self, layout, *path):
+        """Resolve nested field path (e.g. 'id', 'name') to (offset, size, is_pointer)"""
+        offset = 0
+        for index, name in enumerate(path):
+            if name not in layout.fields:
+                return None
+            field_offset, type_name, size, is_pointer = layout.fields[name]
+            offset += field_offset
+            if index < len(path) - 1:
+                layout = self.structs_by_name.get(type_name)
+                if layout is None:
+                    return None
+        return offset, size, is_pointer
+
+
+def _bare_name(raw_name):
+    """'*next' -> 'next', 'name[66]' -> 'name', '(*func)()' -> 'func'"""
+    name = raw_name.lstrip('*')
+    if name.startswith('('):
+        name = name[1:].lstrip('*').split(')', 1)[0]
+    return name.split('[', 1)[0]
+
+
+def _array_length(raw_name):
+    """'name[64][2]' -> 128"""
+    length = 1
+    for part in raw_name.split('[')[1:]:
+        try:
+            length *= int(part.split(']', 1)[0])
+        except ValueError:
+            pass
+    return length
+
+
+# =============================================================================
+# FILE WALK
+# =============================================================================
+
+def _read_header(stream):
+    """
+    Parse file header.
+
+    Returns:
+        tuple: (pointer_size, endian, version, bhead_format)
+               bhead_format: 'legacy' or 'large' (Blender 5.x)
+    """
+    head = _read_exact(stream, 12)
+    if head[:7] != b'BLENDER':
+        raise BlendReadError("Not a .blend file")
+
+    marker = head[7:8]
+    if marker in (b'_', b'-'):
+        pointer_size = 8 if marker == b'-' else 4
+        endian = '<' if head[8:9] == b'v' else '>'
+        return pointer_size, endian, head[9:12].decode('ascii', 'replace'), 'legacy'
+
+    # Blender 5.x: 'BLENDER' + header size (2) + '-' + format (2) + 'v' + version (4)
+    try:
+        header_size = int(head[7:9])
+    except ValueError:
+        raise BlendReadError("Unknown .blend header")
+    rest = _read_exact(stream, header_size - 12)
+    full = head + rest
+    endian = '<' if full[12:13] == b'v' else '>'
+    return 8, endian, full[13:header_size].decode('ascii', 'replace'), 'large'
+
+
+def _iter_blocks(stream, pointer_size, endian, bhead_format, keep_codes):
+    """
+    Walk block headers, yielding (code, sdna_index, count, data) for kept
+    blocks and DNA1. Data of other blocks is skipped.
+    """
+    if bhead_format == 'large':
+        bhead = struct.Struct(endian + '4siQqq')
+    elif pointer_size == 8:
+        bhead = struct.Struct(endian + '4siQii')
+    else:
+        bhead = struct.Struct(endian + '4siIii')
+
+    while True:
+        raw = stream.read(bhead.size)
+        if len(raw) < bhead.size:
+            return
+
+        if bhead_format == 'large':
+            code, sdna_index, _old, length, count = bhead.unpack(raw)
+        else:
+            code, length, _old, sdna_index, count = bhead.unpack(raw)
+
+        if code == b'ENDB':
+            return
+
+        if code in keep_codes or code == b'DNA1':
+            yield code, sdna_index, count, _read_exact(stream, length)
+        else:
+            _skip(stream, length)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def _decode_string(data, field):
+    if field is None:
+        return ""
+    offset, size, _is_pointer = field
+    raw = data[offset:offset + size]
+    return raw.split(b'\0', 1)[0].decode('utf-8', errors='replace')
+
+
+def _read_pointer(data, field, pointer_size, endian):
+    if field is None:
+        return 0
+    offset = field[0]
+    fmt = endian + ('Q' if pointer_size == 8 else 'I')
+    return struct.unpack_from(fmt, data, offset)[0]
+
+
+def _read_short(data, field, endian):
+    if field is None:
+        return 0
+    return struct.unpack_from(endian + 'h', data, field[0])[0]
+
+
+def _is_image_packed(data, sdna, layout, pointer_size, endian):
+    """Packed image check: 'packedfiles' ListBase (current) or legacy 'packedfile' pointer"""
+    packedfiles = sdna.field(layout, 'packedfiles', 'first')
+    if packedfiles is not None and _read_pointer(data, packedfiles, pointer_size, endian) != 0:
+        return True
+    return _read_pointer(data, sdna.field(layout, 'packedfile'), pointer_size, endian) != 0
+
+
+def read_blend_info(filepath):
+    """
+    Read image and library data-blocks of a .blend without opening it.
+
+    Returns:
+        BlendInfo: images (list of ImageRef), libraries (list of LibraryRef), version
+
+    Raises:
+        BlendReadError: File cannot be parsed
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError as e:
+        raise BlendReadError(str(e))
+
+    cache_key = os.path.normcase(os.path.abspath(filepath))
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _info_cache.get(cache_key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    info = _read_blend_info(filepath)
+    _info_cache[cache_key] = (signature, info)
+    return info
+
+
+def _read_blend_info(filepath):
+    blocks = []
+    sdna_data = None
+
+    try:
+        stream, raw = _open_stream(filepath)
+    except OSError as e:
+        raise BlendReadError(str(e))
+
+    try:
+        pointer_size, endian, version, bhead_format = _read_header(stream)
+        for code, sdna_index, count, data in _iter_blocks(
+            stream, pointer_size, endian, bhead_format, _READ_CODES
+        ):
+            if code == b'DNA1':
+                sdna_data = data
+            else:
+                blocks.append((code, sdna_index, data))
+    except (OSError, EOFError, struct.error) as e:
+        raise BlendReadError(f"Cannot read {os.path.basename(filepath)}: {e}")
+    finally:
+        stream.close()
+        if raw is not None:
+            raw.close()
+
+    if sdna_data is None:
+        raise BlendReadError(f"No DNA1 block in {os.path.basename(filepath)}")
+
+    try:
+        sdna = _SDNA(sdna_data, endian, pointer_size)
+    except (ValueError, IndexError, struct.error) as e:
+        raise BlendReadError(f"Cannot decode SDNA: {e}")
+
+    images = []
+    libraries = []
+
+    for code, sdna_index, data in blocks:
+        if sdna_index >= len(sdna.structs):
+            continue
+        layout = sdna.structs[sdna_index]
+
+        name = _decode_string(data, sdna.field(layout, 'id', 'name'))[2:]
+
+        if code == CODE_IMAGE:
+            # 'name' held the path before 2.80
+            path_field = sdna.field(layout, 'filepath') or sdna.field(layout, 'name')
+            images.append(ImageRef(
+                name=name,
+                filepath=_decode_string(data, path_field),
+                source=_read_short(data, sdna.field(layout, 'source'), endian),
+                packed=_is_image_packed(data, sdna, layout, pointer_size, endian),
+                linked=_read_pointer(data, sdna.field(layout, 'id', 'lib'), pointer_size, endian) != 0,
+            ))
+        elif code == CODE_LIBRARY:
+            # Library.filepath is the path as linked (relative '//' paths kept)
+            path_field = sdna.field(layout, 'filepath') or sdna.field(layout, 'name')
+            libraries.append(LibraryRef(
+                name=name,
+                filepath=_decode_string(data, path_field),
+            ))
+
+    return BlendInfo(images=images, libraries=libraries, version=version)
+
+
+def resolve_blend_path(path, blend_filepath):
+    """Resolve a Blender path ('//' relative to the .blend) to an absolute normalized path"""
+    if os.sep == '/':
+        path = path.replace('\\', '/')
+    if path.startswith('//'):
+        path = os.path.join(os.path.dirname(os.path.abspath(blend_filepath)), path[2:])
+    return os.path.normpath(path)
+
+
+def get_image_paths(blend_filepath):
+    """
+    Absolute paths of file-based, unpacked, local images used by a .blend.
+
+    Tiled (UDIM) images keep their stored path; callers expand tiles with
+    utils/texture_utils.normalize_udim.
+
+    Raises:
+        BlendReadError: File cannot be parsed
+    """
+    paths = []
+    for image in read_blend_info(blend_filepath).images:
+        if image.packed or image.linked or not image.filepath:
+            continue
+        if image.source not in (IMA_SRC_FILE, IMA_SRC_SEQUENCE, IMA_SRC_TILED):
+            continue
+        paths.append(resolve_blend_path(image.filepath, blend_filepath))
+    return paths
+
+
+def get_library_paths(blend_filepath):
+    """
+    Absolute paths of libraries linked directly by a .blend.
+
+    Raises:
+        BlendReadError: File cannot be parsed
+    """
+    return [
+        resolve_blend_path(library.filepath, blend_filepath)
+        for library in read_blend_info(blend_filepath).libraries
+        if library.filepath
+    ]
@@ -0,0 +1,300 @@
+"""
+Copy Engine Utility
+
+Bounded thread-pool file copier with byte-level progress and cancellation.
+Used by the publish operator so large texture sets can be copied while the
+Blender UI stays responsive (the operator polls the engine from a timer).
+
+Everything here runs on worker threads.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .file_compare import files_identical
+from .publish_manifest import lookup_known_hash
+
+
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+PARTIAL_SUFFIX = ".part"
+
+
+def format_bytes(num_bytes):
+    """Format byte count for UI/log display (e.g. 1536 -> '1.5 KB')"""
+    size = float(num_bytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024.0:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} TB"
+
+
+def link_or_copy(source, target):
+    """
+    Hardlink source to target, falling back to a regular copy.
+
+    Returns:
+        bool: True if a hardlink was created
+    """
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if os.path.lexists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+        return True
+    except (OSError, AttributeError):
+        shutil.copy2(source, target)
+        return False
+
+
+def break_hardlink(filepath):
+    """Give a hardlinked file its own copy before editing it in place"""
+    try:
+        if os.stat(filepath).st_nlink <= 1:
+            return False
+    except OSError:
+        return False
+
+    partial = filepath + PARTIAL_SUFFIX
+    shutil.copy2(filepath, partial)
+    os.replace(partial, filepath)
+    return True
+
+
+class CopyCancelled(Exception):
+    """Raised inside a copy worker when the engine was cancelled"""
+    pass
+
+
+class CopyEngine:
+    """
+    Copy a list of files with a bounded pool of worker threads.
+
+    Files are written to '<target>.part' and renamed into place when complete,
+    so a cancelled or failed copy never leaves a truncated file at the target.
+
+    With incremental=True, targets that already match their source
+    (see utils/file_compare.files_identical) are skipped. known_hashes
+    (from utils/publish_manifest.get_known_hashes) avoids re-reading targets.
+
+    An MD5 of every copied file is computed while copying (results[i]['hash']).
+
+    Jobs are (source, target) or (source, target, write_path): target is the
+    final published path (used for incremental checks and results), write_path
+    is where the bytes actually go (e.g. a staging folder, see
+    utils/publish_staging.py). fsync=True flushes each file before renaming.
+    before_write(write_path) is called from the worker right before a file is
+    actually copied (not for skipped files), e.g. PublishRollback.record.
+
+    Usage:
+        engine = CopyEngine([(src, dst), ...], max_workers=4)
+        engine.start()
+        while not engine.done: ...   # poll from a modal timer
+        engine.shutdown()
+    """
+
+    def __init__(self, jobs, max_workers=4, incremental=False, known_hashes=None, fsync=False,
+                 before_write=None):
+        self.jobs = [tuple(job) if len(job) == 3 else (job[0], job[1], job[1]) for job in jobs]
+        self.max_workers = max(1, int(max_workers))
+        self.incremental = incremental
+        self.known_hashes = known_hashes or {}
+        self.fsync = fsync
+        self.before_write = before_write
+
+        self.total_files = len(self.jobs)
+        self.total_bytes = 0
+        for source, _target, _write_path in self.jobs:
+            try:
+                self.total_bytes += os.path.getsize(source)
+            except OSError:
+                pass
+
+        self.copied_bytes = 0
+        self.completed_files = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+        self.current_file = ""
+        self.results = []
+        self.errors = []
+
+        self.start_time = None
+        self.end_time = None
+
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._executor = None
+        self._futures = []
+
+    # -------------------------------------------------------------------------
+    # Control
+    # -------------------------------------------------------------------------
+
+    def start(self):
+        """Submit all copy jobs to the worker pool (returns immediately)"""
+        self.start_time = time.perf_counter()
+
+        if not self.jobs:
+            self.end_time = self.start_time
+            return
+
+        workers = min(self.max_workers, len(self.jobs))
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset_copy")
+        self._futures = [
+            self._executor.submit(self._run_job, source, target, write_path)
+            for source, target, write_path in self.jobs
+        ]
+
+    def cancel(self):
+        """Request cancellation - running copies stop at the next chunk"""
+        self._cancel_event.set()
+
+    def wait(self):
+        """Block until all jobs have finished (used in background mode)"""
+        for future in self._futures:
+            try:
+                future.result()
+            except Exception:
+                pass
+        self.shutdown()
+
+    def shutdown(self):
+        """Release the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+
+    # -------------------------------------------------------------------------
+    # Status
+    # -------------------------------------------------------------------------
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self):
+        return all(future.done() for future in self._futures)
+
+    @property
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return max(end - self.start_time, 0.0)
+
+    @property
+    def throughput(self):
+        """Average bytes per second since start"""
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return 0.0
+        return self.copied_bytes / elapsed
+
+    @property
+    def progress(self):
+        """Progress as 0.0 - 1.0 (bytes-based, falls back to file count)"""
+        if self.total_bytes > 0:
+            return min((self.copied_bytes + self.skipped_bytes) / self.total_bytes, 1.0)
+        if self.total_files > 0:
+            return self.completed_files / self.total_files
+        return 1.0
+
+    def status_text(self):
+        """One-line progress summary for header/panel display"""
+        text = (
+            f"{self.completed_files}/{self.total_files} files | "
+            f"{format_bytes(self.copied_bytes)} / {format_bytes(self.total_bytes)} | "
+            f"{format_bytes(self.throughput)}/s"
+        )
+        if self.skipped_files:
+            text += f" | {self.skipped_files} unchanged"
+        return text
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _run_job(self, source, target, write_path):
+        if self._cancel_event.is_set():
+            return
+
+        with self._lock:
+            self.current_file = os.path.basename(source)
+
+        if self.incremental:
+            target_hash = lookup_known_hash(self.known_hashes, target)
+            if files_identical(source, target, target_hash=target_hash):
+                size = os.path.getsize(target)
+                with self._lock:
+                    self.completed_files += 1
+                    self.skipped_files += 1
+                    self.skipped_bytes += size
+                    self.results.append({
+                        'source': source, 'target': target, 'size': size,
+                        'hash': target_hash, 'skipped': True
+                    })
+                return
+
+        try:
+            if self.before_write is not None:
+                self.before_write(write_path)
+            size, file_hash = self._copy_file(source, write_path)
+        except CopyCancelled:
+            return
+        except Exception as e:
+            with self._lock:
+                self.errors.append((source, str(e)))
+            return
+
+        with self._lock:
+            self.completed_files += 1
+            self.results.append({
+                'source': source, 'target': target, 'size': size,
+                'hash': file_hash, 'skipped': False
+            })
+
+    def _copy_file(self, source, target):
+        """Chunked copy to '<target>.part', then atomic rename into place"""
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        partial = target + PARTIAL_SUFFIX
+        written = 0
+        hasher = hashlib.md5()
+
+        try:
+            with open(source, 'rb') as src, open(partial, 'wb') as dst:
+                while True:
+                    if self._cancel_event.is_set():
+                        raise CopyCancelled()
+
+                    chunk = src.read(COPY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+
+                    dst.write(chunk)
+                    hasher.update(chunk)
+                    written += len(chunk)
+                    with self._lock:
+                        self.copied_bytes += len(chunk)
+
+                if self.fsync:
+                    dst.flush()
+                    os.fsync(dst.fileno())
+
+            shutil.copystat(source, partial)
+            os.replace(partial, target)
+        except BaseException:
+            try:
+                if os.path.exists(partial):
+                    os.remove(partial)
+            except OSError:
+                pass
+            raise
+
+        return written, hasher.hexdigest()
@@ -0,0 +1,101 @@
+"""
+Duplicate Finder Utility
+
+Find byte-identical files under different names and folders.
+
+Candidates are narrowed cheapest first, so most files are never read:
+1. File size            - one stat per file
+2. Head + tail hash     - first and last HEAD_TAIL_SIZE bytes
+3. Full content hash    - MD5, taken from the texture cache when given
+
+Hashing runs in a small thread pool (hashlib releases the GIL), so
+thousands of candidates stay I/O bound.
+"""
+
+import hashlib
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from .file_compare import calculate_file_hash
+
+
+HEAD_TAIL_SIZE = 64 * 1024
+
+HASH_WORKERS = 4
+
+
+def _head_tail_hash(filepath, size):
+    """Hash of the first and last block (None if the file cannot be read)"""
+    h = hashlib.md5()
+    try:
+        with open(filepath, 'rb') as f:
+            h.update(f.read(HEAD_TAIL_SIZE))
+            if size > HEAD_TAIL_SIZE:
+                f.seek(max(size - HEAD_TAIL_SIZE, HEAD_TAIL_SIZE))
+                h.update(f.read(HEAD_TAIL_SIZE))
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def _split_by(groups, key_function, executor):
+    """Split each group by key_function(path, size); drop singles and unreadable files"""
+    result = []
+    for size, paths in groups:
+        keys = executor.map(lambda path: key_function(path, size), paths)
+        buckets = defaultdict(list)
+        for path, key in zip(paths, keys):
+            if key is not None:
+                buckets[key].append(path)
+        result.extend((size, bucket) for bucket in buckets.values() if len(bucket) > 1)
+    return result
+
+
+def find_identical_files(paths, cache=None):
+    """
+    Group byte-identical files.
+
+    Args:
+        paths: File paths (duplicates of the same path are ignored)
+        cache: Optional TextureCache - full hashes are read from / stored in it
+
+    Returns:
+        list: Groups (lists of paths, input order kept) with 2+ distinct files
+    """
+    unique_paths = []
+    seen = set()
+    for path in paths:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            unique_paths.append(path)
+
+    by_size = defaultdict(list)
+    for path in unique_paths:
+        try:
+            by_size[os.path.getsize(path)].append(path)
+        except OSError:
+            continue
+
+    groups = [(size, group) for size, group in by_size.items() if len(group) > 1]
+    if not groups:
+        return []
+
+    def full_hash(path, size):
+        if cache is not None:
+            return cache.get_hash(path)
+        return calculate_file_hash(path)
+
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="dupe-hash") as executor:
+        groups = _split_by(groups, _head_tail_hash, executor)
+        # Small files were read completely by the head/tail pass
+        small = [(size, group) for size, group in groups if size <= HEAD_TAIL_SIZE * 2]
+        large = [(size, group) for size, group in groups if size > HEAD_TAIL_SIZE * 2]
+        groups = small + _split_by(large, full_hash, executor)
+
+    order = {path: index for index, path in enumerate(unique_paths)}
+    return sorted(
+        (sorted(group, key=order.get) for size, group in groups),
+        key=lambda group: order[group[0]]
+    )
@@ -0,0 +1,66 @@
+"""
+File Comparison Utility
+
+Decide whether a published file is already up to date with its source.
+Used by incremental publish to skip unchanged textures, libraries and blends.
+
+Comparison order (cheapest first):
+1. Size differs          -> changed
+2. Size + mtime match    -> unchanged (publish copies preserve mtime)
+3. Size match, mtime not -> compare content hashes
+"""
+
+import hashlib
+import os
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# FAT/SMB shares store mtime with 2 second resolution
+MTIME_TOLERANCE = 2.0
+
+
+def calculate_file_hash(filepath):
+    """Calculate MD5 hash of a file (None if it cannot be read)"""
+    h = hashlib.md5()
+    try:
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def files_identical(source, target, target_hash=None):
+    """
+    Check if target already holds the same content as source.
+
+    Args:
+        source: Source file path
+        target: Existing published file path
+        target_hash: Known MD5 of target (skips re-reading target if given)
+
+    Returns:
+        bool: True if target can be kept as-is
+    """
+    try:
+        source_stat = os.stat(source)
+        target_stat = os.stat(target)
+    except OSError:
+        return False
+
+    if source_stat.st_size != target_stat.st_size:
+        return False
+
+    if abs(source_stat.st_mtime - target_stat.st_mtime) < MTIME_TOLERANCE:
+        return True
+
+    source_hash = calculate_file_hash(source)
+    if source_hash is None:
+        return False
+
+    if target_hash is None:
+        target_hash = calculate_file_hash(target)
+
+    return source_hash == target_hash
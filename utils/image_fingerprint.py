@@ -0,0 +1,138 @@
+"""
+Image Fingerprint Utility
+
+Perceptual fingerprints for finding the same texture saved as a different
+format or resolution (PNG vs JPG, 4K vs 2K).
+
+Fingerprint = difference hash (dHash) of a 9x8 luminance thumbnail plus the
+mean luminance. dHash alone cannot tell flat or low-detail images apart
+(all of them hash to ~0), so the mean has to match too.
+
+Candidate pairs are found with the pigeonhole rule: two 64-bit hashes
+within Hamming distance t share at least one of t + 1 bit chunks exactly.
+Images are bucketed per chunk and only bucket mates are compared, which
+keeps thousands of images far from an all-pairs comparison.
+"""
+
+from collections import defaultdict
+
+import numpy as np
+
+from .image_resample import FILTER_BOX, resample
+
+
+HASH_SIZE = 8
+HASH_BITS = HASH_SIZE * HASH_SIZE
+
+DEFAULT_MAX_DISTANCE = 5
+DEFAULT_MAX_MEAN_DIFFERENCE = 0.05
+
+# Rec. 709 luma
+LUMA_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+
+def compute_fingerprint(pixels):
+    """
+    Fingerprint of an image.
+
+    Args:
+        pixels: float32 array [height, width, channels]
+
+    Returns:
+        dict: {'dhash': int (64 bit), 'mean': float}
+    """
+    pixels = np.asarray(pixels, dtype=np.float32)
+    if pixels.shape[2] >= 3:
+        luma = pixels[:, :, :3] @ LUMA_WEIGHTS
+    else:
+        luma = pixels[:, :, 0]
+
+    # Box filter averages every source pixel, so large images do not alias
+    thumbnail = resample(luma[:, :, None], HASH_SIZE + 1, HASH_SIZE, FILTER_BOX, clamp=False)[:, :, 0]
+    bits = (thumbnail[:, 1:] > thumbnail[:, :-1]).ravel()
+
+    dhash = 0
+    for bit in bits:
+        dhash = (dhash << 1) | int(bit)
+
+    return {'dhash': dhash, 'mean': round(float(luma.mean()), 4)}
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+
+def _chunk_masks(max_distance):
+    """Split HASH_BITS into max_distance + 1 contiguous chunks"""
+    chunks = max_distance + 1
+    masks = []
+    start = 0
+    for index in range(chunks):
+        width = HASH_BITS // chunks + (1 if index < HASH_BITS % chunks else 0)
+        masks.append(((1 << width) - 1) << start)
+        start += width
+    return masks
+
+
+def cluster_fingerprints(items, max_distance=DEFAULT_MAX_DISTANCE,
+                         max_mean_difference=DEFAULT_MAX_MEAN_DIFFERENCE, sort_key=None):
+    """
+    Cluster perceptually similar images.
+
+    Clusters are not transitive: A~B and B~C does not put A and C together.
+    The best remaining image (by sort_key) starts a cluster and takes the
+    images similar to it and to every member already taken (complete
+    linkage), so no image is ever merged onto one beyond the threshold.
+
+    Args:
+        items: [(key, group, fingerprint), ...] - only items with equal group
+            (e.g. aspect ratio and color space) are compared
+        max_distance: Max dHash Hamming distance (0-63)
+        max_mean_difference: Max difference of mean luminance
+        sort_key: Called with a key, lower sorts as better quality
+            (default: input order)
+
+    Returns:
+        list: Clusters (lists of keys, best first) with 2+ items
+    """
+    masks = _chunk_masks(max_distance)
+    buckets = defaultdict(list)
+    for index, (key, group, fingerprint) in enumerate(items):
+        for chunk, mask in enumerate(masks):
+            buckets[(group, chunk, fingerprint['dhash'] & mask)].append(index)
+
+    neighbors = defaultdict(set)
+    compared = set()
+    for members in buckets.values():
+        for position, a in enumerate(members):
+            for b in members[position + 1:]:
+                if (a, b) in compared:
+                    continue
+                compared.add((a, b))
+                fingerprint_a = items[a][2]
+                fingerprint_b = items[b][2]
+                if (hamming_distance(fingerprint_a['dhash'], fingerprint_b['dhash']) <= max_distance
+                        and abs(fingerprint_a['mean'] - fingerprint_b['mean']) <= max_mean_difference):
+                    neighbors[a].add(b)
+                    neighbors[b].add(a)
+
+    order = list(range(len(items)))
+    if sort_key is not None:
+        order.sort(key=lambda index: sort_key(items[index][0]))
+    rank = {index: position for position, index in enumerate(order)}
+
+    assigned = set()
+    clusters = []
+    for center in order:
+        if center in assigned or not neighbors[center]:
+            continue
+        cluster = [center]
+        for candidate in sorted(neighbors[center], key=rank.get):
+            if candidate in assigned:
+                continue
+            if all(candidate in neighbors[member] for member in cluster[1:]):
+                cluster.append(candidate)
+        if len(cluster) > 1:
+            assigned.update(cluster)
+            clusters.append([items[index][0] for index in cluster])
+    return clusters
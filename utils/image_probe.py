@@ -0,0 +1,406 @@
+"""
+Image Probe Utility
+
+Reads image dimensions and format from file headers only - no pixel decode
+and no bpy.data.images.load().
+
+Supported formats (format names match Image.file_format):
+- PNG       IHDR chunk
+- JPEG      SOFn segment
+- TARGA     18-byte header (no magic - detected by .tga extension, backup
+            suffixes such as .tga.hires / .tga.fmt included)
+- BMP       BITMAPINFOHEADER / OS/2 core header
+- TIFF      first IFD (classic and BigTIFF)
+- OPEN_EXR  dataWindow and channels attributes of the (first) part header
+- WEBP      VP8 / VP8L / VP8X chunk
+- HDR       Radiance resolution line
+
+Results are cached per (path, size, mtime), so probing the same file twice
+in a session costs one stat.
+"""
+
+import os
+import struct
+from collections import namedtuple
+
+
+ImageInfo = namedtuple('ImageInfo', ['width', 'height', 'channels', 'bit_depth', 'format'])
+
+# Most headers fit in the first read; EXR and JPEG may need more
+HEADER_READ_SIZE = 4096
+MAX_HEADER_SIZE = 1024 * 1024
+
+PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
+JPEG_MAGIC = b'\xff\xd8'
+EXR_MAGIC = b'\x76\x2f\x31\x01'
+
+# Appended to backups of original textures (Downgrade Resolution, Convert Format)
+BACKUP_SUFFIXES = ('.hires', '.fmt')
+
+# {normcase path: ((size, mtime_ns), ImageInfo or None)}
+_probe_cache = {}
+
+
+class ImageProbeError(Exception):
+    """Raised when an image header cannot be parsed"""
+    pass
+
+
+def probe_image(filepath):
+    """
+    Read image info from the file header.
+
+    Returns:
+        ImageInfo, or None if the file is missing or the format is not supported
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+
+    cache_key = os.path.normcase(os.path.abspath(filepath))
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _probe_cache.get(cache_key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    try:
+        info = _probe_file(filepath)
+    except (OSError, ImageProbeError, struct.error, ValueError, IndexError):
+        info = None
+
+    _probe_cache[cache_key] = (signature, info)
+    return info
+
+
+def probe_size(filepath):
+    """(width, height) from the file header, or None"""
+    info = probe_image(filepath)
+    if info is None:
+        return None
+    return info.width, info.height
+
+
+# Short names for UI labels (extension style)
+FORMAT_LABELS = {
+    'JPEG': 'JPG',
+    'OPEN_EXR': 'EXR',
+    'TARGA': 'TGA',
+}
+
+
+def get_format_label(filepath, name=None, probe=None):
+    """
+    Short format name of a file, read from its header.
+
+    Falls back to the upper-case extension of name (default: filepath) when
+    the header cannot be probed - pass the original name for backup files
+    such as "wood.png.fmt". probe replaces probe_image (e.g. a cache lookup).
+    """
+    info = (probe or probe_image)(filepath)
+    if info is not None:
+        return FORMAT_LABELS.get(info.format, info.format)
+
+    ext = _source_extension(name or filepath).upper().lstrip('.')
+    return 'JPG' if ext == 'JPEG' else ext
+
+
+def _probe_file(filepath):
+    with open(filepath, 'rb') as f:
+        head = f.read(HEADER_READ_SIZE)
+
+        if head.startswith(PNG_MAGIC):
+            return _probe_png(head)
+        if head.startswith(JPEG_MAGIC):
+            return _probe_jpeg(f)
+        if head.startswith(EXR_MAGIC):
+            return _probe_exr(f)
+        if head[:4] in (b'II*\x00', b'MM\x00*', b'II+\x00', b'MM\x00+'):
+            return _probe_tiff(f, head)
+        if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+            return _probe_webp(head)
+        if head[:2] == b'BM':
+            return _probe_bmp(head)
+        if head.startswith(b'#?'):
+            return _probe_hdr(head)
+        if _source_extension(filepath) in ('.tga', '.targa'):
+            return _probe_tga(head)
+
+    return None
+
+
+def _source_extension(filepath):
+    """Lower-case extension of the original file ('wood.tga.hires' -> '.tga')"""
+    root, ext = os.path.splitext(filepath)
+    while ext.lower() in BACKUP_SUFFIXES:
+        root, ext = os.path.splitext(root)
+    return ext.lower()
+
+
+def _need(data, size):
+    if len(data) < size:
+        raise ImageProbeError("Truncated header")
+
+
+# =============================================================================
+# FORMATS
+# =============================================================================
+
+def _probe_png(head):
+    _need(head, 26)
+    if head[12:16] != b'IHDR':
+        raise ImageProbeError("PNG without IHDR")
+
+    width, height, bit_depth, color_type = struct.unpack('>IIBB', head[16:26])
+    # Grayscale, -, RGB, palette, gray+alpha, -, RGBA
+    channels = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}.get(color_type)
+    if channels is None:
+        raise ImageProbeError(f"Unknown PNG color type {color_type}")
+
+    # tRNS gives a palette or RGB image an alpha channel
+    if color_type in (2, 3) and _png_has_trns(head):
+        channels = 4
+    if color_type == 3:
+        bit_depth = 8
+
+    return ImageInfo(width, height, channels, bit_depth, 'PNG')
+
+
+def _png_has_trns(head):
+    offset = 8
+    while offset + 8 <= len(head):
+        length, chunk_type = struct.unpack('>I4s', head[offset:offset + 8])
+        if chunk_type == b'tRNS':
+            return True
+        if chunk_type == b'IDAT':
+            return False
+        offset += 12 + length
+    return False
+
+
+# SOF markers carry the frame size; C4 (DHT), C8 (JPG) and CC (DAC) do not
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _probe_jpeg(f):
+    f.seek(2)
+    while f.tell() < MAX_HEADER_SIZE:
+        byte = f.read(1)
+        if not byte:
+            break
+        if byte != b'\xff':
+            continue
+
+        marker = f.read(1)
+        while marker == b'\xff':
+            marker = f.read(1)
+        if not marker:
+            break
+        marker = marker[0]
+
+        # Standalone markers have no length
+        if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+            continue
+        if marker == 0xD9:
+            break
+
+        length_data = f.read(2)
+        _need(length_data, 2)
+        length = struct.unpack('>H', length_data)[0]
+
+        if marker in _JPEG_SOF:
+            data = f.read(6)
+            _need(data, 6)
+            precision, height, width, components = struct.unpack('>BHHB', data)
+            return ImageInfo(width, height, components, precision, 'JPEG')
+
+        f.seek(length - 2, os.SEEK_CUR)
+
+    raise ImageProbeError("JPEG without frame header")
+
+
+def _probe_exr(f):
+    f.seek(8)
+    width = height = None
+    channels = []
+
+    header_end = MAX_HEADER_SIZE
+    while f.tell() < header_end:
+        name = _read_cstring(f)
+        if not name:
+            break
+        attr_type = _read_cstring(f)
+        size_data = f.read(4)
+        _need(size_data, 4)
+        size = struct.unpack('<i', size_data)[0]
+        value = f.read(size)
+        _need(value, size)
+
+        if name == b'dataWindow' and attr_type == b'box2i':
+            xmin, ymin, xmax, ymax = struct.unpack('<iiii', value[:16])
+            width, height = xmax - xmin + 1, ymax - ymin + 1
+        elif name == b'channels' and attr_type == b'chlist':
+            channels = _parse_exr_channels(value)
+
+        if width is not None and channels:
+            break
+
+    if width is None or not channels:
+        raise ImageProbeError("EXR header without dataWindow or channels")
+
+    # 0 UINT, 1 HALF, 2 FLOAT
+    bit_depth = max({0: 32, 1: 16, 2: 32}.get(pixel_type, 32) for pixel_type in channels)
+    return ImageInfo(width, height, len(channels), bit_depth, 'OPEN_EXR')
+
+
+def _parse_exr_channels(value):
+    pixel_types = []
+    offset = 0
+    while offset < len(value) and value[offset] != 0:
+        end = value.index(b'\x00', offset)
+        offset = end + 1
+        pixel_types.append(struct.unpack('<i', value[offset:offset + 4])[0])
+        # pixel type, pLinear + reserved, xSampling, ySampling
+        offset += 16
+    return pixel_types
+
+
+def _read_cstring(f, limit=256):
+    chars = bytearray()
+    while len(chars) < limit:
+        c = f.read(1)
+        if not c:
+            raise ImageProbeError("Truncated header")
+        if c == b'\x00':
+            return bytes(chars)
+        chars += c
+    raise ImageProbeError("Attribute name too long")
+
+
+def _probe_tiff(f, head):
+    endian = '<' if head[:2] == b'II' else '>'
+    big = head[2:4] in (b'+\x00', b'\x00+')
+
+    if big:
+        ifd_offset = struct.unpack(endian + 'Q', head[8:16])[0]
+        f.seek(ifd_offset)
+        count = struct.unpack(endian + 'Q', f.read(8))[0]
+        entry_size, value_size = 20, 8
+    else:
+        ifd_offset = struct.unpack(endian + 'I', head[4:8])[0]
+        f.seek(ifd_offset)
+        count = struct.unpack(endian + 'H', f.read(2))[0]
+        entry_size, value_size = 12, 4
+
+    entries = f.read(count * entry_size)
+    _need(entries, count * entry_size)
+
+    # TIFF field types: SHORT 3, LONG 4, LONG8 16
+    type_formats = {3: 'H', 4: 'I', 16: 'Q'}
+    tags = {}
+    for i in range(count):
+        entry = entries[i * entry_size:(i + 1) * entry_size]
+        tag, field_type = struct.unpack(endian + 'HH', entry[:4])
+        if tag not in (256, 257, 258, 277):
+            continue
+        fmt = type_formats.get(field_type)
+        if fmt is None:
+            continue
+        # Only the first value is needed - it is inline unless the array is
+        # larger than the value slot
+        value_count = struct.unpack(endian + ('Q' if big else 'I'), entry[4:4 + value_size])[0]
+        value_field = entry[4 + value_size:]
+        if value_count * struct.calcsize(fmt) > value_size:
+            position = f.tell()
+            f.seek(struct.unpack(endian + ('Q' if big else 'I'), value_field)[0])
+            value_field = f.read(struct.calcsize(fmt))
+            f.seek(position)
+        tags[tag] = struct.unpack(endian + fmt, value_field[:struct.calcsize(fmt)])[0]
+
+    if 256 not in tags or 257 not in tags:
+        raise ImageProbeError("TIFF without image size")
+
+    return ImageInfo(tags[256], tags[257], tags.get(277, 1), tags.get(258, 1), 'TIFF')
+
+
+def _probe_webp(head):
+    _need(head, 30)
+    chunk = head[12:16]
+
+    if chunk == b'VP8 ':
+        # Frame tag (3) + start code (3), then 14-bit width/height
+        if head[23:26] != b'\x9d\x01\x2a':
+            raise ImageProbeError("Bad VP8 start code")
+        width, height = struct.unpack('<HH', head[26:30])
+        return ImageInfo(width & 0x3FFF, height & 0x3FFF, 3, 8, 'WEBP')
+
+    if chunk == b'VP8L':
+        if head[20] != 0x2F:
+            raise ImageProbeError("Bad VP8L signature")
+        bits = struct.unpack('<I', head[21:25])[0]
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        has_alpha = (bits >> 28) & 1
+        return ImageInfo(width, height, 4 if has_alpha else 3, 8, 'WEBP')
+
+    if chunk == b'VP8X':
+        flags = head[20]
+        width = int.from_bytes(head[24:27], 'little') + 1
+        height = int.from_bytes(head[27:30], 'little') + 1
+        return ImageInfo(width, height, 4 if flags & 0x10 else 3, 8, 'WEBP')
+
+    raise ImageProbeError(f"Unknown WebP chunk {chunk!r}")
+
+
+def _probe_bmp(head):
+    _need(head, 30)
+    header_size = struct.unpack('<I', head[14:18])[0]
+    if header_size == 12:
+        width, height, planes, bpp = struct.unpack('<HHHH', head[18:26])
+    else:
+        width, height, planes, bpp = struct.unpack('<iiHH', head[18:30])
+
+    channels = 4 if bpp == 32 else 3
+    return ImageInfo(abs(width), abs(height), channels, 8, 'BMP')
+
+
+def _probe_hdr(head):
+    lines = head.split(b'\n')
+    if not lines[0].startswith((b'#?RADIANCE', b'#?RGBE')):
+        raise ImageProbeError("Not a Radiance file")
+
+    # Header lines end with an empty line, then "-Y <h> +X <w>" (any orientation)
+    for index, line in enumerate(lines[1:], 1):
+        if line.strip():
+            continue
+        if index + 1 >= len(lines):
+            break
+        parts = lines[index + 1].split()
+        if len(parts) != 4:
+            break
+        first, second = int(parts[1]), int(parts[3])
+        if parts[0][1:2] == b'Y':
+            height, width = first, second
+        else:
+            width, height = first, second
+        return ImageInfo(width, height, 3, 32, 'HDR')
+
+    raise ImageProbeError("HDR without resolution line")
+
+
+def _probe_tga(head):
+    _need(head, 18)
+    image_type = head[2]
+    width, height, pixel_depth, descriptor = struct.unpack('<HHBB', head[12:18])
+    if image_type not in (1, 2, 3, 9, 10, 11) or width == 0 or height == 0:
+        raise ImageProbeError("Not a TGA file")
+
+    alpha_bits = descriptor & 0x0F
+    if image_type in (3, 11):
+        channels = 2 if alpha_bits else 1
+    elif image_type in (1, 9):
+        channels = 3
+    else:
+        channels = 4 if pixel_depth == 32 or alpha_bits else 3
+
+    return ImageInfo(width, height, channels, 8, 'TARGA')
@@ -0,0 +1,328 @@
+"""
+Image Resample Utility
+
+NumPy texture downscaling used by Downgrade Resolution.
+
+Filters (separable, support scaled by the downscale factor like Pillow):
+- BOX       Area average - fastest, slightly soft
+- BILINEAR  Triangle filter - smooth, good default for color maps
+- LANCZOS   Lanczos-3 - sharpest, may ring on hard edges (clamped to 0..1)
+
+ResamplePool runs jobs in a process pool. Pixels are handed over through
+shared memory (no pickling of large buffers). Spawned workers import this
+file as a top-level module, never the addon package (which needs bpy). If
+worker processes cannot start, the pool falls back to threads.
+"""
+
+import importlib
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+
+FILTER_BOX = 'BOX'
+FILTER_BILINEAR = 'BILINEAR'
+FILTER_LANCZOS = 'LANCZOS'
+
+LANCZOS_LOBES = 3
+
+POOL_START_TIMEOUT = 30.0
+
+# {(in_size, out_size, filter): (indices, weights)}
+_weights_cache = {}
+
+
+# =============================================================================
+# FILTER KERNELS
+# =============================================================================
+
+def _box(x):
+    return ((x > -0.5) & (x <= 0.5)).astype(np.float64)
+
+
+def _triangle(x):
+    return np.maximum(0.0, 1.0 - np.abs(x))
+
+
+def _lanczos(x):
+    x = np.asarray(x, dtype=np.float64)
+    result = np.sinc(x) * np.sinc(x / LANCZOS_LOBES)
+    result[np.abs(x) >= LANCZOS_LOBES] = 0.0
+    return result
+
+
+_FILTERS = {
+    FILTER_BOX: (_box, 0.5),
+    FILTER_BILINEAR: (_triangle, 1.0),
+    FILTER_LANCZOS: (_lanczos, float(LANCZOS_LOBES)),
+}
+
+
+def get_target_size(width, height, max_dimension):
+    """Scale (width, height) so the longer side is max_dimension (same rounding as before)"""
+    if width > height:
+        return max_dimension, max(1, int(height * (max_dimension / width)))
+    return max(1, int(width * (max_dimension / height))), max_dimension
+
+
+def _axis_weights(in_size, out_size, filter_name):
+    """
+    Precompute taps for resampling one axis.
+
+    Returns:
+        tuple: (indices int32 [out, taps], weights float32 [out, taps])
+    """
+    key = (in_size, out_size, filter_name)
+    cached = _weights_cache.get(key)
+    if cached is not None:
+        return cached
+
+    kernel, support = _FILTERS[filter_name]
+    scale = in_size / out_size
+    filter_scale = max(scale, 1.0)
+    support *= filter_scale
+
+    centers = (np.arange(out_size) + 0.5) * scale
+    taps = int(math.ceil(support)) * 2 + 1
+    first = np.floor(centers - support).astype(np.int64)
+
+    indices = first[:, None] + np.arange(taps)[None, :]
+    distances = (indices + 0.5 - centers[:, None]) / filter_scale
+    weights = kernel(distances)
+
+    # Clamp to edge, then normalize each output pixel
+    indices = np.clip(indices, 0, in_size - 1)
+    totals = weights.sum(axis=1, keepdims=True)
+    totals[totals == 0] = 1.0
+    weights = weights / totals
+
+    result = (indices.astype(np.int32), weights.astype(np.float32))
+    _weights_cache[key] = result
+    return result
+
+
+def _resample_axis(pixels, out_size, axis, filter_name):
+    in_size = pixels.shape[axis]
+    if in_size == out_size:
+        return pixels
+
+    indices, weights = _axis_weights(in_size, out_size, filter_name)
+    result = None
+    for tap in range(indices.shape[1]):
+        sample = np.take(pixels, indices[:, tap], axis=axis)
+        shape = [1] * pixels.ndim
+        shape[axis] = out_size
+        contribution = sample * weights[:, tap].reshape(shape)
+        if result is None:
+            result = contribution
+        else:
+            result += contribution
+    return result
+
+
+def resample(pixels, out_width, out_height, filter_name=FILTER_BILINEAR, clamp=True):
+    """
+    Resample an image array.
+
+    Args:
+        pixels: float32 array [height, width, channels]
+        out_width, out_height: Target size
+        filter_name: FILTER_BOX / FILTER_BILINEAR / FILTER_LANCZOS
+        clamp: Clip result to 0..1 (byte images - Lanczos can overshoot)
+
+    Returns:
+        float32 array [out_height, out_width, channels]
+    """
+    if filter_name not in _FILTERS:
+        raise ValueError(f"Unknown filter: {filter_name}")
+
+    pixels = np.asarray(pixels, dtype=np.float32)
+    # Shrink the larger axis first - the second pass then works on less data
+    if pixels.shape[1] - out_width >= pixels.shape[0] - out_height:
+        result = _resample_axis(pixels, out_width, 1, filter_name)
+        result = _resample_axis(result, out_height, 0, filter_name)
+    else:
+        result = _resample_axis(pixels, out_height, 0, filter_name)
+        result = _resample_axis(result, out_width, 1, filter_name)
+
+    if result is pixels:
+        result = pixels.copy()
+    if clamp:
+        np.clip(result, 0.0, 1.0, out=result)
+    return np.ascontiguousarray(result, dtype=np.float32)
+
+
+def resample_pyramid(pixels, sizes, filter_name=FILTER_BILINEAR, clamp=True):
+    """
+    Resample an image to several sizes, each level from the previous one.
+
+    Args:
+        pixels: float32 array [height, width, channels]
+        sizes: [(out_width, out_height), ...] largest first
+
+    Returns:
+        list: float32 arrays, one per size
+    """
+    levels = []
+    for out_width, out_height in sizes:
+        pixels = resample(pixels, out_width, out_height, filter_name, clamp)
+        levels.append(pixels)
+    return levels
+
+
+# =============================================================================
+# WORKER JOBS (must stay importable without the addon package)
+# =============================================================================
+
+def _ping():
+    return os.getpid()
+
+
+def resample_shared(shm_name, shape, out_width, out_height, filter_name, clamp):
+    """Worker job: resample pixels held in shared memory"""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    pixels = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+    try:
+        return resample(pixels, out_width, out_height, filter_name, clamp)
+    finally:
+        del pixels
+        shm.close()
+
+
+def resample_pyramid_shared(shm_name, shape, sizes, filter_name, clamp):
+    """Worker job: resample pixels held in shared memory to several sizes"""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    pixels = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+    try:
+        return resample_pyramid(pixels, sizes, filter_name, clamp)
+    finally:
+        del pixels
+        shm.close()
+
+
+def _standalone_module():
+    """
+    This file imported as a top-level module.
+
+    Job functions are pickled by module name. Under the addon package name a
+    spawned worker would import the addon's __init__ (bpy) and die, so jobs
+    are submitted from a copy imported straight from the utils folder.
+    """
+    utils_dir = os.path.dirname(os.path.abspath(__file__))
+    if utils_dir not in sys.path:
+        sys.path.append(utils_dir)
+    return importlib.import_module(os.path.splitext(os.path.basename(__file__))[0])
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+def _release_shared(shm):
+    """Unlink a shared block; the mapping closes once the caller drops its array"""
+    try:
+        shm.close()
+    except BufferError:
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class ResamplePool:
+    """Process pool for resample jobs (thread pool fallback)"""
+
+    def __init__(self, max_workers=4, use_processes=True):
+        self.max_workers = max(1, max_workers)
+        self.executor = None
+        self.uses_processes = False
+        self._shared = {}
+
+        if use_processes:
+            self._start_processes()
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="resample"
+            )
+
+    def _start_processes(self):
+        executor = None
+        try:
+            import multiprocessing
+            context = multiprocessing.get_context('spawn')
+            self._module = _standalone_module()
+            executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            executor.submit(self._module._ping).result(timeout=POOL_START_TIMEOUT)
+        except Exception as e:
+            print(f"Resample: worker processes unavailable ({e}), using threads")
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            return
+
+        self.executor = executor
+        self.uses_processes = True
+
+    def allocate(self, shape):
+        """
+        Get a float32 array to fill with source pixels.
+
+        For process pools the array lives in shared memory; pass it back to
+        submit() unchanged.
+        """
+        if not self.uses_processes:
+            return np.empty(shape, dtype=np.float32)
+
+        from multiprocessing import shared_memory
+        size = int(np.prod(shape)) * 4
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        array = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        self._shared[id(array)] = shm
+        return array
+
+    def submit(self, pixels, out_width, out_height, filter_name, clamp=True):
+        """Queue a resample job; returns a Future of the resampled array"""
+        return self._submit(
+            pixels, 'resample', 'resample_shared', out_width, out_height, filter_name, clamp
+        )
+
+    def submit_pyramid(self, pixels, sizes, filter_name, clamp=True):
+        """Queue a pyramid job; returns a Future of the list of resampled arrays"""
+        return self._submit(
+            pixels, 'resample_pyramid', 'resample_pyramid_shared', list(sizes), filter_name, clamp
+        )
+
+    def _submit(self, pixels, job_name, shared_job_name, *args):
+        shm = self._shared.pop(id(pixels), None)
+        if shm is None:
+            return self.executor.submit(globals()[job_name], pixels, *args)
+
+        future = self.executor.submit(
+            getattr(self._module, shared_job_name), shm.name, pixels.shape, *args
+        )
+
+        def release(_future, shm=shm):
+            _release_shared(shm)
+
+        future.add_done_callback(release)
+        return future
+
+    def discard(self, pixels):
+        """Free an allocated array that will not be submitted"""
+        shm = self._shared.pop(id(pixels), None)
+        if shm is not None:
+            _release_shared(shm)
+
+    def shutdown(self, cancel=False):
+        for shm in self._shared.values():
+            _release_shared(shm)
+        self._shared.clear()
+        self.executor.shutdown(wait=not cancel, cancel_futures=cancel)
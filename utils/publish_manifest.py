@@ -0,0 +1,180 @@
+"""
+Publish Manifest Utility
+
+Machine-readable record of a publish, written next to each published blend:
+    house_v003.blend  ->  house_v003.manifest.json
+
+Lists every published file (size, mtime, MD5 hash, source, role), the linked
+library dependencies and timing data, so later tooling (incremental publish,
+verification, diffs) can read one small file instead of scanning logs.
+"""
+
+import json
+import os
+import re
+
+from .file_compare import calculate_file_hash
+
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+# File roles
+ROLE_MASTER = "master"
+ROLE_TEXTURE = "texture"
+ROLE_LIBRARY = "library"
+ROLE_LIBRARY_TEXTURE = "library_texture"
+
+
+def get_manifest_path(published_path):
+    """Get manifest path for a published blend (house_v003.blend -> house_v003.manifest.json)"""
+    return os.path.splitext(published_path)[0] + MANIFEST_SUFFIX
+
+
+def read_manifest(manifest_path):
+    """Read manifest JSON (None if missing or unreadable)"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or 'files' not in data:
+        return None
+    return data
+
+
+def find_previous_manifest(target_folder, blend_filename):
+    """
+    Find the newest existing manifest for a published asset.
+
+    Matches both overwrite (house.manifest.json) and versioned
+    (house_v003.manifest.json) manifests, preferring the highest version.
+
+    Returns:
+        str or None: Manifest path
+    """
+    name = os.path.splitext(blend_filename)[0]
+    pattern = re.compile(rf"^{re.escape(name)}(?:_v(\d{{3,}}))?{re.escape(MANIFEST_SUFFIX)}$")
+
+    best_path = None
+    best_key = None
+    try:
+        with os.scandir(target_folder) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if not match:
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                version = int(match.group(1)) if match.group(1) else 0
+                key = (version, mtime)
+                if best_key is None or key > best_key:
+                    best_key = key
+                    best_path = entry.path
+    except OSError:
+        return None
+
+    return best_path
+
+
+def get_known_hashes(manifest, manifest_dir=None):
+    """
+    Build {absolute_path: (size, mtime, hash)} from a manifest.
+
+    Hashes are only trustworthy while size and mtime still match the file on
+    disk - callers must check that before reusing them.
+    """
+    known = {}
+    if not manifest:
+        return known
+
+    base_dir = manifest_dir or manifest.get('root', '')
+    for entry in manifest.get('files', []):
+        if not entry.get('hash'):
+            continue
+        abs_path = os.path.normpath(os.path.join(base_dir, entry['path']))
+        known[abs_path] = (entry.get('size'), entry.get('mtime'), entry['hash'])
+    return known
+
+
+def lookup_known_hash(known_hashes, filepath):
+    """Return cached hash for filepath if size and mtime are unchanged"""
+    cached = known_hashes.get(os.path.normpath(filepath))
+    if not cached:
+        return None
+
+    size, mtime, file_hash = cached
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+
+    if stat.st_size != size or mtime is None or abs(stat.st_mtime - mtime) > 1e-3:
+        return None
+    return file_hash
+
+
+def build_file_entry(filepath, role, root_dir, source="", file_hash=None, known_hashes=None,
+                     stat_path=None):
+    """
+    Describe one published file.
+
+    Args:
+        filepath: Published file path
+        role: ROLE_MASTER / ROLE_TEXTURE / ROLE_LIBRARY / ROLE_LIBRARY_TEXTURE
+        root_dir: Folder of the manifest (entry paths are stored relative to it)
+        source: Source file path the file was published from
+        file_hash: Known MD5 (computed if not given and not in known_hashes)
+        known_hashes: Result of get_known_hashes() for hash reuse
+        stat_path: Where the file currently is, if not yet at filepath (staging)
+    """
+    stat_path = stat_path or filepath
+    stat = os.stat(stat_path)
+
+    if file_hash is None and known_hashes and stat_path == filepath:
+        file_hash = lookup_known_hash(known_hashes, filepath)
+    if file_hash is None:
+        file_hash = calculate_file_hash(stat_path)
+
+    try:
+        rel_path = os.path.relpath(filepath, root_dir)
+    except ValueError:
+        rel_path = filepath
+
+    return {
+        'path': rel_path.replace('\\', '/'),
+        'role': role,
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'hash': file_hash,
+        'source': source,
+    }
+
+
+def write_manifest(published_path, manifest, write_to=None):
+    """
+    Write manifest next to published blend (atomic replace).
+
+    Args:
+        published_path: Final path of the published blend
+        manifest: Manifest dict
+        write_to: Write the manifest here instead (staging), 'root' still
+                  records the final folder
+
+    Returns:
+        str: Manifest path written
+    """
+    manifest_path = write_to or get_manifest_path(published_path)
+    manifest = dict(manifest)
+    manifest['manifest_version'] = MANIFEST_VERSION
+    manifest['root'] = os.path.dirname(os.path.abspath(published_path))
+
+    partial = manifest_path + ".part"
+    with open(partial, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(partial, manifest_path)
+
+    return manifest_path
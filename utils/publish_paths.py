@@ -0,0 +1,74 @@
+"""
+Publish Paths Utility
+
+Where a master blend is published to, shared by the publish operator and
+the panel's target preview.
+"""
+
+import os
+
+
+def get_master_structure(current_file, library_paths=()):
+    """
+    Folder structure of the master blend below the publish root.
+
+    Mirrors the common root of the master and its same-drive libraries; a
+    publish without libraries gets its asset folder level.
+
+    Returns:
+        tuple: (common_root, master_structure)
+    """
+    current_file_normalized = os.path.abspath(os.path.normpath(current_file))
+    current_folder = os.path.dirname(current_file_normalized)
+
+    internal_lib_paths = [current_file_normalized]
+
+    current_drive = os.path.splitdrive(current_file_normalized)[0]
+    for lib_filepath in library_paths:
+        lib_filepath_normalized = os.path.abspath(os.path.normpath(lib_filepath))
+        lib_drive = os.path.splitdrive(lib_filepath_normalized)[0]
+
+        if lib_drive == current_drive:
+            internal_lib_paths.append(lib_filepath_normalized)
+
+    if len(internal_lib_paths) > 1:
+        try:
+            common_root = os.path.commonpath(internal_lib_paths)
+        except ValueError:
+            common_root = current_folder
+    else:
+        common_root = current_folder
+
+    rel_path = os.path.relpath(current_file_normalized, common_root)
+    master_structure = os.path.dirname(rel_path)
+
+    # For single publish (no libraries), add asset folder level
+    if not library_paths:
+        asset_folder_name = os.path.basename(current_folder)
+
+        if not master_structure or master_structure == '.':
+            master_structure = asset_folder_name
+        elif not master_structure.endswith(asset_folder_name):
+            master_structure = os.path.join(master_structure, asset_folder_name)
+
+    return common_root, master_structure
+
+
+def get_master_target_path(publish_path, current_file, library_paths=(), versioning=False):
+    """
+    Path the master blend will be published to (versioned name is a preview).
+
+    Uses the same folder, name and extension as the publish's allocate_version().
+    """
+    from .version_allocator import get_version_name, peek_next_version
+
+    common_root, master_structure = get_master_structure(current_file, library_paths)
+    target_folder = os.path.join(publish_path, master_structure)
+    base_filename = os.path.basename(current_file)
+
+    if not versioning:
+        return os.path.join(target_folder, base_filename)
+
+    name_without_ext = os.path.splitext(base_filename)[0]
+    version_num = peek_next_version(target_folder, name_without_ext, '.blend')
+    return os.path.join(target_folder, get_version_name(name_without_ext, version_num, '.blend'))
@@ -0,0 +1,375 @@
+"""
+Publish Registry Utility
+
+SQLite index of .publish_activity.log (successful publishes only) for fast
+published-status lookups; the log stays the source of truth.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+from urllib.request import pathname2url
+
+
+REGISTRY_FILENAME = ".publish_registry.db"
+SCHEMA_VERSION = "2"
+
+# A build lock older than this belongs to a crashed build
+BUILD_LOCK_SECONDS = 60
+
+# Statuses that mark a path as published
+SUCCESS_PREFIX = "SUCCESS"
+
+_TIMESTAMP_RE = re.compile(r'^\[([^\]]+)\]')
+_ASSET_RE = re.compile(r'Asset: ([^|]+)')
+_PATH_RE = re.compile(r'Path: ([^|]+)')
+_SOURCE_RE = re.compile(r'Source: ([^|]+)')
+_LINKED_SOURCE_RE = re.compile(r'\|\s*Source:\s*(.+?)(?:\s*\n|$)')
+_STATUS_RE = re.compile(r'Status: ([^|]+)')
+
+# {(log key, path key): ((log size, log mtime_ns), source)}
+_lookup_cache = {}
+
+# Registry paths that could not be built this session (read-only folders)
+_unbuildable = set()
+
+
+class RegistryUnavailable(Exception):
+    """Registry database cannot be opened or updated"""
+    pass
+
+
+def normalize_key(path):
+    """Normalize a published path for indexing (case-insensitive on Windows)"""
+    return os.path.normcase(os.path.normpath(path.strip()))
+
+
+def get_registry_path(log_file):
+    """Get registry database path for a publish log"""
+    return os.path.join(os.path.dirname(log_file), REGISTRY_FILENAME)
+
+
+def is_success_status(status):
+    """True for SUCCESS / SUCCESS (FORCED); lines without a status (very old logs) count as success"""
+    return not status or status.startswith(SUCCESS_PREFIX)
+
+
+def parse_log_line(line, last_publish=None):
+    """
+    Parse one publish log line.
+
+    Log Format:
+    [timestamp] PUBLISH | Asset: name | Path: published_path | Source: source | ...
+      └─ LINKED | Library: name | Path: path | Source: source
+
+    Args:
+        line: Raw log line
+        last_publish: (timestamp, asset, status) of the preceding PUBLISH
+                      line, inherited by LINKED lines
+
+    Returns:
+        dict or None: {path, source, kind, asset, timestamp, status}
+    """
+    if 'Path:' not in line:
+        return None
+
+    path_match = _PATH_RE.search(line)
+    if not path_match:
+        return None
+
+    path = path_match.group(1).strip()
+    if not path or path in ("FAILED", "CANCELLED"):
+        return None
+
+    timestamp, asset, status = last_publish or ("", "", "")
+
+    if '└─ LINKED |' in line:
+        kind = 'linked'
+        source_match = _LINKED_SOURCE_RE.search(line)
+    else:
+        kind = 'publish'
+        source_match = _SOURCE_RE.search(line)
+        ts_match = _TIMESTAMP_RE.search(line)
+        asset_match = _ASSET_RE.search(line)
+        timestamp = ts_match.group(1) if ts_match else ""
+        asset = asset_match.group(1).strip() if asset_match else ""
+        status_match = _STATUS_RE.search(line)
+        status = status_match.group(1).strip() if status_match else ""
+
+    if not source_match:
+        return None
+
+    return {
+        'path': path,
+        'source': source_match.group(1).strip(),
+        'kind': kind,
+        'asset': asset,
+        'timestamp': timestamp,
+        'status': status,
+    }
+
+
+class PublishRegistry:
+    """Indexed view of one .publish_activity.log"""
+
+    def __init__(self, log_file):
+        self.log_file = log_file
+        self.db_path = get_registry_path(log_file)
+
+    def _connect(self, db_path=None):
+        try:
+            connection = sqlite3.connect(db_path or self.db_path, timeout=5.0)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS published (
+                    path_key TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    asset TEXT,
+                    timestamp TEXT
+                )
+            """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            return connection
+        except sqlite3.Error as e:
+            raise RegistryUnavailable(str(e))
+
+    def _connect_readonly(self):
+        """Open an existing database without creating, migrating or waiting on it"""
+        uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+        return sqlite3.connect(uri, uri=True, timeout=0.1)
+
+    @staticmethod
+    def _get_meta(connection, key, default=None):
+        row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    @staticmethod
+    def _set_meta(connection, key, value):
+        connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, str(value))
+        )
+
+    def sync(self, connection=None):
+        """
+        Ingest log lines appended since the last sync (one transaction).
+
+        Rebuilds from scratch on first use, schema change, or if the log
+        shrank (truncated/replaced).
+
+        Returns:
+            int: Number of log entries ingested
+        """
+        if connection is None:
+            with closing(self._connect()) as connection:
+                return self.sync(connection)
+
+        try:
+            log_size = os.path.getsize(self.log_file)
+        except OSError:
+            log_size = 0
+
+        try:
+            offset = int(self._get_meta(connection, 'log_offset', 0))
+            schema = self._get_meta(connection, 'schema_version')
+
+            if schema != SCHEMA_VERSION or log_size < offset:
+                offset = 0
+
+            if offset == log_size and schema == SCHEMA_VERSION:
+                return 0
+
+            entries, new_offset = self._read_entries(offset)
+
+            with connection:
+                if offset == 0:
+                    connection.execute("DELETE FROM published")
+
+                # Later entries win (a path republished in OVERWRITE mode)
+                connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO published (path_key, path, source, kind, asset, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (normalize_key(e['path']), e['path'], e['source'], e['kind'], e['asset'], e['timestamp'])
+                        for e in entries
+                    ]
+                )
+                self._set_meta(connection, 'log_offset', new_offset)
+                self._set_meta(connection, 'schema_version', SCHEMA_VERSION)
+
+            return len(entries)
+        except sqlite3.Error as e:
+            raise RegistryUnavailable(str(e))
+
+    def _read_entries(self, offset):
+        """Parse complete log lines starting at byte offset"""
+        entries = []
+        last_publish = None
+        new_offset = offset
+
+        try:
+            with open(self.log_file, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return entries, offset
+
+        # Only consume complete lines - a writer may be mid-append
+        end = data.rfind(b'\n')
+        if end < 0:
+            return entries, offset
+        new_offset = offset + end + 1
+
+        for raw_line in data[:end + 1].splitlines():
+            line = raw_line.decode('utf-8', errors='replace')
+            entry = parse_log_line(line, last_publish)
+            if entry is None:
+                continue
+            if entry['kind'] == 'publish':
+                last_publish = (entry['timestamp'], entry['asset'], entry['status'])
+            # Cancelled and failed runs (and their libraries) are not published
+            if is_success_status(entry['status']):
+                entries.append(entry)
+
+        return entries, new_offset
+
+    def build(self):
+        """
+        Build the registry from the log into a temp file and rename it into place.
+
+        Only one process builds at a time (exclusive lock file); others keep
+        scanning until it is done.
+
+        Returns:
+            bool: True if a fresh registry is in place
+        """
+        lock_path = self.db_path + ".lock"
+        try:
+            if time.time() - os.path.getmtime(lock_path) > BUILD_LOCK_SECONDS:
+                os.remove(lock_path)
+        except OSError:
+            pass
+
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return False
+        except OSError:
+            # Read-only folder - lookups scan the log instead
+            _unbuildable.add(self.db_path)
+            return False
+
+        temp_path = f"{self.db_path}.{os.getpid()}.tmp"
+        try:
+            with closing(self._connect(temp_path)) as connection:
+                self.sync(connection)
+            os.replace(temp_path, self.db_path)
+            return True
+        except (OSError, RegistryUnavailable) as e:
+            print(f"Warning: Could not build publish registry: {e}")
+            _unbuildable.add(self.db_path)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+    def _lookup_indexed(self, path_key, log_size):
+        """
+        Indexed part of a lookup.
+
+        Returns:
+            tuple: (source or None, ingested log offset), or None if there is no usable registry
+        """
+        try:
+            with closing(self._connect_readonly()) as connection:
+                schema = self._get_meta(connection, 'schema_version')
+                indexed = int(self._get_meta(connection, 'log_offset', 0))
+                if schema != SCHEMA_VERSION or indexed > log_size:
+                    return None
+                row = connection.execute(
+                    "SELECT source FROM published WHERE path_key = ?", (path_key,)
+                ).fetchone()
+                return (row[0] if row else None), indexed
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def lookup(self, target_path):
+        """
+        Find source path for a published file or folder.
+
+        Indexed rows cover the log up to the ingested offset; the rest of
+        the log is scanned, later entries winning. A missing or outdated
+        registry is built first (legacy logs); where it cannot be built the
+        whole log is scanned.
+
+        Returns:
+            str or None: Source path if target was published
+        """
+        path_key = normalize_key(target_path)
+        try:
+            log_size = os.path.getsize(self.log_file)
+        except OSError:
+            return None
+
+        indexed = self._lookup_indexed(path_key, log_size)
+        if indexed is None and self.db_path not in _unbuildable and self.build():
+            indexed = self._lookup_indexed(path_key, log_size)
+
+        source, offset = indexed if indexed is not None else (None, 0)
+
+        if offset < log_size:
+            entries = self._read_entries(offset)[0]
+            for entry in entries:
+                if normalize_key(entry['path']) == path_key:
+                    source = entry['source']
+
+        return source
+
+
+def lookup_published_source(log_file, target_path):
+    """
+    Indexed lookup of target_path in a publish log (safe to call from draw()).
+
+    Cached per log file version - redraws cost one stat until the log changes.
+
+    Returns:
+        str or None: Source path if found
+    """
+    try:
+        stat = os.stat(log_file)
+    except OSError:
+        return None
+
+    key = (normalize_key(log_file), normalize_key(target_path))
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _lookup_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    source = PublishRegistry(log_file).lookup(target_path)
+    _lookup_cache[key] = (signature, source)
+    return source
+
+
+def update_publish_registry(log_file):
+    """Index lines just appended to a publish log (call after every log write)"""
+    try:
+        PublishRegistry(log_file).sync()
+    except RegistryUnavailable as e:
+        print(f"Warning: Could not update publish registry: {e}")
@@ -0,0 +1,288 @@
+"""
+Publish Staging Utility
+
+Writes a publish into <publish_root>/.staging/ and promotes it with renames,
+or journals direct writes (PublishRollback) so a cancelled run can be undone.
+"""
+
+import os
+import shutil
+import threading
+import time
+
+
+STAGING_DIRNAME = ".staging"
+ROLLBACK_SUFFIX = "-rollback"
+STALE_STAGING_SECONDS = 24 * 60 * 60
+
+# fsync policies (see AssetManagementPreferences.publish_fsync_policy)
+FSYNC_NONE = 'NONE'
+FSYNC_FILES = 'FILES'
+FSYNC_FULL = 'FULL'
+
+
+def fsync_file(filepath):
+    """Flush file contents to disk"""
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(dirpath):
+    """Flush directory entries to disk (no-op where unsupported, e.g. Windows)"""
+    try:
+        fd = os.open(dirpath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _path_key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _restore_moved_files(backup_dir, publish_root):
+    """Move files of a crashed run's rollback folder back to their publish paths"""
+    for root, dirs, files in os.walk(backup_dir):
+        for filename in files:
+            backup = os.path.join(root, filename)
+            final_path = os.path.join(publish_root, os.path.relpath(backup, backup_dir))
+            try:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(backup, final_path)
+            except OSError as e:
+                print(f"Could not restore {final_path}: {e}")
+
+
+def cleanup_stale_staging(publish_root, max_age=STALE_STAGING_SECONDS):
+    """
+    Remove staging folders left behind by crashed publishes.
+
+    Rollback folders of crashed direct-write publishes are restored first.
+
+    Returns:
+        int: Number of folders removed
+    """
+    staging_root = os.path.join(publish_root, STAGING_DIRNAME)
+    removed = 0
+    now = time.time()
+
+    try:
+        entries = list(os.scandir(staging_root))
+    except OSError:
+        return 0
+
+    for entry in entries:
+        try:
+            if entry.is_dir() and now - entry.stat().st_mtime > max_age:
+                if entry.name.endswith(ROLLBACK_SUFFIX):
+                    _restore_moved_files(entry.path, publish_root)
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+        except OSError:
+            continue
+
+    return removed
+
+
+class PublishStaging:
+    """Staging folder for one publish run"""
+
+    def __init__(self, publish_root, asset_name, fsync_policy=FSYNC_NONE):
+        self.publish_root = os.path.normpath(os.path.abspath(publish_root))
+        self.fsync_policy = fsync_policy
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.stage_dir = os.path.join(
+            self.publish_root, STAGING_DIRNAME, f"{asset_name}-{stamp}-{os.getpid()}"
+        )
+        os.makedirs(self.stage_dir, exist_ok=True)
+
+    # -------------------------------------------------------------------------
+    # Path mapping
+    # -------------------------------------------------------------------------
+
+    def stage_path(self, final_path):
+        """Map a final publish path to its staging path (creates parent folders)"""
+        rel_path = os.path.relpath(os.path.abspath(final_path), self.publish_root)
+        if rel_path.startswith('..'):
+            raise ValueError(f"Path is outside publish root: {final_path}")
+
+        staged = os.path.join(self.stage_dir, rel_path)
+        os.makedirs(os.path.dirname(staged), exist_ok=True)
+        return staged
+
+    def current_path(self, final_path):
+        """Staged copy if this publish wrote one, otherwise the existing published file"""
+        rel_path = os.path.relpath(os.path.abspath(final_path), self.publish_root)
+        staged = os.path.join(self.stage_dir, rel_path)
+        return staged if os.path.exists(staged) else final_path
+
+    # -------------------------------------------------------------------------
+    # Durability
+    # -------------------------------------------------------------------------
+
+    @property
+    def fsync_files(self):
+        return self.fsync_policy in (FSYNC_FILES, FSYNC_FULL)
+
+    def sync_file(self, filepath):
+        """fsync a staged file if the policy asks for it"""
+        if self.fsync_files:
+            fsync_file(filepath)
+
+    # -------------------------------------------------------------------------
+    # Promote / discard
+    # -------------------------------------------------------------------------
+
+    def promote(self, deferred=()):
+        """
+        Move staged files into the publish root.
+
+        Args:
+            deferred: Final paths to promote last, in the given order
+        """
+        deferred_keys = {_path_key(path) for path in deferred}
+        touched_dirs = set()
+
+        self._promote_dir(self.stage_dir, self.publish_root, deferred_keys, touched_dirs)
+
+        for final_path in deferred:
+            rel_path = os.path.relpath(os.path.abspath(final_path), self.publish_root)
+            staged = os.path.join(self.stage_dir, rel_path)
+            if os.path.exists(staged):
+                os.replace(staged, final_path)
+                touched_dirs.add(os.path.dirname(final_path))
+
+        if self.fsync_policy == FSYNC_FULL:
+            for dirpath in touched_dirs:
+                fsync_directory(dirpath)
+
+        self.discard()
+
+    def _contains_deferred(self, final_dir, deferred_keys):
+        prefix = _path_key(final_dir) + os.sep
+        return any(key.startswith(prefix) for key in deferred_keys)
+
+    def _promote_dir(self, stage_dir, final_dir, deferred_keys, touched_dirs):
+        os.makedirs(final_dir, exist_ok=True)
+
+        for entry in list(os.scandir(stage_dir)):
+            final_path = os.path.join(final_dir, entry.name)
+
+            if entry.is_dir(follow_symlinks=False):
+                if not os.path.exists(final_path) and not self._contains_deferred(final_path, deferred_keys):
+                    # New folder - whole subtree appears in one rename
+                    os.rename(entry.path, final_path)
+                    touched_dirs.add(final_dir)
+                else:
+                    self._promote_dir(entry.path, final_path, deferred_keys, touched_dirs)
+                continue
+
+            if _path_key(final_path) in deferred_keys:
+                continue
+
+            os.replace(entry.path, final_path)
+            touched_dirs.add(final_dir)
+
+    def discard(self):
+        """Remove the staging folder (and the .staging root if now empty)"""
+        shutil.rmtree(self.stage_dir, ignore_errors=True)
+        try:
+            os.rmdir(os.path.dirname(self.stage_dir))
+        except OSError:
+            pass
+
+
+class PublishRollback:
+    """Undo journal for a publish written straight to its final paths"""
+
+    def __init__(self, publish_root, asset_name):
+        self.publish_root = os.path.normpath(os.path.abspath(publish_root))
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.backup_dir = os.path.join(
+            self.publish_root, STAGING_DIRNAME, f"{asset_name}-{stamp}-{os.getpid()}{ROLLBACK_SUFFIX}"
+        )
+        self._recorded = set()
+        self._created = []
+        self._backups = []
+        # Library workers write from several threads
+        self._lock = threading.Lock()
+
+    def record(self, final_path):
+        """
+        Call right before final_path is written (first call wins, later ones are no-ops).
+
+        An existing file is moved into the rollback folder, so the writer always
+        creates a new file. Skip the call for files that are not rewritten.
+        """
+        final_path = os.path.abspath(final_path)
+        key = _path_key(final_path)
+
+        with self._lock:
+            if key in self._recorded:
+                return
+            self._recorded.add(key)
+
+        if not os.path.lexists(final_path):
+            with self._lock:
+                self._created.append(final_path)
+            return
+
+        rel_path = os.path.relpath(final_path, self.publish_root)
+        if rel_path.startswith('..'):
+            raise ValueError(f"Path is outside publish root: {final_path}")
+
+        # Moved aside, not copied - same filesystem, so this is one rename
+        backup = os.path.join(self.backup_dir, rel_path)
+        os.makedirs(os.path.dirname(backup), exist_ok=True)
+        os.replace(final_path, backup)
+
+        with self._lock:
+            self._backups.append((final_path, backup))
+
+    def rollback(self):
+        """Restore the files this publish replaced and delete the ones it created"""
+        # Restore first - pruning empty folders below must not take a restored file's folder
+        for final_path, backup in self._backups:
+            try:
+                os.replace(backup, final_path)
+            except OSError as e:
+                print(f"Could not restore {final_path}: {e}")
+
+        for final_path in reversed(self._created):
+            try:
+                os.remove(final_path)
+            except OSError:
+                continue
+            self._remove_empty_parents(os.path.dirname(final_path))
+
+        self.discard()
+
+    def _remove_empty_parents(self, dirpath):
+        root_key = _path_key(self.publish_root)
+        while _path_key(dirpath) != root_key and _path_key(dirpath).startswith(root_key + os.sep):
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                return
+            dirpath = os.path.dirname(dirpath)
+
+    def discard(self):
+        """Drop the backups (publish finished, nothing to undo)"""
+        shutil.rmtree(self.backup_dir, ignore_errors=True)
+        try:
+            os.rmdir(os.path.dirname(self.backup_dir))
+        except OSError:
+            pass
+        self._recorded.clear()
+        self._created = []
+        self._backups = []
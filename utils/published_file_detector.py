@@ -9,6 +9,8 @@ import bpy
 import os
 import re
 
+from .publish_registry import lookup_published_source
+
 
 def detect_published_file_status(context):
     """
@@ -185,7 +187,10 @@ def update_published_file_cache(context, is_published, source_path):
 
 def parse_log_for_path(log_file, target_path):
     """
-    Parse publish activity log (OLD format) and return source path if target found.
+    Look up publish activity log (OLD format) and return source path if target found.
+    
+    Uses the indexed publish registry (utils/publish_registry.py) - read-only
+    and cached per log version, so it is safe from panel.draw().
     
     OLD Format:
     [timestamp] PUBLISH | Asset: name | Path: target | Source: source | ...
@@ -197,28 +202,15 @@ def parse_log_for_path(log_file, target_path):
     Returns:
         str or None: Source path if found, None otherwise
     """
-    target_path = os.path.normpath(target_path)
-    
-    try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if 'Path:' in line:
-                    path_match = re.search(r'Path: ([^|]+)', line)
-                    if path_match:
-                        logged_path = os.path.normpath(path_match.group(1).strip())
-                        if logged_path == target_path:
-                            source_match = re.search(r'Source: ([^|]+)', line)
-                            if source_match:
-                                return source_match.group(1).strip()
-    except Exception as e:
-        print(f"Error parsing log: {e}")
-    
-    return None
+    return lookup_published_source(log_file, target_path)
 
 
 def parse_log_for_file(log_file, target_file):
     """
-    Parse publish activity log and return source path if target found.
+    Look up publish activity log and return source path if target found.
+    
+    Uses the indexed publish registry (utils/publish_registry.py) - read-only
+    and cached per log version, so it is safe from panel.draw().
     
     Log Format:
     [timestamp] PUBLISH | Asset: name | Path: published_path | Source: source | ...
@@ -231,29 +223,4 @@ def parse_log_for_file(log_file, target_file):
     Returns:
         str or None: Source path if found, None otherwise
     """
-    target_file = os.path.normpath(target_file)
-    
-    try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if 'PUBLISH |' in line and 'Path:' in line:
-                    path_match = re.search(r'Path: ([^|]+)', line)
-                    if path_match:
-                        logged_path = os.path.normpath(path_match.group(1).strip())
-                        if logged_path == target_file:
-                            source_match = re.search(r'Source: ([^|]+)', line)
-                            if source_match:
-                                return source_match.group(1).strip()
-                
-                if '└─ LINKED |' in line:
-                    path_match = re.search(r'Path: ([^|]+)', line)
-                    if path_match:
-                        logged_path = os.path.normpath(path_match.group(1).strip())
-                        if logged_path == target_file:
-                            source_match = re.search(r'\|\s*Source:\s*(.+?)(?:\s*\n|$)', line)
-                            if source_match:
-                                return source_match.group(1).strip()
-    except Exception as e:
-        print(f"Error parsing log: {e}")
-    
-    return None
+    return lookup_published_source(log_file, target_file)
@@ -0,0 +1,107 @@
+"""
+Resolution Solver Utility
+
+Pick a resolution per texture so the total texture memory fits a budget
+with the least loss of quality.
+
+Every step halves one texture (the first step snaps odd sizes down to the
+next power of two). Each step costs quality in proportion to the map's
+priority and to how often the texture was already reduced, and saves
+memory in proportion to its pixel count. The solver greedily takes the
+step with the lowest cost per saved byte until the budget is met, so big
+low-priority maps shrink first and high-priority maps (normals, base color)
+keep their detail longest.
+"""
+
+import heapq
+from collections import namedtuple
+
+
+# Map type groups, keyed by SOP map name (see TEXTURE_OT_AutoCorrectMaps.SOP_MAPS)
+MAP_GROUPS = {
+    'basecolor': 'COLOR',
+    'specular': 'MASK',
+    'roughness': 'MASK',
+    'metallic': 'MASK',
+    'ao': 'MASK',
+    'alpha': 'MASK',
+    'normal': 'DETAIL',
+    'height': 'DETAIL',
+}
+
+GROUP_OTHER = 'OTHER'
+
+DEFAULT_PRIORITIES = {
+    'COLOR': 2.0,
+    'DETAIL': 3.0,
+    'MASK': 1.0,
+    GROUP_OTHER: 2.0,
+}
+
+DEFAULT_MIN_SIZE = 256
+
+SolverTexture = namedtuple('SolverTexture', 'key width height bytes_per_pixel priority')
+
+SolverResult = namedtuple('SolverResult', 'sizes total fits')
+
+
+def get_map_group(sop_map):
+    """Priority group of a SOP map name (None for unclassified images)"""
+    return MAP_GROUPS.get(sop_map, GROUP_OTHER)
+
+
+def _next_size(width, height, min_size):
+    """Size after one reduction step, or None if the longer side would drop below min_size"""
+    longest = max(width, height)
+    target = 1 << (longest.bit_length() - 1)
+    if target == longest:
+        target //= 2
+    if target < min_size:
+        return None
+    if width > height:
+        return target, max(1, int(height * (target / width)))
+    return max(1, int(width * (target / height))), target
+
+
+def solve_resolutions(textures, budget, reserved=0, min_size=DEFAULT_MIN_SIZE):
+    """
+    Choose a size per texture that fits the budget.
+
+    Args:
+        textures: [SolverTexture, ...] - textures that may be reduced
+        budget: Memory budget in bytes for textures and reserved together
+        reserved: Memory of textures that cannot be reduced
+        min_size: Smallest longer side a texture is reduced to
+
+    Returns:
+        SolverResult: sizes {key: (width, height)} of reduced textures only,
+            total memory after reduction, fits (False if min_size was reached first)
+    """
+    sizes = {}
+    total = reserved
+    heap = []
+
+    def push(index, width, height, steps):
+        next_size = _next_size(width, height, min_size)
+        if next_size is None:
+            return
+        texture = textures[index]
+        saved = (width * height - next_size[0] * next_size[1]) * texture.bytes_per_pixel
+        if saved <= 0:
+            return
+        cost = texture.priority * (steps + 1) / saved
+        heapq.heappush(heap, (cost, index, steps, next_size))
+
+    for index, texture in enumerate(textures):
+        total += texture.width * texture.height * texture.bytes_per_pixel
+        push(index, texture.width, texture.height, 0)
+
+    while total > budget and heap:
+        cost, index, steps, (width, height) = heapq.heappop(heap)
+        texture = textures[index]
+        old_width, old_height = sizes.get(texture.key, (texture.width, texture.height))
+        total -= (old_width * old_height - width * height) * texture.bytes_per_pixel
+        sizes[texture.key] = (width, height)
+        push(index, width, height, steps + 1)
+
+    return SolverResult(sizes, int(total), total <= budget)
@@ -0,0 +1,313 @@
+"""
+Scene Index Utility
+
+Shared index of image, material, object and library usage built from
+bpy.data.user_map(), invalidated when the blend data changes.
+"""
+
+import bpy
+import os
+from bpy.app.handlers import persistent
+from collections import defaultdict, namedtuple
+
+
+ImageRecord = namedtuple(
+    'ImageRecord',
+    'name short_name source packed library filepath abs_path udim_path '
+    'size tiles is_float half_float generated_size generated_float'
+)
+
+SKIP_IMAGES = ('Render Result', 'Viewer Node')
+
+# Images indexed per build step (build_scene_index_steps)
+BUILD_CHUNK = 250
+
+# Build stages after the image chunks
+BUILD_STAGES = 2
+
+# Linked datablock types listed per library
+LIBRARY_COLLECTIONS = ('images', 'materials', 'objects', 'meshes', 'node_groups', 'collections', 'worlds')
+
+# Orphan report label → ID type
+ORPHAN_TYPES = (
+    ('Meshes', 'MESH'),
+    ('Materials', 'MATERIAL'),
+    ('Textures', 'TEXTURE'),
+    ('Images', 'IMAGE'),
+    ('Objects', 'OBJECT'),
+    ('Collections', 'COLLECTION'),
+    ('Actions', 'ACTION'),
+    ('Curves', 'CURVE'),
+    ('Lights', 'LIGHT'),
+    ('Cameras', 'CAMERA'),
+)
+
+# Object data types that can hold material slots
+OBDATA_TYPES = ('Mesh', 'Curve', 'TextCurve', 'SurfaceCurve', 'MetaBall', 'GreasePencil', 'Curves', 'PointCloud', 'Volume')
+
+_generation = 0
+_index = None
+
+
+def _data_signature():
+    data = bpy.data
+    return (
+        _generation,
+        data.filepath,
+        len(data.images),
+        len(data.materials),
+        len(data.objects),
+        len(data.node_groups),
+        len(data.libraries),
+    )
+
+
+def invalidate_scene_index():
+    """Force a rebuild on the next get_scene_index() call"""
+    global _generation
+    _generation += 1
+
+
+@persistent
+def scene_index_depsgraph_update(scene, depsgraph=None):
+    """depsgraph_update_post handler: bump the generation on data edits"""
+    if depsgraph is not None:
+        # Scene updates (UI properties, selection) and object moves do not change the index
+        if all(_is_irrelevant_update(update) for update in depsgraph.updates):
+            return
+    invalidate_scene_index()
+
+
+def _is_irrelevant_update(update):
+    if isinstance(update.id, bpy.types.Scene):
+        return True
+    return isinstance(update.id, bpy.types.Object) and not update.is_updated_geometry
+
+
+@persistent
+def scene_index_load_post(dummy):
+    """load_post handler: a new file never reuses the old index"""
+    global _index
+    _index = None
+    invalidate_scene_index()
+
+
+def get_scene_index():
+    """Scene index of the current edit generation (built on first use)"""
+    global _index
+    signature = _data_signature()
+    if _index is None or _index.signature != signature:
+        _index = SceneIndex(signature)
+    return _index
+
+
+def peek_scene_index():
+    """Scene index if it is current, else None (never builds - safe in draw())"""
+    if _index is not None and _index.signature == _data_signature():
+        return _index
+    return None
+
+
+def build_scene_index_steps(chunk=BUILD_CHUNK):
+    """
+    Build the scene index over several calls (for modal operators).
+
+    Generator - yields the built fraction (0.0 - 1.0) after each chunk of
+    images and each later stage; get_scene_index() then returns the result
+    without rebuilding. Restarts if the data changes between steps.
+    """
+    global _index
+    while True:
+        signature = _data_signature()
+        if _index is not None and _index.signature == signature:
+            return
+        index = SceneIndex(signature, build=False)
+        for fraction in index.build_steps(chunk):
+            yield fraction
+        if _data_signature() == signature:
+            _index = index
+            return
+
+
+class SceneIndex:
+    """Image, material, object and library relations of the blend data"""
+
+    def __init__(self, signature=None, build=True):
+        self.signature = signature
+        self.images = {}
+        self.image_materials = defaultdict(list)
+        self.material_images = {}
+        self.material_objects = defaultdict(list)
+        self.object_materials = {}
+        self.library_datablocks = defaultdict(lambda: defaultdict(list))
+        self.orphans = {}
+        self.unused_libraries = []
+
+        if build:
+            for fraction in self.build_steps():
+                pass
+
+    def build_steps(self, chunk=BUILD_CHUNK):
+        """
+        Fill the index, yielding the built fraction between steps.
+
+        No RNA reference is kept across a yield; the user map is taken and
+        consumed within one step. Stops early if images are added or removed
+        between steps (the caller compares signatures and restarts).
+        """
+        images = bpy.data.images
+        total = len(images)
+        steps = (total + chunk - 1) // chunk + BUILD_STAGES
+
+        for step, chunk_start in enumerate(range(0, total, chunk), 1):
+            if len(images) != total:
+                return
+            for position in range(chunk_start, min(chunk_start + chunk, total)):
+                self._index_image(images[position])
+            yield step / steps
+
+        user_map = bpy.data.user_map()
+        self._map_material_users(user_map)
+        self._map_image_users(user_map)
+        orphan_labels = {id_type: label for label, id_type in ORPHAN_TYPES}
+        self.orphans = {label: [] for label, id_type in ORPHAN_TYPES}
+        used_libraries = set()
+        for datablock, users in user_map.items():
+            library = getattr(datablock, 'library', None)
+            if library and users:
+                used_libraries.add(library.filepath)
+            if not users:
+                label = orphan_labels.get(datablock.id_type)
+                # users == 0 as well: fake users count as users, like Clear Orphan Data deletes
+                if label and datablock.users == 0 and not (label == 'Images' and datablock.name in SKIP_IMAGES):
+                    self.orphans[label].append(datablock.name_full)
+        del user_map
+        self.unused_libraries = [lib.filepath for lib in bpy.data.libraries if lib.filepath not in used_libraries]
+        yield (steps - 1) / steps
+
+        for collection_name in LIBRARY_COLLECTIONS:
+            for datablock in getattr(bpy.data, collection_name):
+                if datablock.library:
+                    self.library_datablocks[datablock.library.filepath][collection_name].append(datablock.name_full)
+        yield 1.0
+
+    def _index_image(self, img):
+        from .texture_utils import normalize_udim
+
+        if img.name in SKIP_IMAGES:
+            return
+
+        abs_path = None
+        udim_path = None
+        if img.filepath:
+            try:
+                abs_path = os.path.normpath(bpy.path.abspath(img.filepath, library=img.library))
+                udim_path = abs_path if '<UDIM>' in abs_path else normalize_udim(abs_path)
+            except Exception:
+                pass
+
+        # Loaded and packed images report their size; others need a header probe
+        size = None
+        if img.source != 'GENERATED' and (img.has_data or img.packed_file):
+            size = tuple(img.size)
+
+        # Image.is_float acquires the image buffer - only read it when pixels are loaded
+        is_float = img.is_float if img.has_data else None
+
+        self.images[img.name_full] = ImageRecord(
+            name=img.name_full,
+            short_name=img.name,
+            source=img.source,
+            packed=bool(img.packed_file),
+            library=img.library.filepath if img.library else None,
+            filepath=img.filepath,
+            abs_path=abs_path,
+            udim_path=udim_path,
+            size=size,
+            tiles=tuple(tile.number for tile in img.tiles) if img.source == 'TILED' else (),
+            is_float=is_float,
+            half_float=img.use_half_precision,
+            generated_size=(img.generated_width, img.generated_height) if img.source == 'GENERATED' else None,
+            generated_float=img.use_generated_float,
+        )
+
+    def _map_material_users(self, user_map):
+        """material_objects / object_materials from material users (objects and object data)"""
+        materials = {}
+        for mat in bpy.data.materials:
+            objects = set()
+            for user in user_map.get(mat, ()):
+                if isinstance(user, bpy.types.Object):
+                    objects.add(user.name_full)
+                elif type(user).__name__ in OBDATA_TYPES:
+                    objects.update(
+                        obj.name_full for obj in user_map.get(user, ()) if isinstance(obj, bpy.types.Object)
+                    )
+            materials[mat.name_full] = objects
+
+        object_materials = defaultdict(list)
+        for mat_name, objects in materials.items():
+            self.material_objects[mat_name] = sorted(objects)
+            for obj_name in objects:
+                object_materials[obj_name].append(mat_name)
+        self.object_materials = dict(object_materials)
+
+    def _map_image_users(self, user_map):
+        """image_materials / material_images; images in node groups count for every material using the group"""
+        group_materials = {}
+
+        def materials_of(datablock, stack):
+            found = set()
+            for user in user_map.get(datablock, ()):
+                if isinstance(user, bpy.types.Material):
+                    found.add(user.name_full)
+                elif isinstance(user, bpy.types.NodeTree) and user.name_full not in stack:
+                    cached = group_materials.get(user.name_full)
+                    if cached is None:
+                        stack.add(user.name_full)
+                        cached = materials_of(user, stack)
+                        stack.discard(user.name_full)
+                        group_materials[user.name_full] = cached
+                    found |= cached
+            return found
+
+        material_images = defaultdict(list)
+        for img in bpy.data.images:
+            materials = materials_of(img, set())
+            if materials:
+                self.image_materials[img.name_full] = sorted(materials)
+                for mat_name in materials:
+                    material_images[mat_name].append(img.name_full)
+
+        for mat in bpy.data.materials:
+            self.material_images[mat.name_full] = sorted(material_images.get(mat.name_full, ()))
+
+    def get_used_texture_paths(self, include_material_nodes=True, include_file_images=True,
+                               include_library=False, include_packed=True):
+        """
+        UDIM-normalized absolute paths of used textures.
+
+        Args:
+            include_material_nodes: Images of material Image Texture nodes (any source)
+            include_file_images: File images of bpy.data.images
+            include_library: Include linked file images
+            include_packed: Include packed file images
+        """
+        paths = set()
+        if include_material_nodes:
+            for image_name in self.image_materials:
+                record = self.images.get(image_name)
+                if record and record.udim_path:
+                    paths.add(record.udim_path)
+
+        if include_file_images:
+            for record in self.images.values():
+                if record.source != 'FILE' or not record.udim_path:
+                    continue
+                if record.library and not include_library:
+                    continue
+                if record.packed and not include_packed:
+                    continue
+                paths.add(record.udim_path)
+
+        return paths
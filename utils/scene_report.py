@@ -0,0 +1,402 @@
+"""
+Scene Report Utility
+
+JSONL/CSV records for Analyze Scene Deeply and diffing of two reports.
+"""
+
+import csv
+import json
+import os
+import re
+from collections import defaultdict
+from datetime import datetime
+
+from .copy_engine import format_bytes
+
+
+REPORT_VERSION = 1
+REPORT_PREFIX = "Scene_Analysis_"
+
+FORMAT_JSONL = 'JSONL'
+FORMAT_CSV = 'CSV'
+
+FORMAT_EXTENSIONS = {
+    FORMAT_JSONL: ".jsonl",
+    FORMAT_CSV: ".csv",
+}
+
+# Record kinds
+KIND_SCENE = "scene"
+KIND_MATERIAL = "material"
+KIND_TEXTURE = "texture"
+KIND_FILE = "file"
+KIND_LIBRARY = "library"
+KIND_ORPHAN = "orphan"
+
+RECORD_KINDS = (KIND_MATERIAL, KIND_TEXTURE, KIND_FILE, KIND_LIBRARY, KIND_ORPHAN)
+
+# Texture and library status values
+STATUS_FOUND = "FOUND"
+STATUS_MISSING = "MISSING"
+STATUS_PACKED = "PACKED"
+STATUS_GENERATED = "GENERATED"
+STATUS_UNUSED = "UNUSED"
+STATUS_USED = "USED"
+
+RECORD_FIELDS = (
+    'kind', 'name', 'type', 'library', 'path', 'status',
+    'width', 'height', 'file_bytes', 'gpu_bytes', 'cpu_bytes',
+    'users', 'used_by', 'version', 'generated',
+)
+
+INT_FIELDS = {'width', 'height', 'file_bytes', 'gpu_bytes', 'cpu_bytes', 'users', 'version'}
+
+# used_by lists are joined with this separator in CSV
+CSV_LIST_SEPARATOR = "|"
+
+# Byte totals compared by diff_reports: (label, kind, field)
+BYTE_TOTALS = (
+    ("Texture file bytes", KIND_TEXTURE, 'file_bytes'),
+    ("Texture GPU bytes", KIND_TEXTURE, 'gpu_bytes'),
+    ("Texture CPU bytes", KIND_TEXTURE, 'cpu_bytes'),
+    ("Unused folder bytes", KIND_FILE, 'file_bytes'),
+)
+
+COUNT_LABELS = {
+    KIND_MATERIAL: "Materials",
+    KIND_TEXTURE: "Textures",
+    KIND_FILE: "Unused folder files",
+    KIND_LIBRARY: "Libraries",
+    KIND_ORPHAN: "Orphans",
+}
+
+
+def make_record(kind, name, **fields):
+    """Record dict with every field of RECORD_FIELDS (missing ones are None)"""
+    record = dict.fromkeys(RECORD_FIELDS)
+    record['kind'] = kind
+    record['name'] = name
+    for field, value in fields.items():
+        if field not in record:
+            raise KeyError(f"Unknown report field: {field}")
+        record[field] = value
+    return record
+
+
+def make_scene_record(blend_path):
+    """Header record of a report"""
+    return make_record(
+        KIND_SCENE, os.path.basename(blend_path),
+        path=blend_path,
+        version=REPORT_VERSION,
+        generated=datetime.now().isoformat(timespec='seconds'),
+    )
+
+
+def get_report_path(reports_dir, report_format, timestamp=None):
+    """Timestamped report path, so earlier runs are kept for diffing"""
+    timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(reports_dir, f"{REPORT_PREFIX}{timestamp}{FORMAT_EXTENSIONS[report_format]}")
+
+
+def get_report_format(path):
+    """FORMAT_JSONL / FORMAT_CSV from the file extension (None if unknown)"""
+    ext = os.path.splitext(path)[1].lower()
+    for report_format, format_ext in FORMAT_EXTENSIONS.items():
+        if ext == format_ext:
+            return report_format
+    return None
+
+
+def find_reports(reports_dir):
+    """Structured reports in reports_dir, oldest first"""
+    pattern = re.compile(
+        rf"^{re.escape(REPORT_PREFIX)}.+(?:{'|'.join(re.escape(ext) for ext in FORMAT_EXTENSIONS.values())})$",
+        re.IGNORECASE
+    )
+    reports = []
+    try:
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                if not pattern.match(entry.name):
+                    continue
+                try:
+                    reports.append((entry.stat().st_mtime, entry.name, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return []
+    return [path for mtime, name, path in sorted(reports)]
+
+
+def write_report(path, records, report_format=None):
+    """
+    Stream records to a JSON Lines or CSV file (atomic replace).
+
+    Args:
+        path: Report path
+        records: Iterable of record dicts (see make_record), consumed lazily
+        report_format: FORMAT_JSONL / FORMAT_CSV (default: from the extension)
+
+    Returns:
+        int: Number of records written
+    """
+    report_format = report_format or get_report_format(path) or FORMAT_JSONL
+    partial = path + ".part"
+    count = 0
+
+    try:
+        with open(partial, 'w', encoding='utf-8', newline='') as f:
+            if report_format == FORMAT_CSV:
+                writer = csv.DictWriter(f, fieldnames=RECORD_FIELDS, extrasaction='ignore')
+                writer.writeheader()
+                for record in records:
+                    row = dict(record)
+                    if isinstance(row.get('used_by'), (list, tuple)):
+                        row['used_by'] = CSV_LIST_SEPARATOR.join(row['used_by'])
+                    writer.writerow(row)
+                    count += 1
+            else:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+                    f.write("\n")
+                    count += 1
+        os.replace(partial, path)
+    except BaseException:
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+
+    return count
+
+
+def _from_csv_row(row):
+    record = dict.fromkeys(RECORD_FIELDS)
+    for field in RECORD_FIELDS:
+        value = row.get(field)
+        if value is None or value == "":
+            continue
+        if field in INT_FIELDS:
+            try:
+                value = int(value)
+            except ValueError:
+                continue
+        elif field == 'used_by':
+            value = value.split(CSV_LIST_SEPARATOR)
+        record[field] = value
+    return record
+
+
+def read_report(path):
+    """
+    Read the records of a report (generator).
+
+    Raises:
+        OSError: File cannot be read
+        ValueError: Unknown format or malformed line
+    """
+    report_format = get_report_format(path)
+    if report_format is None:
+        raise ValueError(f"Not a scene report: {os.path.basename(path)}")
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if report_format == FORMAT_CSV:
+            for row in csv.DictReader(f):
+                yield _from_csv_row(row)
+        else:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{os.path.basename(path)} line {line_number}: {e}")
+                if isinstance(record, dict):
+                    yield record
+
+
+def summarize_report(records):
+    """
+    Totals of a report, the input of diff_reports.
+
+    Returns:
+        dict: scene (header record or None), counts {kind: n},
+            bytes {label: n}, missing, orphans {type: n},
+            textures {(library, name): record}
+    """
+    summary = {
+        'scene': None,
+        'counts': dict.fromkeys(RECORD_KINDS, 0),
+        'bytes': {label: 0 for label, kind, field in BYTE_TOTALS},
+        'missing': 0,
+        'orphans': defaultdict(int),
+        'textures': {},
+    }
+
+    for record in records:
+        kind = record.get('kind')
+        if kind == KIND_SCENE:
+            summary['scene'] = record
+            continue
+        if kind not in summary['counts']:
+            continue
+
+        summary['counts'][kind] += 1
+        for label, total_kind, field in BYTE_TOTALS:
+            if kind == total_kind:
+                summary['bytes'][label] += record.get(field) or 0
+
+        if kind == KIND_TEXTURE:
+            summary['textures'][(record.get('library') or "", record.get('name'))] = record
+            if record.get('status') == STATUS_MISSING:
+                summary['missing'] += 1
+        elif kind == KIND_ORPHAN:
+            summary['orphans'][record.get('type') or "Other"] += 1
+
+    summary['orphans'] = dict(summary['orphans'])
+    return summary
+
+
+def diff_reports(before_records, after_records):
+    """
+    Compare two reports.
+
+    Args:
+        before_records, after_records: Iterables of records (see read_report)
+
+    Returns:
+        dict:
+            before, after: scene header records (or None)
+            counts: [(label, before, after), ...]
+            bytes: [(label, before, after), ...]
+            orphans: [(type, before, after), ...]
+            added, removed: [texture record, ...]
+            changed: [(before record, after record), ...] - size or bytes changed
+    """
+    before = summarize_report(before_records)
+    after = summarize_report(after_records)
+
+    counts = [
+        (COUNT_LABELS[kind], before['counts'][kind], after['counts'][kind])
+        for kind in RECORD_KINDS
+    ]
+    counts.append(("Missing textures", before['missing'], after['missing']))
+
+    byte_totals = [
+        (label, before['bytes'][label], after['bytes'][label])
+        for label, kind, field in BYTE_TOTALS
+    ]
+
+    orphan_types = sorted(set(before['orphans']) | set(after['orphans']))
+    orphans = [
+        (orphan_type, before['orphans'].get(orphan_type, 0), after['orphans'].get(orphan_type, 0))
+        for orphan_type in orphan_types
+    ]
+
+    before_textures = before['textures']
+    after_textures = after['textures']
+    added = [after_textures[key] for key in sorted(set(after_textures) - set(before_textures))]
+    removed = [before_textures[key] for key in sorted(set(before_textures) - set(after_textures))]
+
+    changed = []
+    for key in sorted(set(before_textures) & set(after_textures)):
+        old = before_textures[key]
+        new = after_textures[key]
+        if any(old.get(field) != new.get(field)
+               for field in ('width', 'height', 'file_bytes', 'gpu_bytes', 'status', 'path')):
+            changed.append((old, new))
+
+    return {
+        'before': before['scene'],
+        'after': after['scene'],
+        'counts': counts,
+        'bytes': byte_totals,
+        'orphans': orphans,
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+    }
+
+
+def _format_delta(before, after, as_bytes=False):
+    delta = after - before
+    if as_bytes:
+        text = f"{format_bytes(before)} → {format_bytes(after)}"
+        delta_text = ("+" if delta > 0 else "") + format_bytes(delta)
+    else:
+        text = f"{before} → {after}"
+        delta_text = f"{delta:+d}"
+    if delta == 0:
+        return text
+    if before:
+        return f"{text} ({delta_text}, {delta / before:+.1%})"
+    return f"{text} ({delta_text})"
+
+
+def _format_texture_size(record):
+    if record.get('width') and record.get('height'):
+        return f"{record['width']}x{record['height']}"
+    return "Unknown"
+
+
+def format_diff(diff, before_name="before", after_name="after"):
+    """Plain-text report of diff_reports() output"""
+    lines = []
+    lines.append("SCENE ANALYSIS DIFF")
+    lines.append(f"Before: {before_name}" + (f" ({diff['before']['generated']})" if diff['before'] else ""))
+    lines.append(f"After:  {after_name}" + (f" ({diff['after']['generated']})" if diff['after'] else ""))
+    lines.append("=" * 60)
+    lines.append("")
+
+    lines.append("📊 COUNTS:")
+    for label, before, after in diff['counts']:
+        lines.append(f"  • {label}: {_format_delta(before, after)}")
+    lines.append("")
+
+    lines.append("💾 TEXTURE BYTES:")
+    for label, before, after in diff['bytes']:
+        lines.append(f"  • {label}: {_format_delta(before, after, as_bytes=True)}")
+    lines.append("")
+
+    if diff['orphans']:
+        lines.append("🗑️  ORPHANS:")
+        for orphan_type, before, after in diff['orphans']:
+            lines.append(f"  • {orphan_type}: {_format_delta(before, after)}")
+        lines.append("")
+
+    if diff['changed']:
+        lines.append("-" * 60)
+        lines.append(f"[CHANGED TEXTURES] {len(diff['changed'])}")
+        ranked = sorted(
+            diff['changed'],
+            key=lambda pair: ((pair[1].get('gpu_bytes') or 0) - (pair[0].get('gpu_bytes') or 0), pair[1]['name'])
+        )
+        for old, new in ranked:
+            gpu_delta = (new.get('gpu_bytes') or 0) - (old.get('gpu_bytes') or 0)
+            file_delta = (new.get('file_bytes') or 0) - (old.get('file_bytes') or 0)
+            line = f"  • {new['name']}: {_format_texture_size(old)} → {_format_texture_size(new)}"
+            line += f" | GPU {'+' if gpu_delta > 0 else ''}{format_bytes(gpu_delta)}"
+            line += f" | File {'+' if file_delta > 0 else ''}{format_bytes(file_delta)}"
+            if old.get('status') != new.get('status'):
+                line += f" | {old.get('status')} → {new.get('status')}"
+            lines.append(line)
+        lines.append("")
+
+    for title, records in (("ADDED TEXTURES", diff['added']), ("REMOVED TEXTURES", diff['removed'])):
+        if not records:
+            continue
+        lines.append("-" * 60)
+        lines.append(f"[{title}] {len(records)}")
+        for record in records:
+            library = f" [{record['library']}]" if record.get('library') else ""
+            lines.append(
+                f"  • {record['name']}{library} ({_format_texture_size(record)}) "
+                f"GPU {format_bytes(record.get('gpu_bytes') or 0)}"
+            )
+        lines.append("")
+
+    lines.append("=" * 60)
+    return "\n".join(lines)
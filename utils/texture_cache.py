@@ -0,0 +1,274 @@
+"""
+Texture Cache Utility
+
+Persistent per-project texture metadata (.texture_cache.json), keyed by path
+and valid for one file version (size, mtime_ns).
+"""
+
+import json
+import os
+import threading
+
+from .file_compare import calculate_file_hash
+from .image_probe import ImageInfo, probe_image
+
+
+CACHE_FILENAME = ".texture_cache.json"
+CACHE_VERSION = 1
+
+INFO_FIELDS = ImageInfo._fields
+
+# {normcase cache path: TextureCache}
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache_path(blend_filepath):
+    """Cache file location for a project (None for unsaved files)"""
+    if not blend_filepath:
+        return None
+    blend_dir = os.path.dirname(blend_filepath)
+    textures_dir = os.path.join(blend_dir, "textures")
+    folder = textures_dir if os.path.isdir(textures_dir) else blend_dir
+    return os.path.join(folder, CACHE_FILENAME)
+
+
+def get_texture_cache(cache_path):
+    """Shared cache instance for cache_path (memory-only if cache_path is None)"""
+    key = os.path.normcase(os.path.abspath(cache_path)) if cache_path else None
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = TextureCache(cache_path)
+            _caches[key] = cache
+        return cache
+
+
+class TextureCache:
+    """Lazily computed texture metadata keyed by (path, size, mtime_ns)"""
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.root = os.path.dirname(cache_path) if cache_path else None
+        self._entries = {}
+        self._dirty = False
+        self._loaded_signature = None
+        self._lock = threading.RLock()
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.cache_path)
+        except (OSError, TypeError):
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _load(self):
+        """(Re)read the cache file if another session changed it"""
+        if not self.cache_path:
+            return
+        signature = self._file_signature()
+        if signature is None or signature == self._loaded_signature:
+            return
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Texture cache: could not read {self.cache_path}: {e}")
+            self._loaded_signature = signature
+            return
+
+        if data.get('version') != CACHE_VERSION:
+            self._loaded_signature = signature
+            return
+
+        for stored_path, entry in data.get('entries', {}).items():
+            path = self._from_stored(stored_path)
+            key = self._key(path)
+            # Entries touched in this session win over the file
+            if key not in self._entries:
+                entry['path'] = path
+                self._entries[key] = entry
+        self._loaded_signature = signature
+
+    def save(self):
+        """Write changed entries; entries of deleted files are dropped"""
+        with self._lock:
+            if not self.cache_path or not self._dirty:
+                return
+            self._load()
+
+            entries = {}
+            for key, entry in list(self._entries.items()):
+                path = entry.get('path')
+                if not path or not os.path.exists(path):
+                    del self._entries[key]
+                else:
+                    entries[self._to_stored(path)] = {k: v for k, v in entry.items() if k != 'path'}
+
+            temp_path = self.cache_path + ".tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': CACHE_VERSION, 'entries': entries}, f, separators=(',', ':'))
+                os.replace(temp_path, self.cache_path)
+            except OSError as e:
+                print(f"Texture cache: could not write {self.cache_path}: {e}")
+                return
+
+            self._dirty = False
+            self._loaded_signature = self._file_signature()
+
+    def _to_stored(self, path):
+        """Paths inside the project are stored relative so the cache moves with it"""
+        try:
+            rel_path = os.path.relpath(path, self.root)
+        except ValueError:
+            return path
+        if rel_path.startswith('..'):
+            return path
+        return rel_path.replace('\\', '/')
+
+    def _from_stored(self, stored_path):
+        if os.path.isabs(stored_path) or not self.root:
+            return stored_path
+        return os.path.normpath(os.path.join(self.root, stored_path))
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    # -------------------------------------------------------------------------
+    # Entries
+    # -------------------------------------------------------------------------
+
+    def _entry(self, path):
+        """Current entry for path, reset if the file changed (None if missing)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = self._key(path)
+        entry = self._entries.get(key)
+        if entry is None and self.cache_path:
+            self._load()
+            entry = self._entries.get(key)
+
+        if entry is None or entry.get('size') != stat.st_size or entry.get('mtime_ns') != stat.st_mtime_ns:
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            self._entries[key] = entry
+            self._dirty = True
+
+        entry['path'] = os.path.abspath(path)
+        return entry
+
+    def get_info(self, path):
+        """ImageInfo from the file header, or None"""
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if 'format' not in entry:
+                info = probe_image(path)
+                for field in INFO_FIELDS:
+                    entry[field] = getattr(info, field) if info else None
+                self._dirty = True
+            if entry['format'] is None:
+                return None
+            return ImageInfo(*(entry[field] for field in INFO_FIELDS))
+
+    def get_size(self, path):
+        """(width, height), or None"""
+        info = self.get_info(path)
+        if info is None:
+            return None
+        return info.width, info.height
+
+    def get_hash(self, path):
+        """MD5 of the file content, or None"""
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if entry.get('hash'):
+                return entry['hash']
+
+        # Hash outside the lock - other threads may use the cache meanwhile
+        file_hash = calculate_file_hash(path)
+
+        with self._lock:
+            entry = self._entry(path)
+            if entry is not None and file_hash:
+                entry['hash'] = file_hash
+                self._dirty = True
+        return file_hash
+
+    def get_pixel_flags(self, path, analyze):
+        """
+        (uniform, grayscale, opaque) of an image.
+
+        Args:
+            path: Image file path
+            analyze: Called with no arguments if the flags are not cached yet;
+                returns (uniform, grayscale, opaque) or None if the image cannot be read
+
+        Returns:
+            tuple: (uniform, grayscale, opaque), or None
+        """
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if 'opaque' in entry:
+                return entry['uniform'], entry['grayscale'], entry['opaque']
+
+        flags = analyze()
+        if flags is None:
+            return None
+        self.set_pixel_flags(path, *flags)
+        return flags
+
+    def set_pixel_flags(self, path, uniform, grayscale, opaque):
+        """Store flags computed by a caller that already has the pixels"""
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return
+            entry['uniform'] = bool(uniform)
+            entry['grayscale'] = bool(grayscale)
+            entry['opaque'] = bool(opaque)
+            self._dirty = True
+
+    def get_fingerprint(self, path, compute):
+        """
+        Perceptual fingerprint of an image (see image_fingerprint).
+
+        Args:
+            path: Image file path
+            compute: Called with no arguments if not cached yet; returns the
+                fingerprint dict or None if the image cannot be read
+
+        Returns:
+            dict: {'dhash', 'mean'}, or None
+        """
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if 'fingerprint' in entry:
+                return entry['fingerprint']
+
+        fingerprint = compute()
+        if fingerprint is None:
+            return None
+
+        with self._lock:
+            entry = self._entry(path)
+            if entry is not None:
+                entry['fingerprint'] = fingerprint
+                self._dirty = True
+        return fingerprint
@@ -0,0 +1,79 @@
+"""
+Texture LOD Utility
+
+Path rules for precomputed resolution variants (LOD pyramid).
+
+Variants live in a sidecar folder next to the source texture:
+
+    textures/wood_diff.png
+    textures/.lod/2K/wood_diff.png
+    textures/.lod/1K/wood_diff.png
+    textures/.lod/512/wood_diff.png
+
+Switching levels only relinks image paths, so the source file is never
+touched. The source of any variant is found from its path alone (two folders
+up), which keeps switching stateless across saves and reloads.
+"""
+
+import os
+
+
+LOD_FOLDER = ".lod"
+
+LEVEL_FULL = 'FULL'
+
+# Largest first - each level is built from the previous one
+LOD_LEVELS = (
+    ('2K', 2048),
+    ('1K', 1024),
+    ('512', 512),
+)
+
+LOD_SIZES = dict(LOD_LEVELS)
+
+
+def get_lod_path(source_path, level):
+    """Path of the variant of source_path for level"""
+    directory, filename = os.path.split(source_path)
+    return os.path.join(directory, LOD_FOLDER, level, filename)
+
+
+def split_lod_path(path):
+    """
+    Split a variant path into its source path and level.
+
+    Returns:
+        tuple: (source_path, level), or (path, LEVEL_FULL) if path is not a variant
+    """
+    level_dir, filename = os.path.split(path)
+    lod_dir, level = os.path.split(level_dir)
+    source_dir, folder = os.path.split(lod_dir)
+    if folder == LOD_FOLDER and level in LOD_SIZES:
+        return os.path.join(source_dir, filename), level
+    return path, LEVEL_FULL
+
+
+def is_lod_path(path):
+    return split_lod_path(path)[1] != LEVEL_FULL
+
+
+def get_pyramid_sizes(width, height):
+    """
+    Levels worth building for an image.
+
+    Levels at or above the source size are left out - switching to them keeps
+    the full resolution file.
+
+    Returns:
+        list: [(level, max_dimension), ...] largest first
+    """
+    max_dimension = max(width, height)
+    return [(level, size) for level, size in LOD_LEVELS if size < max_dimension]
+
+
+def is_variant_current(source_path, variant_path):
+    """True if variant exists and is not older than its source"""
+    try:
+        return os.path.getmtime(variant_path) >= os.path.getmtime(source_path)
+    except OSError:
+        return False
@@ -0,0 +1,88 @@
+"""
+Texture Memory Utility
+
+Estimates GPU and CPU memory of loaded images from header data only.
+"""
+
+from collections import namedtuple
+
+
+MIP_OVERHEAD = 4.0 / 3.0
+
+# Formats decoded into float buffers whatever their bit depth
+FLOAT_FORMATS = {'OPEN_EXR', 'OPEN_EXR_MULTILAYER', 'HDR'}
+
+TextureMemory = namedtuple('TextureMemory', 'gpu cpu')
+
+ZERO = TextureMemory(0, 0)
+
+
+def is_float_image(bit_depth, file_format=None):
+    """True if Blender loads the image into a float buffer"""
+    return file_format in FLOAT_FORMATS or (bit_depth or 8) > 8
+
+
+def estimate_image_memory(width, height, is_float=False, half_float=True, mipmaps=True, channels=4):
+    """
+    Estimated memory of one loaded image.
+
+    Args:
+        width, height: Image size in pixels
+        is_float: Image is decoded into a float buffer
+        half_float: Float images are uploaded as half float (Image.use_half_precision)
+        mipmaps: Count the GPU mip chain
+        channels: Channels stored in the file (None if unknown - counted as 4)
+
+    Returns:
+        TextureMemory: (gpu, cpu) in bytes
+    """
+    pixels = max(int(width), 0) * max(int(height), 0)
+    if pixels == 0:
+        return ZERO
+
+    gpu_channels = 1 if channels == 1 else 4
+    if is_float:
+        cpu = pixels * 4 * gpu_channels
+        gpu = pixels * (2 if half_float else 4) * gpu_channels
+    else:
+        cpu = pixels * 4
+        gpu = pixels * gpu_channels
+    if mipmaps:
+        gpu = int(gpu * MIP_OVERHEAD)
+    return TextureMemory(gpu, cpu)
+
+
+def sum_memory(memories):
+    """Add TextureMemory values"""
+    gpu = 0
+    cpu = 0
+    for memory in memories:
+        gpu += memory.gpu
+        cpu += memory.cpu
+    return TextureMemory(gpu, cpu)
+
+
+def rollup_memory(owner_images, image_memory):
+    """
+    Memory per owner, shared images counted once.
+
+    Args:
+        owner_images: {owner: iterable of image keys}
+        image_memory: {image key: TextureMemory}
+
+    Returns:
+        dict: {owner: TextureMemory}
+    """
+    return {
+        owner: sum_memory(image_memory.get(key, ZERO) for key in set(keys))
+        for owner, keys in owner_images.items()
+    }
+
+
+def top_consumers(totals, count=5):
+    """[(owner, TextureMemory), ...] sorted by GPU memory, largest first"""
+    ranked = sorted(
+        ((owner, memory) for owner, memory in totals.items() if memory.gpu > 0),
+        key=lambda item: (-item[1].gpu, -item[1].cpu, str(item[0]))
+    )
+    return ranked[:count]
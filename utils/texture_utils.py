@@ -4,7 +4,6 @@ Shared utilities for texture scanning and UDIM handling across operators.
 """
 
 import bpy
-import os
 import re
 
 
@@ -46,59 +45,284 @@ def get_used_textures(include_material_nodes=True, include_bpy_images=True):
     """
     Get set of all texture paths actually used in the blend file.
     
-    This function scans BOTH material shader nodes AND bpy.data.images to ensure
+    This function uses BOTH material shader nodes AND bpy.data.images to ensure
     UDIM textures are properly detected (they may not be in bpy.data.images if not loaded).
+    Both come from the shared scene index, so repeated calls do not rescan.
     
     Args:
-        include_material_nodes: Scan material shader nodes for Image Texture nodes
-        include_bpy_images: Scan bpy.data.images for loaded images
+        include_material_nodes: Include images of material Image Texture nodes
+        include_bpy_images: Include file images of bpy.data.images (linked ones skipped)
         
     Returns:
         set: Normalized absolute paths of all used textures (with UDIM placeholders)
     """
-    used_textures = set()
-    
-    if include_material_nodes:
-        # CRITICAL: Scan shader nodes first (includes UDIM references)
-        # UDIM textures are NOT in bpy.data.images if not loaded, but ARE in material nodes!
-        for mat in bpy.data.materials:
-            if not mat.use_nodes:
-                continue
-            for node in mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    img = node.image
-                    try:
-                        abs_path = bpy.path.abspath(img.filepath)
-                        norm_path = os.path.normpath(abs_path)
-                        
-                        # If already has <UDIM>, keep it as-is
-                        if '<UDIM>' not in norm_path:
-                            norm_path = normalize_udim(norm_path)
-                        
-                        used_textures.add(norm_path)
-                    except Exception:
-                        continue
-    
-    if include_bpy_images:
-        # Also scan bpy.data.images (for images not in materials)
-        for img in bpy.data.images:
-            if img.source != 'FILE':
-                continue
-            
-            # SKIP: Ignore external link images (library overrides)
-            if img.library:
-                continue
-            
-            try:
-                abs_path = bpy.path.abspath(img.filepath)
-                norm_path = os.path.normpath(abs_path)
-                
-                # If already has <UDIM>, keep it as-is
-                if '<UDIM>' not in norm_path:
-                    norm_path = normalize_udim(norm_path)
-                
-                used_textures.add(norm_path)
-            except Exception:
-                continue
-    
-    return used_textures
+    from .scene_index import get_scene_index
+    
+    return get_scene_index().get_used_texture_paths(
+        include_material_nodes=include_material_nodes,
+        include_file_images=include_bpy_images,
+    )
+
+
+def get_project_texture_cache():
+    """Persistent texture metadata cache of the current project"""
+    from .texture_cache import get_cache_path, get_texture_cache
+    return get_texture_cache(get_cache_path(bpy.data.filepath))
+
+
+def read_image_pixels(img):
+    """
+    Read image pixels into a NumPy array.
+    
+    Images that were not loaded before are freed again afterwards, so scans
+    over many textures do not keep every decoded buffer in memory.
+    
+    Returns:
+        float32 array [height, width, channels], or None if the image has no pixels
+    """
+    import numpy as np
+    
+    was_loaded = img.has_data
+    width, height = img.size
+    channels = img.channels
+    if width == 0 or height == 0 or channels == 0:
+        return None
+    
+    pixels = np.empty(width * height * channels, dtype=np.float32)
+    img.pixels.foreach_get(pixels)
+    
+    if not was_loaded:
+        img.buffers_free()
+    
+    return pixels.reshape(height, width, channels)
+
+
+def new_image_save_scene(name="__image_save"):
+    """
+    Temporary scene whose render settings write image files.
+    
+    Standard view keeps pixel values unchanged in save_render. Remove the
+    scene with bpy.data.scenes.remove() when done.
+    """
+    scene = bpy.data.scenes.new(name)
+    scene.view_settings.view_transform = 'Standard'
+    scene.view_settings.look = 'None'
+    scene.view_settings.exposure = 0.0
+    scene.view_settings.gamma = 1.0
+    return scene
+
+
+def save_resized_pixels(img, pixels, width, height, filepath, scene, bit_depth=None):
+    """
+    Save resampled pixels of img to filepath in img's file format.
+    
+    The pixels go into a new image of the target size, so img itself is
+    never rescaled or decoded again.
+    
+    Args:
+        img: Source bpy.types.Image (format, channels, color space)
+        pixels: float32 array [height, width, channels]
+        scene: Scene from new_image_save_scene()
+        bit_depth: Bits per channel of the source file (header probe), None if unknown
+    """
+    temp_img = bpy.data.images.new(
+        "__resized", width, height, alpha=img.channels == 4, float_buffer=img.is_float
+    )
+    try:
+        temp_img.colorspace_settings.name = img.colorspace_settings.name
+        temp_img.pixels.foreach_set(pixels.ravel())
+        
+        settings = scene.render.image_settings
+        settings.file_format = img.file_format
+        try:
+            settings.color_mode = {1: 'BW', 3: 'RGB'}.get(img.channels, 'RGBA')
+        except TypeError:
+            # Format without this mode (e.g. JPEG has no alpha)
+            settings.color_mode = 'RGB'
+        if img.file_format in ('PNG', 'TIFF'):
+            settings.color_depth = '16' if (bit_depth or 8) > 8 else '8'
+        elif img.file_format in ('OPEN_EXR', 'OPEN_EXR_MULTILAYER'):
+            settings.color_depth = '32' if (bit_depth or 16) > 16 else '16'
+        
+        temp_img.save_render(filepath, scene=scene)
+    finally:
+        bpy.data.images.remove(temp_img)
+
+
+def analyze_image_pixels(img, tolerance=1.0 / 255.0):
+    """
+    Detect uniform color, grayscale and opaque images from decoded pixels.
+    
+    Args:
+        img: bpy.types.Image (pixels are loaded if needed)
+        tolerance: Max channel difference still treated as equal
+        
+    Returns:
+        tuple: (uniform, grayscale, opaque), or None if the image has no pixels
+    """
+    pixels = read_image_pixels(img)
+    if pixels is None:
+        return None
+    return get_pixel_flags(pixels, tolerance)
+
+
+def get_pixel_flags(pixels, tolerance=1.0 / 255.0):
+    """
+    (uniform, grayscale, opaque) of a pixel array [height, width, channels].
+    
+    grayscale: R, G and B equal within tolerance for every pixel
+    opaque: no alpha channel, or alpha is 1.0 (within tolerance) everywhere
+    """
+    import numpy as np
+    
+    pixels = pixels.reshape(-1, pixels.shape[-1])
+    
+    uniform = bool(np.all(pixels.max(axis=0) - pixels.min(axis=0) <= tolerance))
+    if pixels.shape[1] >= 3:
+        rgb = pixels[:, :3]
+        grayscale = bool(np.all(rgb.max(axis=1) - rgb.min(axis=1) <= tolerance))
+    else:
+        grayscale = True
+    
+    if pixels.shape[1] in (2, 4):
+        opaque = bool(pixels[:, -1].min() >= 1.0 - tolerance)
+    else:
+        opaque = True
+    
+    return uniform, grayscale, opaque
+
+
+def compute_image_fingerprint(img):
+    """Perceptual fingerprint of an image (see image_fingerprint), or None"""
+    from .image_fingerprint import compute_fingerprint
+    
+    pixels = read_image_pixels(img)
+    if pixels is None:
+        return None
+    return compute_fingerprint(pixels)
+
+
+def get_image_resolution(img, cache=None):
+    """
+    Get (width, height) of an image without forcing a pixel load.
+    
+    Loaded images report img.size. Unloaded file images are read from the
+    texture cache (header probe, once per file version); img.size (full
+    decode) is only used if the probe fails.
+    
+    Args:
+        img: bpy.types.Image
+        cache: TextureCache to use (default: project cache)
+        
+    Returns:
+        tuple: (width, height), (0, 0) if unknown
+    """
+    if img.source == 'FILE' and not img.has_data and not img.packed_file and img.filepath_raw:
+        if cache is None:
+            cache = get_project_texture_cache()
+        abs_path = bpy.path.abspath(img.filepath_raw, library=img.library)
+        size = cache.get_size(abs_path)
+        if size is not None:
+            return size
+    
+    return tuple(img.size)
+
+
+def get_image_memory(img, cache=None):
+    """
+    Estimated GPU/CPU memory of an image (see texture_memory).
+    
+    File images are measured from their headers (every tile for UDIMs), so
+    nothing is decoded. Generated, packed and unreadable images fall back to
+    img.size.
+    
+    Returns:
+        TextureMemory: (gpu, cpu) in bytes
+    """
+    from .texture_memory import ZERO, estimate_image_memory, is_float_image, sum_memory
+    
+    half_float = img.use_half_precision
+    
+    if img.source == 'GENERATED':
+        width, height = img.generated_width, img.generated_height
+        return estimate_image_memory(width, height, img.use_generated_float, half_float)
+    
+    if img.source in ('FILE', 'TILED') and not img.packed_file and img.filepath_raw:
+        if cache is None:
+            cache = get_project_texture_cache()
+        abs_path = bpy.path.abspath(img.filepath_raw, library=img.library)
+        
+        if img.source == 'TILED':
+            paths = [abs_path.replace('<UDIM>', str(tile.number)) for tile in img.tiles]
+        else:
+            paths = [abs_path]
+        
+        infos = [cache.get_info(path) for path in paths]
+        if infos and all(info is not None for info in infos):
+            return sum_memory(
+                estimate_image_memory(
+                    info.width, info.height, is_float_image(info.bit_depth, info.format), half_float,
+                    channels=info.channels
+                )
+                for info in infos
+            )
+    
+    if img.source not in ('FILE', 'TILED', 'GENERATED'):
+        return ZERO
+    
+    width, height = img.size
+    return estimate_image_memory(width, height, img.is_float, half_float)
+
+
+def collect_texture_memory(cache=None):
+    """
+    Texture memory of the file rolled up per material, object and collection.
+    
+    Each image is counted once per owner and once in the total, however
+    many materials or objects share it.
+    
+    Returns:
+        dict: {'images', 'materials', 'objects', 'collections': {name: TextureMemory},
+               'total': TextureMemory}
+    """
+    from .scene_index import get_scene_index
+    from .texture_memory import rollup_memory, sum_memory
+    
+    index = get_scene_index()
+    if cache is None:
+        cache = get_project_texture_cache()
+    
+    image_memory = {}
+    for img in bpy.data.images:
+        if img.name in ('Render Result', 'Viewer Node'):
+            continue
+        # Orphans are dropped on save and never shipped
+        if img.users == 0:
+            continue
+        image_memory[img.name_full] = get_image_memory(img, cache)
+    
+    material_images = {name: images for name, images in index.material_images.items() if images}
+    
+    object_images = {}
+    for obj_name, materials in index.object_materials.items():
+        keys = set()
+        for mat_name in materials:
+            keys.update(material_images.get(mat_name, ()))
+        if keys:
+            object_images[obj_name] = keys
+    
+    collection_images = {}
+    for collection in bpy.data.collections:
+        keys = set()
+        for obj in collection.all_objects:
+            keys.update(object_images.get(obj.name_full, ()))
+        if keys:
+            collection_images[collection.name_full] = keys
+    
+    return {
+        'images': image_memory,
+        'materials': rollup_memory(material_images, image_memory),
+        'objects': rollup_memory(object_images, image_memory),
+        'collections': rollup_memory(collection_images, image_memory),
+        'total': sum_memory(image_memory.values()),
+    }
@@ -0,0 +1,155 @@
+"""
+Version Allocator Utility
+
+Find and claim the next _vNNN number for publish and versioning.
+
+- Highest version is found with ONE directory scan (not one exists() per number)
+- peek_next_version() caches the result per folder until the folder changes,
+  so it is cheap enough for panel draw()
+- allocate_version() claims the number with an exclusive-create reservation
+  marker (.house_v004.blend.reserved), so two artists publishing at the same
+  moment never get the same number; markers left by a crashed publish
+  expire after STALE_RESERVATION_SECONDS
+"""
+
+import getpass
+import os
+import re
+import time
+
+
+RESERVATION_SUFFIX = ".reserved"
+STALE_RESERVATION_SECONDS = 24 * 60 * 60
+
+# {(folder, name, ext): (folder_mtime_ns, highest_version)}
+_scan_cache = {}
+
+
+def get_version_name(name, version, ext=""):
+    """house, 3, .blend -> house_v003.blend"""
+    return f"{name}_v{version:03d}{ext}"
+
+
+def _version_pattern(name, ext):
+    """Match 'name_vNNN<ext>' and its reservation marker '.name_vNNN<ext>.reserved'"""
+    return re.compile(
+        rf"^\.?{re.escape(name)}_v(\d{{3,}}){re.escape(ext)}(?:{re.escape(RESERVATION_SUFFIX)})?$",
+        re.IGNORECASE
+    )
+
+
+def scan_highest_version(folder, name, ext="", remove_stale=False):
+    """
+    Get highest existing (or reserved) version number with a single scandir.
+
+    Reservation markers older than STALE_RESERVATION_SECONDS are ignored.
+
+    Args:
+        folder: Folder holding the versions
+        name: Base name without version suffix (e.g. 'house')
+        ext: Extension including dot (e.g. '.blend'), '' for version folders
+        remove_stale: Also delete the stale markers (publishers only, not UI previews)
+
+    Returns:
+        int: Highest version number, 0 if none exist
+    """
+    pattern = _version_pattern(name, ext)
+    highest = 0
+    now = time.time()
+
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if not match:
+                    continue
+                if entry.name.endswith(RESERVATION_SUFFIX):
+                    try:
+                        stale = now - entry.stat().st_mtime > STALE_RESERVATION_SECONDS
+                    except OSError:
+                        continue
+                    if stale:
+                        if remove_stale:
+                            release_version(entry.path)
+                        continue
+                highest = max(highest, int(match.group(1)))
+    except OSError:
+        return 0
+
+    return highest
+
+
+def peek_next_version(folder, name, ext=""):
+    """
+    Get the next free version number without claiming it (for UI previews).
+
+    Cached per folder and invalidated when the folder's mtime changes, so
+    repeated calls from draw() cost one stat.
+    """
+    try:
+        folder_mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return 1
+
+    key = (os.path.normpath(folder), name, ext)
+    cached = _scan_cache.get(key)
+    if cached and cached[0] == folder_mtime:
+        return cached[1] + 1
+
+    highest = scan_highest_version(folder, name, ext)
+    _scan_cache[key] = (folder_mtime, highest)
+    return highest + 1
+
+
+def allocate_version(folder, name, ext=""):
+    """
+    Claim the next version number atomically.
+
+    The claim is an O_CREAT | O_EXCL reservation marker next to the target.
+    Call release_version() once the target has been written (or on failure).
+
+    Returns:
+        tuple: (version_number, target_path, reservation_path)
+    """
+    os.makedirs(folder, exist_ok=True)
+    version = scan_highest_version(folder, name, ext, remove_stale=True) + 1
+
+    while True:
+        version_name = get_version_name(name, version, ext)
+        target_path = os.path.join(folder, version_name)
+        reservation_path = os.path.join(folder, f".{version_name}{RESERVATION_SUFFIX}")
+
+        if os.path.exists(target_path):
+            version += 1
+            continue
+
+        try:
+            fd = os.open(reservation_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            version += 1
+            continue
+
+        try:
+            owner = f"{getpass.getuser()} pid={os.getpid()} {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            os.write(fd, owner.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+        # Another publisher may have finished this number between scan and claim
+        if os.path.exists(target_path):
+            release_version(reservation_path)
+            version += 1
+            continue
+
+        _scan_cache.pop((os.path.normpath(folder), name, ext), None)
+        return version, target_path, reservation_path
+
+
+def release_version(reservation_path):
+    """Remove a reservation marker created by allocate_version()"""
+    if not reservation_path:
+        return
+    try:
+        os.remove(reservation_path)
+    except OSError:
+        pass